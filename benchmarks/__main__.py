@@ -0,0 +1,83 @@
+"""
+Benchmarks the field and template interactors.
+
+    python -m benchmarks --operations 1000 --output results.json
+    python -m benchmarks --baseline results.json
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+from benchmarks.harness import run_operations, save_results, \
+    compare_results, format_results
+
+BACKENDS = ("memory", "sqlite")
+
+
+def main(argv: list[str] | None = None) -> int:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "clickupclone.settings")
+
+    from benchmarks.backends import build_memory_storages, \
+        build_sqlite_storages, setup_sqlite_database
+    from benchmarks.scenarios import SCENARIOS, Scenario
+    from task_management.storages.storage_tracer import StorageTracer
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--backend", choices=BACKENDS, action="append",
+                        help="storage backend to run; repeatable "
+                             "(default: all)")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS),
+                        action="append",
+                        help="scenario to run; repeatable (default: all)")
+    parser.add_argument("--operations", type=int, default=1000)
+    parser.add_argument("--sqlite-path",
+                        help="SQLite file to benchmark against "
+                             "(default: a new temporary file)")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline",
+                        help="JSON results of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="allowed throughput drop against the baseline")
+    args = parser.parse_args(argv)
+
+    builders = {"memory": build_memory_storages,
+                "sqlite": build_sqlite_storages}
+    tracer = StorageTracer(log_level=None)
+    results = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for backend in args.backend or BACKENDS:
+            if backend == "sqlite":
+                setup_sqlite_database(
+                    path=args.sqlite_path or
+                    os.path.join(temp_dir, "benchmark.sqlite3"))
+
+            for scenario_name in args.scenario or sorted(SCENARIOS):
+                scenario = Scenario(storages=builders[backend](),
+                                    tracer=tracer)
+                operations = SCENARIOS[scenario_name](
+                    scenario=scenario, operations=args.operations)
+                results.append(run_operations(
+                    backend=backend, scenario=scenario_name,
+                    operations=operations, tracer=tracer))
+
+    print(format_results(results))
+
+    if args.output:
+        save_results(results=results, path=args.output)
+
+    if args.baseline:
+        regressions = compare_results(results=results,
+                                      baseline_path=args.baseline,
+                                      tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import uuid
+from dataclasses import dataclass
+
+from task_management.interactors.dtos import UserDTO, PermissionsEnum
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+
+
+@dataclass
+class BenchmarkStorages:
+    user_storage: object
+    permission_storage: object
+    template_storage: object
+    field_storage: object
+    user_id: str
+
+
+def build_memory_storages() -> BenchmarkStorages:
+    database = InMemoryDatabase()
+    user_id = str(uuid.uuid4())
+    database.add_user(
+        UserDTO(user_id=user_id, full_name="Benchmark User",
+                email="benchmark@example.com"),
+        permissions={"List": PermissionsEnum.MEMBER})
+
+    return BenchmarkStorages(
+        user_storage=InMemoryUserStorage(database=database),
+        permission_storage=InMemoryPermissionStorage(database=database),
+        template_storage=InMemoryTemplateStorage(database=database),
+        field_storage=InMemoryFieldStorage(database=database),
+        user_id=user_id
+    )
+
+
+def setup_sqlite_database(path: str):
+    """
+    Points the default SQLite connection at ``path`` and migrates it, so
+    benchmark rows never land in the development ``db.sqlite3``.
+    """
+    import django
+    from django.core.management import call_command
+    from django.db import connections
+
+    django.setup()
+    connection = connections["default"]
+    connection.close()
+    connection.settings_dict["NAME"] = path
+    call_command("migrate", verbosity=0, interactive=False)
+
+
+def build_sqlite_storages() -> BenchmarkStorages:
+    from task_management.models import User, UserPermission, PermissionScope
+    from task_management.storages.field_storage import FieldStorage
+    from task_management.storages.permission_storage import PermissionStorage
+    from task_management.storages.template_storage import TemplateStorage
+    from task_management.storages.user_storage import UserStorage
+
+    user = User.objects.create(full_name="Benchmark User",
+                               email=f"benchmark-{uuid.uuid4()}@example.com")
+    UserPermission.objects.create(user=user, scope=PermissionScope.LIST,
+                                  permission=PermissionsEnum.MEMBER.value)
+
+    return BenchmarkStorages(
+        user_storage=UserStorage(),
+        permission_storage=PermissionStorage(),
+        template_storage=TemplateStorage(),
+        field_storage=FieldStorage(),
+        user_id=str(user.user_id)
+    )
@@ -0,0 +1,131 @@
+import json
+import platform
+import statistics
+import time
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+
+from task_management.storages.storage_tracer import StorageTracer
+
+
+@dataclass
+class BenchmarkResult:
+    backend: str
+    scenario: str
+    operations: int
+    total_seconds: float
+    ops_per_sec: float
+    latency_ms: dict
+    storage_calls_per_op: float
+    storage_calls: dict = field(default_factory=dict)
+
+
+def run_operations(backend: str, scenario: str, operations: list,
+                   tracer: StorageTracer) -> BenchmarkResult:
+    """
+    Times each operation separately and counts the storage calls they make
+    through the storages wrapped by ``tracer``, keyed by
+    ``<storage>.<method>``. Preparing the operations is not part of the
+    measurement.
+    """
+    latencies = []
+    perf_counter = time.perf_counter
+
+    with tracer.track() as track:
+        started_at = perf_counter()
+        for operation in operations:
+            operation_started_at = perf_counter()
+            operation()
+            latencies.append(perf_counter() - operation_started_at)
+        total_seconds = perf_counter() - started_at
+
+    count = len(operations)
+    storage_calls = Counter(f"{record.storage}.{record.method}"
+                            for record in track.records)
+    total_calls = sum(storage_calls.values())
+
+    return BenchmarkResult(
+        backend=backend,
+        scenario=scenario,
+        operations=count,
+        total_seconds=total_seconds,
+        ops_per_sec=count / total_seconds if total_seconds else 0.0,
+        latency_ms=get_latency_percentiles(latencies),
+        storage_calls_per_op=total_calls / count if count else 0.0,
+        storage_calls={key: calls / count
+                       for key, calls in sorted(storage_calls.items())}
+    )
+
+
+def get_latency_percentiles(latencies: list[float]) -> dict:
+    if not latencies:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0}
+    if len(latencies) == 1:
+        latencies = latencies * 2
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return {
+        "p50": percentiles[49] * 1000,
+        "p95": percentiles[94] * 1000,
+        "p99": percentiles[98] * 1000,
+        "mean": statistics.fmean(latencies) * 1000,
+    }
+
+
+def save_results(results: list[BenchmarkResult], path: str):
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+
+    with open(path, "w") as output:
+        json.dump(report, output, indent=2)
+
+
+def compare_results(results: list[BenchmarkResult], baseline_path: str,
+                    tolerance: float) -> list[str]:
+    """
+    Returns a line for every scenario whose throughput fell by more than
+    ``tolerance`` or whose storage calls per operation grew since the
+    baseline run.
+    """
+    with open(baseline_path) as baseline_file:
+        baseline = {(result["backend"], result["scenario"]): result
+                    for result in json.load(baseline_file)["results"]}
+
+    regressions = []
+    for result in results:
+        previous = baseline.get((result.backend, result.scenario))
+        if previous is None:
+            continue
+
+        if result.ops_per_sec < previous["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{result.backend}/{result.scenario}: "
+                f"{previous['ops_per_sec']:.0f} -> {result.ops_per_sec:.0f} "
+                f"ops/sec")
+        if result.storage_calls_per_op > previous["storage_calls_per_op"]:
+            regressions.append(
+                f"{result.backend}/{result.scenario}: "
+                f"{previous['storage_calls_per_op']:.2f} -> "
+                f"{result.storage_calls_per_op:.2f} storage calls/op")
+
+    return regressions
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    lines = [f"{'backend':<8} {'scenario':<16} {'ops':>7} {'ops/sec':>10} "
+             f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'calls/op':>9}"]
+    for result in results:
+        latency = result.latency_ms
+        lines.append(
+            f"{result.backend:<8} {result.scenario:<16} "
+            f"{result.operations:>7} {result.ops_per_sec:>10.1f} "
+            f"{latency['p50']:>8.3f} {latency['p95']:>8.3f} "
+            f"{latency['p99']:>8.3f} {result.storage_calls_per_op:>9.2f}")
+
+    return "\n".join(lines)
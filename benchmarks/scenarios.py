@@ -0,0 +1,116 @@
+import uuid
+from functools import partial
+
+from benchmarks.backends import BenchmarkStorages
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, UpdateFieldDTO, FieldTypeEnum
+from task_management.interactors.field_interactors.create_field_interactor import \
+    CreateFieldInteractor
+from task_management.interactors.field_interactors.update_field_interactor import \
+    UpdateFieldInteractor
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.storages.storage_tracer import StorageTracer
+
+FIELDS_PER_TEMPLATE = 20
+
+
+class Scenario:
+    """
+    Builds interactors over traced storages and prepares the operations
+    of one benchmark run. Setup writes go through the same interactors but
+    are not measured.
+    """
+
+    def __init__(self, storages: BenchmarkStorages,
+                 tracer: StorageTracer):
+        self.user_id = storages.user_id
+        self.user_storage = tracer.wrap(storages.user_storage, name="user")
+        self.permission_storage = tracer.wrap(storages.permission_storage,
+                                              name="permission")
+        self.template_storage = tracer.wrap(storages.template_storage,
+                                            name="template")
+        self.field_storage = tracer.wrap(storages.field_storage,
+                                         name="field")
+        self.run_id = uuid.uuid4().hex[:8]
+
+    def get_create_template_interactor(self) -> CreateTemplateInteractor:
+        return CreateTemplateInteractor(
+            user_storage=self.user_storage,
+            field_storage=self.field_storage,
+            permission_storage=self.permission_storage,
+            template_storage=self.template_storage)
+
+    def get_create_field_interactor(self) -> CreateFieldInteractor:
+        return CreateFieldInteractor(
+            field_storage=self.field_storage,
+            user_storage=self.user_storage,
+            template_storage=self.template_storage,
+            permission_storage=self.permission_storage)
+
+    def get_update_field_interactor(self) -> UpdateFieldInteractor:
+        return UpdateFieldInteractor(
+            user_storage=self.user_storage,
+            field_storage=self.field_storage,
+            permission_storage=self.permission_storage,
+            template_storage=self.template_storage)
+
+    def get_template_data(self, name: str) -> CreateTemplateDTO:
+        return CreateTemplateDTO(name=f"{self.run_id} {name}",
+                                 description="", is_default=False,
+                                 created_by=self.user_id)
+
+    def get_field_data(self, template_id: str, name: str) -> CreateFieldDTO:
+        return CreateFieldDTO(field_type=FieldTypeEnum.Text, field_name=name,
+                              description="", template_id=template_id,
+                              order=None, config={"max_length": 255},
+                              is_required=False, created_by=self.user_id)
+
+    def create_templates(self, count: int) -> list[str]:
+        interactor = self.get_create_template_interactor()
+
+        return [interactor.create_template(
+                    self.get_template_data(name=f"Setup {position}"))
+                .template_id
+                for position in range(count)]
+
+
+def create_template_operations(scenario: Scenario, operations: int) -> list:
+    interactor = scenario.get_create_template_interactor()
+
+    return [partial(interactor.create_template,
+                    scenario.get_template_data(name=f"Template {position}"))
+            for position in range(operations)]
+
+
+def create_field_operations(scenario: Scenario, operations: int) -> list:
+    template_ids = scenario.create_templates(
+        count=-(-operations // FIELDS_PER_TEMPLATE))
+    interactor = scenario.get_create_field_interactor()
+
+    return [partial(interactor.create_field,
+                    scenario.get_field_data(
+                        template_id=template_ids[position % len(template_ids)],
+                        name=f"Field {position}"))
+            for position in range(operations)]
+
+
+def update_field_operations(scenario: Scenario, operations: int) -> list:
+    fields = [operation() for operation in
+              create_field_operations(scenario=scenario, operations=operations)]
+    interactor = scenario.get_update_field_interactor()
+
+    return [partial(interactor.update_field, UpdateFieldDTO(
+                field_id=field.field_id, field_type=field.field_type,
+                description="Updated", template_id=field.template_id,
+                field_name=f"{field.field_name} renamed", order=field.order,
+                config=field.config, is_required=field.is_required,
+                created_by=field.created_by, version=field.version))
+            for field in fields]
+
+
+SCENARIOS = {
+    "create_template": create_template_operations,
+    "create_field": create_field_operations,
+    "update_field": update_field_operations,
+}
@@ -37,6 +37,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "graphene_django",
+    "task_management",
 ]
 
 MIDDLEWARE = [
@@ -52,6 +54,11 @@ MIDDLEWARE = [
 
 # NEW
 ROOT_URLCONF = 'clickupclone.urls'
+
+GRAPHENE = {
+    "SCHEMA": "task_management.schema.schema.schema",
+}
+
 WSGI_APPLICATION = 'clickupclone.wsgi.application'
 ASGI_APPLICATION = 'clickupclone.asgi.application'
 
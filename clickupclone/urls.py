@@ -18,6 +18,15 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 
+from task_management.schema.views import graphql_view
+from task_management.views import export_templates_view, \
+    import_templates_view, changes_view, search_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("graphql/", graphql_view),
+    path("templates/export/", export_templates_view),
+    path("templates/import/", import_templates_view),
+    path("changes/", changes_view),
+    path("search/", search_view),
 ]
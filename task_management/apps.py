@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class TaskManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_management"
+
+    def ready(self):
+        from task_management.storages.search_storage import \
+            create_search_triggers
+
+        post_migrate.connect(create_search_triggers, sender=self)
@@ -0,0 +1,183 @@
+import inspect
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Callable
+
+from task_management.interactors.request_scoped_cache import \
+    RequestScopedCache
+
+
+def build_user_storage():
+    from task_management.storages.user_storage import UserStorage
+
+    return UserStorage()
+
+
+def build_permission_storage():
+    from task_management.interactors.permission_resolver import \
+        PermissionResolver
+    from task_management.storages.permission_storage import PermissionStorage
+
+    return PermissionResolver(permission_storage=PermissionStorage())
+
+
+def build_template_storage():
+    from task_management.storages.template_storage import TemplateStorage
+
+    return TemplateStorage()
+
+
+def build_field_storage():
+    from task_management.storages.field_storage import FieldStorage
+
+    return FieldStorage()
+
+
+def build_change_feed_storage():
+    from task_management.storages.change_feed_storage import \
+        ChangeFeedStorage
+
+    return ChangeFeedStorage()
+
+
+def build_search_storage():
+    from task_management.storages.search_storage import SearchStorage
+
+    return SearchStorage()
+
+
+DJANGO_STORAGE_FACTORIES = {
+    "user_storage": build_user_storage,
+    "permission_storage": build_permission_storage,
+    "template_storage": build_template_storage,
+    "field_storage": build_field_storage,
+    "change_feed_storage": build_change_feed_storage,
+    "search_storage": build_search_storage,
+}
+
+
+class StorageGraph:
+    __slots__ = ("storage_factories", "storages", "interactors")
+
+    def __init__(self, storage_factories: dict[str, Callable]):
+        self.storage_factories = dict(storage_factories)
+        self.storages = {}
+        self.interactors = {}
+
+
+class Container:
+    """
+    Builds storages and interactors on first use and keeps one of each per
+    process. Storage modules are only imported when a storage is first
+    built, so importing the container is cheap.
+
+    ``swap`` replaces the whole graph at once, e.g. with in-memory or
+    traced storages; ``request_scope`` hands out interactors bound to
+    request-cached user and permission storages.
+    """
+
+    def __init__(self, storage_factories: dict[str, Callable] | None = None):
+        self._graph = StorageGraph(
+            storage_factories=storage_factories or DJANGO_STORAGE_FACTORIES)
+        self._lock = threading.RLock()
+
+    def get_storage(self, name: str):
+        return self._get_storage(graph=self._graph, name=name)
+
+    def _get_storage(self, graph: StorageGraph, name: str):
+        storage = graph.storages.get(name)
+        if storage is None:
+            with self._lock:
+                storage = graph.storages.get(name)
+                if storage is None:
+                    storage = graph.storage_factories[name]()
+                    graph.storages[name] = storage
+
+        return storage
+
+    def get_interactor(self, interactor_class: type):
+        graph = self._graph
+        interactor = graph.interactors.get(interactor_class)
+        if interactor is None:
+            interactor = self.build_interactor(
+                interactor_class=interactor_class,
+                get_storage=partial(self._get_storage, graph))
+            interactor = graph.interactors.setdefault(interactor_class,
+                                                      interactor)
+
+        return interactor
+
+    @staticmethod
+    def build_interactor(interactor_class: type,
+                         get_storage: Callable[[str], object]):
+        return interactor_class(**{
+            name: get_storage(name)
+            for name in get_storage_parameters(interactor_class)
+        })
+
+    def request_scope(self) -> "RequestScope":
+        return RequestScope(container=self)
+
+    def swap(self, storage_factories: dict[str, Callable]) -> StorageGraph:
+        """
+        Replaces every storage and interactor with ones built from
+        ``storage_factories`` and returns the previous graph.
+        """
+        with self._lock:
+            previous_graph = self._graph
+            self._graph = StorageGraph(storage_factories=storage_factories)
+
+        return previous_graph
+
+    @contextmanager
+    def override(self, storage_factories: dict[str, Callable]):
+        previous_graph = self.swap(storage_factories=storage_factories)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._graph = previous_graph
+
+
+class RequestScope(RequestScopedCache):
+    """
+    Request-bound view of a container. User and permission lookups are
+    cached for the scope; every other storage is the process-wide one.
+    Interactors are built on first use within the scope.
+    """
+
+    def __init__(self, container: Container):
+        super().__init__(
+            user_storage=container.get_storage("user_storage"),
+            permission_storage=container.get_storage("permission_storage"))
+        self.container = container
+        self._interactors = {}
+
+    def get_storage(self, name: str):
+        if name == "user_storage":
+            return self.user_storage
+        if name == "permission_storage":
+            return self.permission_storage
+
+        return self.container.get_storage(name)
+
+    def get_interactor(self, interactor_class: type):
+        interactor = self._interactors.get(interactor_class)
+        if interactor is None:
+            interactor = self.container.build_interactor(
+                interactor_class=interactor_class,
+                get_storage=self.get_storage)
+            self._interactors[interactor_class] = interactor
+
+        return interactor
+
+
+@lru_cache(maxsize=None)
+def get_storage_parameters(interactor_class: type) -> tuple[str, ...]:
+    return tuple(name for name in
+                 inspect.signature(interactor_class.__init__).parameters
+                 if name.endswith("_storage"))
+
+
+container = Container()
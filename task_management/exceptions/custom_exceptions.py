@@ -30,6 +30,20 @@ class FieldNotFoundException(Exception):
         self.field_id = field_id
 
 
+class FieldVersionConflictException(Exception):
+    def __init__(self, field_id: str, version: int):
+        self.field_id = field_id
+        self.version = version
+
+
+class InvalidFieldsReorderException(Exception):
+    def __init__(self, template_id: str, missing_field_ids: list[str],
+                 unknown_field_ids: list[str]):
+        self.template_id = template_id
+        self.missing_field_ids = missing_field_ids
+        self.unknown_field_ids = unknown_field_ids
+
+
 class InvalidFieldConfigException(Exception):
     def __init__(
         self,
@@ -81,4 +95,56 @@ class AlreadyExistedTemplateNameException(Exception):
 
 class DefaultTemplateAlreadyExistedException(Exception):
     def __init__(self, template_name: str):
-        self.template_name = template_name
\ No newline at end of file
+        self.template_name = template_name
+
+class InvalidTemplateImportLineException(Exception):
+    def __init__(self, line_number: int, code: str, details: dict | None = None):
+        self.line_number = line_number
+        self.code = code
+        self.details = details or {}
+        self.message = f"Line {line_number}: {code}"
+
+        super().__init__(self.message)
+
+
+class DuplicateIdempotencyKeyException(Exception):
+    def __init__(self, idempotency_key: str):
+        self.idempotency_key = idempotency_key
+
+
+class IdempotencyKeyMismatchException(Exception):
+    def __init__(self, idempotency_key: str):
+        self.idempotency_key = idempotency_key
+
+
+class DropdownOptionAlreadyExistsException(Exception):
+    def __init__(self, label: str):
+        self.label = label
+
+
+class DropdownOptionNotFoundException(Exception):
+    def __init__(self, option_id: str):
+        self.option_id = option_id
+
+
+class ValidationErrorsException(Exception):
+    def __init__(self, errors: list[dict]):
+        self.errors = errors
+        self.message = f"{len(errors)} validation errors"
+
+        super().__init__(self.message)
+
+
+class TemplateImportErrorsException(ValidationErrorsException):
+    """
+    Collected import errors, with what was committed before the first
+    failing chunk so that a client resubmits only the lines after
+    ``last_committed_line``.
+    """
+
+    def __init__(self, errors: list[dict], templates_count: int,
+                 fields_count: int, last_committed_line: int):
+        super().__init__(errors=errors)
+        self.templates_count = templates_count
+        self.fields_count = fields_count
+        self.last_committed_line = last_committed_line
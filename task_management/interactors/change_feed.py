@@ -0,0 +1,27 @@
+from task_management.interactors.dtos import TemplateDTO, FieldDTO
+
+
+def get_template_change_data(template: TemplateDTO) -> dict:
+    return {
+        "name": template.name,
+        "description": template.description,
+        "is_default": template.is_default,
+        "created_by": template.created_by,
+    }
+
+
+def get_field_change_data(field: FieldDTO) -> dict:
+    """
+    The whole field as it is after the change, so a consumer never has to
+    read the field back.
+    """
+    return {
+        "field_type": field.field_type.value,
+        "field_name": field.field_name,
+        "description": field.description,
+        "order": field.order,
+        "config": field.config,
+        "is_required": field.is_required,
+        "created_by": field.created_by,
+        "version": field.version,
+    }
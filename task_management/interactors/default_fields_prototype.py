@@ -0,0 +1,88 @@
+import json
+
+from task_management.interactors.dtos import CreateFieldDTO, \
+    TemplateFieldIndexDTO, FieldTypeEnum, DEFAULT_FIELDS
+from task_management.interactors.field_ordering import assign_field_orders
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+class DefaultFieldsPrototype:
+    """
+    A set of default fields validated once, when the prototype is built,
+    and then stamped onto new templates without validating again.
+
+    Fields are held as tuples with their configs serialised, so every
+    stamp gets its own config dicts and the prototype cannot be changed
+    through them. A workspace that needs other defaults builds its own
+    prototype and passes it to ``CreateTemplateInteractor``.
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, fields: list[dict]):
+        create_fields_data = assign_field_orders(
+            create_fields_data=[
+                CreateFieldDTO(
+                    field_type=getattr(field["field_type"], "value",
+                                       field["field_type"]),
+                    field_name=field["field_name"],
+                    description=field.get("description", ""),
+                    template_id="",
+                    order=field.get("order"),
+                    config=field.get("config", {}),
+                    is_required=field.get("is_required", False),
+                    created_by=""
+                )
+                for field in fields
+            ],
+            field_indexes={"": _get_empty_field_index()})
+        self._validate(create_fields_data=create_fields_data)
+
+        self._fields = tuple(
+            (FieldTypeEnum(field.field_type), field.field_name,
+             field.description, field.order, json.dumps(field.config),
+             field.is_required)
+            for field in create_fields_data)
+
+    def stamp(self, template_id: str, created_by: str) -> \
+            list[CreateFieldDTO]:
+        return [
+            CreateFieldDTO(
+                field_type=field_type,
+                field_name=field_name,
+                description=description,
+                template_id=template_id,
+                order=order,
+                config=json.loads(config),
+                is_required=is_required,
+                created_by=created_by
+            )
+            for field_type, field_name, description, order, config,
+            is_required in self._fields
+        ]
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    @staticmethod
+    def _validate(create_fields_data: list[CreateFieldDTO]):
+        field_index = _get_empty_field_index()
+        ValidationMixin.check_already_existed_field_names(
+            field_names=[field.field_name for field in create_fields_data],
+            field_index=field_index)
+        ValidationMixin.check_field_orders_are_valid(
+            field_orders=[field.order for field in create_fields_data],
+            field_index=field_index)
+
+        for field in create_fields_data:
+            ValidationMixin.check_field_type(field_type=field.field_type)
+            ValidationMixin.validate_field_config_and_default(
+                field_type=field.field_type, config=field.config)
+
+
+def _get_empty_field_index() -> TemplateFieldIndexDTO:
+    return TemplateFieldIndexDTO(template_id="", field_ids=set(),
+                                 field_names={}, field_orders={})
+
+
+default_fields_prototype = DefaultFieldsPrototype(fields=DEFAULT_FIELDS)
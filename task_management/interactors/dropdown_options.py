@@ -0,0 +1,113 @@
+import uuid
+
+from task_management.exceptions.custom_exceptions import \
+    InvalidFieldConfigException, DropdownOptionAlreadyExistsException, \
+    DropdownOptionNotFoundException
+from task_management.interactors.dtos import FieldTypeEnum
+
+
+class DropdownOptions:
+    """
+    The options of one dropdown field, indexed by id and by label.
+
+    Options are stored in the field config as ``{"id": ..., "label": ...}``
+    so that they can be renamed or removed by a stable id. Plain string
+    options written before ids existed are still read; their label doubles
+    as their id.
+    """
+
+    __slots__ = ("_labels", "_option_ids")
+
+    def __init__(self):
+        self._labels = {}
+        self._option_ids = {}
+
+    @classmethod
+    def from_config(cls, options: list) -> "DropdownOptions":
+        dropdown_options = cls()
+        if not isinstance(options, list):
+            raise _get_invalid_options_exception(
+                message="Dropdown options must be a list")
+
+        for option in options:
+            if isinstance(option, str):
+                option_id, label = option, option
+            elif isinstance(option, dict) and option.keys() == {"id", "label"}:
+                option_id, label = option["id"], option["label"]
+            else:
+                raise _get_invalid_options_exception(
+                    message=f"Invalid dropdown option {option!r}")
+
+            if not isinstance(option_id, str):
+                raise _get_invalid_options_exception(
+                    message=f"Invalid dropdown option {option!r}")
+            _check_label(label=label)
+            if option_id in dropdown_options._labels or \
+                    label in dropdown_options._option_ids:
+                raise _get_invalid_options_exception(
+                    message=f"Duplicate dropdown option {option!r}")
+
+            dropdown_options._labels[option_id] = label
+            dropdown_options._option_ids[label] = option_id
+
+        return dropdown_options
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._option_ids
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def get_label(self, option_id: str) -> str:
+        try:
+            return self._labels[option_id]
+        except KeyError:
+            raise DropdownOptionNotFoundException(option_id=option_id)
+
+    def add(self, labels: list[str]) -> list[dict]:
+        options = []
+        for label in labels:
+            _check_label(label=label)
+            if label in self._option_ids:
+                raise DropdownOptionAlreadyExistsException(label=label)
+
+            option_id = str(uuid.uuid4())
+            self._labels[option_id] = label
+            self._option_ids[label] = option_id
+            options.append({"id": option_id, "label": label})
+
+        return options
+
+    def remove(self, option_ids: list[str]):
+        for option_id in option_ids:
+            label = self.get_label(option_id=option_id)
+            del self._labels[option_id]
+            del self._option_ids[label]
+
+    def rename(self, option_id: str, label: str):
+        _check_label(label=label)
+        current_label = self.get_label(option_id=option_id)
+        if label == current_label:
+            return
+        if label in self._option_ids:
+            raise DropdownOptionAlreadyExistsException(label=label)
+
+        self._labels[option_id] = label
+        del self._option_ids[current_label]
+        self._option_ids[label] = option_id
+
+    def to_config(self) -> list[dict]:
+        return [{"id": option_id, "label": label}
+                for option_id, label in self._labels.items()]
+
+
+def _check_label(label: str):
+    if not isinstance(label, str) or not label:
+        raise _get_invalid_options_exception(
+            message=f"Invalid dropdown option label {label!r}")
+
+
+def _get_invalid_options_exception(message: str) -> \
+        InvalidFieldConfigException:
+    return InvalidFieldConfigException(
+        field_type=FieldTypeEnum.Dropdown.value, message=message)
@@ -18,35 +18,119 @@ class PermissionsEnum(Enum):
     GUEST = "guest"
 
 
-@dataclass
+class PermissionActionEnum(Enum):
+    VIEW = "view"
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+PERMISSION_SCOPES = ("Workspace", "Space", "Folder", "List")
+
+
+class ChangeEntityEnum(Enum):
+    Template = "template"
+    Field = "field"
+
+
+class ChangeOperationEnum(Enum):
+    Created = "created"
+    Updated = "updated"
+
+
+class TaskValueErrorEnum(Enum):
+    REQUIRED = "required"
+    UNKNOWN_FIELD = "unknown_field"
+    INVALID_TYPE = "invalid_type"
+    INVALID_OPTION = "invalid_option"
+    LESS_THAN_MIN = "less_than_min"
+    GREATER_THAN_MAX = "greater_than_max"
+    TOO_LONG = "too_long"
+    INVALID_EMAIL = "invalid_email"
+    INVALID_DATE = "invalid_date"
+
+
+@dataclass(slots=True)
+class UserDTO:
+    user_id: str
+    full_name: str
+    email: str
+
+
+@dataclass(slots=True)
 class CreateFieldDTO:
     field_type: FieldTypeEnum
     field_name: str
     description: str
     template_id: str
-    order: int
+    order: int | None
     config: dict
     is_required: bool
     created_by: str
+    idempotency_key: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFieldDTO:
     field_id: str
     field_type: FieldTypeEnum
     description: str
     template_id: str
-    field_type: FieldTypeEnum
     field_name: str
-    description: str
-    template_id: str
     order: int
     config: dict
     is_required: bool
     created_by: str
+    version: int
+
+
+@dataclass(slots=True)
+class PatchFieldDTO:
+    field_id: str
+    template_id: str
+    version: int
+    user_id: str
+    field_type: FieldTypeEnum | None = None
+    field_name: str | None = None
+    description: str | None = None
+    order: int | None = None
+    config: dict | None = None
+    is_required: bool | None = None
+
+
+PATCH_FIELD_ATTRIBUTES = ("field_type", "field_name", "description", "order",
+                          "config", "is_required")
+
+
+@dataclass(slots=True)
+class AddDropdownOptionsDTO:
+    field_id: str
+    template_id: str
+    labels: list[str]
+    version: int
+    user_id: str
+
+
+@dataclass(slots=True)
+class RemoveDropdownOptionsDTO:
+    field_id: str
+    template_id: str
+    option_ids: list[str]
+    version: int
+    user_id: str
+
+
+@dataclass(slots=True)
+class RenameDropdownOptionDTO:
+    field_id: str
+    template_id: str
+    option_id: str
+    label: str
+    version: int
+    user_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldDTO:
     field_id: str
     field_type: FieldTypeEnum
@@ -57,17 +141,27 @@ class FieldDTO:
     config: dict
     is_required: bool
     created_by: str
+    version: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
+class TemplateFieldIndexDTO:
+    template_id: str
+    field_ids: set[str]
+    field_names: dict[str, str]
+    field_orders: dict[int, str]
+
+
+@dataclass(slots=True)
 class CreateTemplateDTO:
     name: str
     description: str
     is_default: bool
     created_by: str
+    idempotency_key: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTemplateDTO:
     template_id: str
     name: str
@@ -75,7 +169,8 @@ class UpdateTemplateDTO:
     is_default: bool
     created_by: str
 
-@dataclass
+
+@dataclass(slots=True)
 class TemplateDTO:
     template_id: str
     name: str
@@ -84,29 +179,73 @@ class TemplateDTO:
     created_by: str
 
 
+@dataclass(slots=True)
+class TemplateSchemaDTO:
+    template: TemplateDTO
+    fields: list[FieldDTO]
+
+
+@dataclass(slots=True)
+class ImportTemplatesResultDTO:
+    templates_count: int
+    fields_count: int
+
+
+@dataclass(slots=True)
+class ChangeDTO:
+    sequence: int
+    entity: ChangeEntityEnum
+    entity_id: str
+    template_id: str
+    operation: ChangeOperationEnum
+    data: dict
+
+
+@dataclass(slots=True)
+class ChangesPageDTO:
+    changes: list[ChangeDTO]
+    next_since: int
+    has_more: bool
+
+
+@dataclass(slots=True)
+class SearchResultDTO:
+    template_id: str
+    field_id: str | None
+    name: str
+    rank: float
+
+
+@dataclass(slots=True)
+class TaskValueErrorDTO:
+    field_id: str
+    error: TaskValueErrorEnum
+    value: object = None
+
+
 DEFAULT_FIELDS = [
             {
                 "field_type": FieldTypeEnum.Text,
                 "field_name": "Title",
                 "description": "Task title",
-                "order": 1,
+                "order": 1000,
                 "config": {"max_length": 255},
                 "is_required": True
             },
             {
                 "field_type": FieldTypeEnum.User,
                 "field_name": "Assignee",
-                "order": 2
+                "order": 2000
             },
             {
                 "field_type": FieldTypeEnum.Date,
                 "field_name": "Due Date",
-                "order": 3
+                "order": 3000
             },
             {
                 "field_type": FieldTypeEnum.Dropdown,
                 "field_name": "Priority",
-                "order": 4,
+                "order": 4000,
                 "config": {
                     "options": ["Low", "Medium", "High"]
                 }
@@ -114,7 +253,7 @@ DEFAULT_FIELDS = [
             {
                 "field_type": FieldTypeEnum.Dropdown,
                 "field_name": "Status",
-                "order": 5,
+                "order": 5000,
                 "config": {
                     "options": ["Todo", "In Progress", "Done"]
                 }
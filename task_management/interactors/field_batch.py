@@ -0,0 +1,106 @@
+import json
+import sys
+from array import array
+
+from task_management.interactors.dtos import FieldDTO, FieldTypeEnum
+
+FIELD_TYPES = tuple(FieldTypeEnum)
+FIELD_TYPE_CODES = {field_type: code
+                    for code, field_type in enumerate(FIELD_TYPES)}
+
+
+class FieldBatch:
+    """
+    Fields of many templates stored as parallel columns.
+
+    Field types are kept as one-byte codes, template and user ids are
+    interned, and equal configs share one dict, so a batch holds far less
+    per field than a list of ``FieldDTO``. Configs are shared between
+    fields and must be treated as read-only.
+    """
+
+    __slots__ = ("field_ids", "template_ids", "field_names", "descriptions",
+                 "field_type_codes", "orders", "configs", "is_required",
+                 "created_by", "versions", "_configs_by_key")
+
+    def __init__(self):
+        self.field_ids = []
+        self.template_ids = []
+        self.field_names = []
+        self.descriptions = []
+        self.field_type_codes = bytearray()
+        self.orders = array("q")
+        self.configs = []
+        self.is_required = bytearray()
+        self.created_by = []
+        self.versions = array("q")
+        self._configs_by_key = {}
+
+    @classmethod
+    def from_fields(cls, fields) -> "FieldBatch":
+        batch = cls()
+        for field in fields:
+            batch.append(field_id=field.field_id,
+                         template_id=field.template_id,
+                         field_name=field.field_name,
+                         description=field.description,
+                         field_type=field.field_type,
+                         order=field.order,
+                         config=field.config,
+                         is_required=field.is_required,
+                         created_by=field.created_by,
+                         version=field.version)
+
+        return batch
+
+    def append(self, field_id: str, template_id: str, field_name: str,
+               description: str, field_type: FieldTypeEnum | str, order: int,
+               config: dict, is_required: bool, created_by: str,
+               version: int = 1):
+        self.field_ids.append(field_id)
+        self.template_ids.append(sys.intern(template_id))
+        self.field_names.append(field_name)
+        self.descriptions.append(description)
+        self.field_type_codes.append(
+            FIELD_TYPE_CODES[FieldTypeEnum(getattr(field_type, "value",
+                                                   field_type))])
+        self.orders.append(order)
+        self.configs.append(self._intern_config(config=config or {}))
+        self.is_required.append(bool(is_required))
+        self.created_by.append(sys.intern(created_by))
+        self.versions.append(version)
+
+    def get_field_type(self, position: int) -> FieldTypeEnum:
+        return FIELD_TYPES[self.field_type_codes[position]]
+
+    def get_field(self, position: int) -> FieldDTO:
+        return FieldDTO(
+            field_id=self.field_ids[position],
+            field_type=FIELD_TYPES[self.field_type_codes[position]],
+            description=self.descriptions[position],
+            template_id=self.template_ids[position],
+            field_name=self.field_names[position],
+            order=self.orders[position],
+            config=self.configs[position],
+            is_required=bool(self.is_required[position]),
+            created_by=self.created_by[position],
+            version=self.versions[position]
+        )
+
+    def get_template_positions(self) -> dict[str, list[int]]:
+        template_positions = {}
+        for position, template_id in enumerate(self.template_ids):
+            template_positions.setdefault(template_id, []).append(position)
+
+        return template_positions
+
+    def __len__(self) -> int:
+        return len(self.field_ids)
+
+    def __iter__(self):
+        return (self.get_field(position) for position in range(len(self)))
+
+    def _intern_config(self, config: dict) -> dict:
+        key = json.dumps(config, sort_keys=True, default=str)
+
+        return self._configs_by_key.setdefault(key, config)
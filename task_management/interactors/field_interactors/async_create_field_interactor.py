@@ -0,0 +1,181 @@
+import asyncio
+
+from task_management.exceptions.custom_exceptions import \
+    DuplicateIdempotencyKeyException, FieldNameAlreadyExistsException
+from task_management.interactors.dtos import CreateFieldDTO, FieldDTO
+from task_management.interactors.field_ordering import assign_field_orders
+from task_management.interactors.storage_interface.async_field_storage_interface import \
+    AsyncFieldStorageInterface
+from task_management.interactors.storage_interface.async_permission_storage_interface import \
+    AsyncPermissionStorageInterface
+from task_management.interactors.storage_interface.async_template_storage_interface import \
+    AsyncTemplateStorageInterface
+from task_management.interactors.storage_interface.async_user_storage_interface import \
+    AsyncUserStorageInterface
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+class AsyncCreateFieldInteractor(ValidationMixin):
+    """
+    Async counterpart of CreateFieldInteractor. The independent lookups
+    are awaited together, then checked in the same order as the sync
+    interactor so the reported error does not depend on which lookup
+    finished first.
+    """
+
+    def __init__(self, field_storage: AsyncFieldStorageInterface,
+                 user_storage: AsyncUserStorageInterface,
+                 template_storage: AsyncTemplateStorageInterface,
+                 permission_storage: AsyncPermissionStorageInterface):
+        self.field_storage = field_storage
+        self.user_storage = user_storage
+        self.template_storage = template_storage
+        self.permission_storage = permission_storage
+
+    async def create_field(self, create_field_data: CreateFieldDTO,
+                           collect_errors: bool = False) -> FieldDTO:
+        """
+        With ``collect_errors`` every check runs and all failures are
+        raised together as ``ValidationErrorsException``.
+        """
+        if create_field_data.idempotency_key is None:
+            return await self._create_field(
+                create_field_data=create_field_data,
+                collect_errors=collect_errors)
+
+        field = await self.get_idempotent_field(
+            create_field_data=create_field_data)
+        if field is not None:
+            return field
+
+        try:
+            return await self._create_field(
+                create_field_data=create_field_data,
+                collect_errors=collect_errors)
+        except (DuplicateIdempotencyKeyException,
+                FieldNameAlreadyExistsException):
+            field = await self.get_idempotent_field(
+                create_field_data=create_field_data)
+            if field is None:
+                raise
+            return field
+
+    async def get_idempotent_field(self, create_field_data: CreateFieldDTO) -> \
+            FieldDTO | None:
+        field = await self.field_storage.get_field_by_idempotency_key(
+            created_by=create_field_data.created_by,
+            idempotency_key=create_field_data.idempotency_key)
+
+        if field is not None:
+            self.check_idempotent_field_matches(
+                create_field_data=create_field_data, field=field)
+
+        return field
+
+    async def _create_field(self, create_field_data: CreateFieldDTO,
+                            collect_errors: bool) -> FieldDTO:
+        errors = ValidationErrorCollector(collect=collect_errors)
+        ft = create_field_data.field_type
+        field_type = ft.value if hasattr(ft, "value") else ft
+        user_id = create_field_data.created_by
+        template_id = create_field_data.template_id
+
+        is_user_exist, is_template_exist, user_permissions, field_index = \
+            await asyncio.gather(
+                self.user_storage.check_user_exist(user_id=user_id),
+                self.template_storage.check_template_exist(
+                    template_id=template_id),
+                self.permission_storage.get_user_access_permissions(
+                    user_id=user_id),
+                self.field_storage.get_template_field_index(
+                    template_id=template_id)
+            )
+
+        is_user_found = errors.run(self.check_user_found, user_id=user_id,
+                                   is_exist=is_user_exist)
+        errors.run(self.check_template_found, template_id=template_id,
+                   is_exist=is_template_exist)
+        if is_user_found:
+            errors.run(self.check_user_permissions_allow_creation,
+                       user_id=user_id, user_permissions=user_permissions)
+        is_valid_type = errors.run(self.check_field_type,
+                                   field_type=field_type)
+        [create_field_data] = assign_field_orders(
+            create_fields_data=[create_field_data],
+            field_indexes={template_id: field_index})
+        errors.run(self.check_already_existed_field_name,
+                   field_name=create_field_data.field_name,
+                   field_index=field_index)
+        errors.run(self.check_field_order_is_valid,
+                   field_order=create_field_data.order,
+                   field_index=field_index)
+        if is_valid_type:
+            self.validate_field_config_and_default(
+                field_type=field_type, config=create_field_data.config,
+                collector=errors)
+        errors.raise_errors()
+
+        return await self.field_storage.create_field(
+            create_field_data=create_field_data)
+
+    async def create_fields(self, create_fields_data: list[CreateFieldDTO],
+                            collect_errors: bool = False) -> list[FieldDTO]:
+        """
+        Validates the batch like CreateFieldInteractor.create_fields, with
+        the lookups for every distinct user and template awaited together.
+        """
+        if not create_fields_data:
+            return []
+
+        errors = ValidationErrorCollector(collect=collect_errors)
+        user_ids = list(dict.fromkeys(
+            field.created_by for field in create_fields_data))
+        template_ids = list(dict.fromkeys(
+            field.template_id for field in create_fields_data))
+
+        users_exist, templates_exist, users_permissions, field_indexes = \
+            await asyncio.gather(
+                asyncio.gather(*(
+                    self.user_storage.check_user_exist(user_id=user_id)
+                    for user_id in user_ids)),
+                asyncio.gather(*(
+                    self.template_storage.check_template_exist(
+                        template_id=template_id)
+                    for template_id in template_ids)),
+                asyncio.gather(*(
+                    self.permission_storage.get_user_access_permissions(
+                        user_id=user_id)
+                    for user_id in user_ids)),
+                asyncio.gather(*(
+                    self.field_storage.get_template_field_index(
+                        template_id=template_id)
+                    for template_id in template_ids))
+            )
+
+        existing_user_ids = {
+            user_id for user_id, is_exist in zip(user_ids, users_exist)
+            if errors.run(self.check_user_found, user_id=user_id,
+                          is_exist=is_exist)}
+        for template_id, is_exist in zip(template_ids, templates_exist):
+            errors.run(self.check_template_found, template_id=template_id,
+                       is_exist=is_exist)
+        for user_id, user_permissions in zip(user_ids, users_permissions):
+            if user_id in existing_user_ids:
+                errors.run(self.check_user_permissions_allow_creation,
+                           user_id=user_id, user_permissions=user_permissions)
+
+        field_types = self.check_batch_field_types(
+            create_fields_data=create_fields_data, collector=errors)
+        field_indexes = dict(zip(template_ids, field_indexes))
+        create_fields_data = assign_field_orders(
+            create_fields_data=create_fields_data,
+            field_indexes=field_indexes)
+        self.check_batch_fields(create_fields_data=create_fields_data,
+                                field_indexes=field_indexes,
+                                field_types=field_types, collector=errors)
+        errors.raise_errors()
+
+        return await self.field_storage.bulk_create_fields(
+            create_fields_data=create_fields_data)
@@ -0,0 +1,52 @@
+import asyncio
+
+from task_management.interactors.dtos import UpdateFieldDTO, FieldDTO
+from task_management.interactors.storage_interface.async_field_storage_interface import \
+    AsyncFieldStorageInterface
+from task_management.interactors.storage_interface.async_permission_storage_interface import \
+    AsyncPermissionStorageInterface
+from task_management.interactors.storage_interface.async_template_storage_interface import \
+    AsyncTemplateStorageInterface
+from task_management.interactors.storage_interface.async_user_storage_interface import \
+    AsyncUserStorageInterface
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+class AsyncUpdateFieldInteractor(ValidationMixin):
+
+    def __init__(self, user_storage: AsyncUserStorageInterface,
+                 field_storage: AsyncFieldStorageInterface,
+                 permission_storage: AsyncPermissionStorageInterface,
+                 template_storage: AsyncTemplateStorageInterface):
+        self.user_storage = user_storage
+        self.field_storage = field_storage
+        self.permission_storage = permission_storage
+        self.template_storage = template_storage
+
+    async def update_field(self, update_field_data: UpdateFieldDTO) -> \
+            FieldDTO:
+        ft = update_field_data.field_type
+        field_type = ft.value if hasattr(ft, "value") else ft
+        user_id = update_field_data.created_by
+        template_id = update_field_data.template_id
+
+        is_user_exist, is_template_exist, user_permissions = \
+            await asyncio.gather(
+                self.user_storage.check_user_exist(user_id=user_id),
+                self.template_storage.check_template_exist(
+                    template_id=template_id),
+                self.permission_storage.get_user_access_permissions(
+                    user_id=user_id)
+            )
+
+        self.check_user_found(user_id=user_id, is_exist=is_user_exist)
+        self.check_template_found(template_id=template_id,
+                                  is_exist=is_template_exist)
+        self.check_user_permissions_allow_creation(
+            user_id=user_id, user_permissions=user_permissions)
+        self.check_field_type(field_type=field_type)
+        self.validate_field_config_and_default(field_type=field_type,
+                                               config=update_field_data.config)
+
+        return await self.field_storage.update_field(
+            update_field_data=update_field_data)
@@ -1,4 +1,7 @@
+from task_management.exceptions.custom_exceptions import \
+    DuplicateIdempotencyKeyException, FieldNameAlreadyExistsException
 from task_management.interactors.dtos import CreateFieldDTO, FieldDTO
+from task_management.interactors.field_ordering import assign_field_orders
 from task_management.interactors.storage_interface.field_storage_interface import \
     FieldStorageInterface
 from task_management.interactors.storage_interface.permission_storage_interface import \
@@ -7,6 +10,8 @@ from task_management.interactors.storage_interface.template_storage_interface im
     TemplateStorageInterface
 from task_management.interactors.storage_interface.user_storage_interface import \
     UserStorageInterface
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector
 from task_management.interactors.validation_mixin import ValidationMixin
 
 
@@ -21,27 +26,126 @@ class CreateFieldInteractor(ValidationMixin):
         self.template_storage = template_storage
         self.permission_storage = permission_storage
 
-    def create_field(self, create_field_data: CreateFieldDTO) -> FieldDTO:
+    def create_field(self, create_field_data: CreateFieldDTO,
+                     collect_errors: bool = False) -> FieldDTO:
+        """
+        With ``collect_errors`` every check runs and all failures are
+        raised together as ``ValidationErrorsException``.
+        """
+        if create_field_data.idempotency_key is None:
+            return self._create_field(create_field_data=create_field_data,
+                                      collect_errors=collect_errors)
+
+        field = self.get_idempotent_field(create_field_data=create_field_data)
+        if field is not None:
+            return field
+
+        try:
+            return self._create_field(create_field_data=create_field_data,
+                                      collect_errors=collect_errors)
+        except (DuplicateIdempotencyKeyException,
+                FieldNameAlreadyExistsException):
+            # A concurrent request with the same key may have committed
+            # first; hand back its field instead of the conflict.
+            field = self.get_idempotent_field(
+                create_field_data=create_field_data)
+            if field is None:
+                raise
+            return field
+
+    def get_idempotent_field(self, create_field_data: CreateFieldDTO) -> \
+            FieldDTO | None:
+        field = self.field_storage.get_field_by_idempotency_key(
+            created_by=create_field_data.created_by,
+            idempotency_key=create_field_data.idempotency_key)
+
+        if field is not None:
+            self.check_idempotent_field_matches(
+                create_field_data=create_field_data, field=field)
+
+        return field
+
+    def _create_field(self, create_field_data: CreateFieldDTO,
+                      collect_errors: bool) -> FieldDTO:
+        errors = ValidationErrorCollector(collect=collect_errors)
         ft = create_field_data.field_type
         field_type = ft.value if hasattr(ft, "value") else ft
 
-        self.check_user_exist(user_id=create_field_data.created_by,
-                              user_storage=self.user_storage)
-        self.check_template_exist(template_id=create_field_data.template_id,
-                                  template_storage=self.template_storage)
-        self.check_user_has_access_to_create_field(
-            user_id=create_field_data.created_by,
-            permission_storage=self.permission_storage)
-        self.check_field_type(field_type=field_type)
-        self.check_already_existed_field_name(
-            field_name=create_field_data.field_name,
-            template_id=create_field_data.template_id,
-            field_storage=self.field_storage)
-        self.check_field_order_is_valid(field_order=create_field_data.order,
-                                        template_id=create_field_data.template_id,
-                                        field_storage=self.field_storage)
-        self.validate_field_config_and_default(field_type=field_type,
-                                               config=create_field_data.config)
+        is_user_exist = errors.run(self.check_user_exist,
+                                   user_id=create_field_data.created_by,
+                                   user_storage=self.user_storage)
+        errors.run(self.check_template_exist,
+                   template_id=create_field_data.template_id,
+                   template_storage=self.template_storage)
+        if is_user_exist:
+            errors.run(self.check_user_has_access_to_create_field,
+                       user_id=create_field_data.created_by,
+                       permission_storage=self.permission_storage)
+        is_valid_type = errors.run(self.check_field_type,
+                                   field_type=field_type)
+        field_index = self.field_storage.get_template_field_index(
+            template_id=create_field_data.template_id)
+        [create_field_data] = assign_field_orders(
+            create_fields_data=[create_field_data],
+            field_indexes={create_field_data.template_id: field_index})
+        errors.run(self.check_already_existed_field_name,
+                   field_name=create_field_data.field_name,
+                   field_index=field_index)
+        errors.run(self.check_field_order_is_valid,
+                   field_order=create_field_data.order,
+                   field_index=field_index)
+        if is_valid_type:
+            self.validate_field_config_and_default(
+                field_type=field_type, config=create_field_data.config,
+                collector=errors)
+        errors.raise_errors()
 
         return self.field_storage.create_field(
             create_field_data=create_field_data)
+
+    def create_fields(self, create_fields_data: list[CreateFieldDTO],
+                      collect_errors: bool = False) -> list[FieldDTO]:
+        """
+        Validates the batch with one lookup per distinct user and template.
+        With ``collect_errors`` every field is checked and the failures are
+        raised together, each with the ``position`` of its field.
+        """
+        if not create_fields_data:
+            return []
+
+        errors = ValidationErrorCollector(collect=collect_errors)
+        user_ids = list(dict.fromkeys(
+            field.created_by for field in create_fields_data))
+        template_ids = list(dict.fromkeys(
+            field.template_id for field in create_fields_data))
+
+        existing_user_ids = [
+            user_id for user_id in user_ids
+            if errors.run(self.check_user_exist, user_id=user_id,
+                          user_storage=self.user_storage)]
+        for template_id in template_ids:
+            errors.run(self.check_template_exist, template_id=template_id,
+                       template_storage=self.template_storage)
+        for user_id in existing_user_ids:
+            errors.run(self.check_user_has_access_to_create_field,
+                       user_id=user_id,
+                       permission_storage=self.permission_storage)
+
+        field_types = self.check_batch_field_types(
+            create_fields_data=create_fields_data, collector=errors)
+
+        field_indexes = {
+            template_id: self.field_storage.get_template_field_index(
+                template_id=template_id)
+            for template_id in template_ids
+        }
+        create_fields_data = assign_field_orders(
+            create_fields_data=create_fields_data,
+            field_indexes=field_indexes)
+        self.check_batch_fields(create_fields_data=create_fields_data,
+                                field_indexes=field_indexes,
+                                field_types=field_types, collector=errors)
+        errors.raise_errors()
+
+        return self.field_storage.bulk_create_fields(
+            create_fields_data=create_fields_data)
@@ -0,0 +1,115 @@
+from task_management.exceptions.custom_exceptions import \
+    FieldNotFoundException, UnexpectedFieldTypeFoundException, \
+    InvalidFieldConfigException
+from task_management.interactors.dropdown_options import DropdownOptions
+from task_management.interactors.dtos import AddDropdownOptionsDTO, \
+    RemoveDropdownOptionsDTO, RenameDropdownOptionDTO, FieldDTO, \
+    FieldTypeEnum
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+class DropdownOptionsInteractor(ValidationMixin):
+    """
+    Adds, removes and renames the options of a dropdown field by sending
+    only the change. Only the changed options are validated; the rest of
+    the config is trusted as already valid.
+
+    Every change is written only if the field is still at the given
+    version, like ``update_field``.
+    """
+
+    def __init__(self, field_storage: FieldStorageInterface,
+                 user_storage: UserStorageInterface,
+                 permission_storage: PermissionStorageInterface):
+        self.field_storage = field_storage
+        self.user_storage = user_storage
+        self.permission_storage = permission_storage
+
+    def add_dropdown_options(self, add_options_data: AddDropdownOptionsDTO) \
+            -> FieldDTO:
+        field, options = self._get_dropdown_options(
+            field_id=add_options_data.field_id,
+            template_id=add_options_data.template_id,
+            user_id=add_options_data.user_id)
+
+        options.add(labels=add_options_data.labels)
+
+        return self._update_options(field=field, options=options,
+                                    version=add_options_data.version,
+                                    default_value=field.config.get("default"))
+
+    def remove_dropdown_options(
+            self, remove_options_data: RemoveDropdownOptionsDTO) -> FieldDTO:
+        field, options = self._get_dropdown_options(
+            field_id=remove_options_data.field_id,
+            template_id=remove_options_data.template_id,
+            user_id=remove_options_data.user_id)
+
+        removed_labels = {options.get_label(option_id=option_id)
+                          for option_id in remove_options_data.option_ids}
+        options.remove(option_ids=remove_options_data.option_ids)
+        if not len(options):
+            raise InvalidFieldConfigException(
+                field_type=FieldTypeEnum.Dropdown.value,
+                message="Dropdown must have non-empty options")
+
+        default_value = field.config.get("default")
+        if default_value in removed_labels:
+            default_value = None
+
+        return self._update_options(field=field, options=options,
+                                    version=remove_options_data.version,
+                                    default_value=default_value)
+
+    def rename_dropdown_option(
+            self, rename_option_data: RenameDropdownOptionDTO) -> FieldDTO:
+        field, options = self._get_dropdown_options(
+            field_id=rename_option_data.field_id,
+            template_id=rename_option_data.template_id,
+            user_id=rename_option_data.user_id)
+
+        current_label = options.get_label(
+            option_id=rename_option_data.option_id)
+        options.rename(option_id=rename_option_data.option_id,
+                       label=rename_option_data.label)
+
+        default_value = field.config.get("default")
+        if default_value == current_label:
+            default_value = rename_option_data.label
+
+        return self._update_options(field=field, options=options,
+                                    version=rename_option_data.version,
+                                    default_value=default_value)
+
+    def _get_dropdown_options(self, field_id: str, template_id: str,
+                              user_id: str) -> tuple[FieldDTO, DropdownOptions]:
+        self.check_user_exist(user_id=user_id, user_storage=self.user_storage)
+        self.check_user_has_access_to_create_field(
+            user_id=user_id, permission_storage=self.permission_storage)
+
+        field = self.field_storage.get_field(field_id=field_id,
+                                             template_id=template_id)
+        if field is None:
+            raise FieldNotFoundException(field_id=field_id)
+        if FieldTypeEnum(field.field_type) != FieldTypeEnum.Dropdown:
+            raise UnexpectedFieldTypeFoundException(
+                field_type=FieldTypeEnum(field.field_type).value)
+
+        return field, DropdownOptions.from_config(
+            options=field.config["options"])
+
+    def _update_options(self, field: FieldDTO, options: DropdownOptions,
+                        version: int, default_value) -> FieldDTO:
+        config = {"options": options.to_config()}
+        if default_value is not None:
+            config["default"] = default_value
+
+        return self.field_storage.update_field_config(
+            field_id=field.field_id, template_id=field.template_id,
+            config=config, version=version)
@@ -0,0 +1,48 @@
+from task_management.interactors.field_ordering import \
+    get_reordered_field_orders
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+class ReorderFieldsInteractor(ValidationMixin):
+
+    def __init__(self, field_storage: FieldStorageInterface,
+                 user_storage: UserStorageInterface,
+                 template_storage: TemplateStorageInterface,
+                 permission_storage: PermissionStorageInterface):
+        self.field_storage = field_storage
+        self.user_storage = user_storage
+        self.template_storage = template_storage
+        self.permission_storage = permission_storage
+
+    def reorder_fields(self, template_id: str, field_ids: list[str],
+                       user_id: str) -> dict[str, int]:
+        self.check_user_exist(user_id=user_id, user_storage=self.user_storage)
+        self.check_template_exist(template_id=template_id,
+                                  template_storage=self.template_storage)
+        self.check_user_has_access_to_create_field(
+            user_id=user_id, permission_storage=self.permission_storage)
+
+        field_index = self.field_storage.get_template_field_index(
+            template_id=template_id)
+        self.check_fields_reorder_is_valid(template_id=template_id,
+                                           field_ids=field_ids,
+                                           field_index=field_index)
+
+        current_orders = {field_id: order
+                          for order, field_id in field_index.field_orders.items()}
+        field_orders = get_reordered_field_orders(
+            field_ids=field_ids, current_orders=current_orders)
+
+        if field_orders:
+            self.field_storage.update_field_orders(
+                template_id=template_id, field_orders=field_orders)
+
+        return field_orders
@@ -1,4 +1,7 @@
-from task_management.interactors.dtos import UpdateFieldDTO, FieldDTO
+from task_management.exceptions.custom_exceptions import \
+    FieldNotFoundException
+from task_management.interactors.dtos import UpdateFieldDTO, FieldDTO, \
+    PatchFieldDTO, PATCH_FIELD_ATTRIBUTES
 from task_management.interactors.storage_interface.field_storage_interface import \
     FieldStorageInterface
 from task_management.interactors.storage_interface.permission_storage_interface import \
@@ -22,12 +25,16 @@ class UpdateFieldInteractor(ValidationMixin):
         self.template_storage = template_storage
 
     def update_field(self, update_field_data: UpdateFieldDTO) -> FieldDTO:
+        """
+        Writes the field only if it is still at ``update_field_data.version``.
+        The storage checks existence, the version and name / order
+        uniqueness in the same conditional write, so a concurrent update
+        surfaces as ``FieldVersionConflictException`` instead of being
+        silently overwritten.
+        """
         ft = update_field_data.field_type
         field_type = ft.value if hasattr(ft, "value") else ft
 
-        self.validate_field(field_id=update_field_data.field_id,
-                            template_id=update_field_data.template_id,
-                            field_storage=self.field_storage)
         self.check_user_exist(user_id=update_field_data.created_by,
                               user_storage=self.user_storage)
         self.check_template_exist(template_id=update_field_data.template_id,
@@ -36,15 +43,53 @@ class UpdateFieldInteractor(ValidationMixin):
             user_id=update_field_data.created_by,
             permission_storage=self.permission_storage)
         self.check_field_type(field_type=field_type)
-        self.check_field_name_exist(field_id=update_field_data.field_id,
-                                    field_name=update_field_data.field_name,
-                                    template_id=update_field_data.template_id,
-                                    field_storage=self.field_storage)
-        self.check_field_order_is_valid(field_order=update_field_data.order,
-                                        template_id=update_field_data.template_id,
-                                        field_storage=self.field_storage)
         self.validate_field_config_and_default(field_type=field_type,
                                                config=update_field_data.config)
 
         return self.field_storage.update_field(
             update_field_data=update_field_data)
+
+    def patch_field(self, patch_field_data: PatchFieldDTO) -> FieldDTO:
+        """
+        Updates only the attributes that are set on ``patch_field_data`` and
+        runs only the checks they need. The field is read first only when
+        one of type and config changes without the other, since they are
+        validated together; everything else is left to the version-checked
+        write.
+        """
+        changes = {attribute: getattr(patch_field_data, attribute)
+                   for attribute in PATCH_FIELD_ATTRIBUTES
+                   if getattr(patch_field_data, attribute) is not None}
+
+        self.check_user_exist(user_id=patch_field_data.user_id,
+                              user_storage=self.user_storage)
+        self.check_user_has_access_to_create_field(
+            user_id=patch_field_data.user_id,
+            permission_storage=self.permission_storage)
+
+        field = None
+        if not changes or ("field_type" in changes) != ("config" in changes):
+            field = self.field_storage.get_field(
+                field_id=patch_field_data.field_id,
+                template_id=patch_field_data.template_id)
+            if field is None:
+                raise FieldNotFoundException(
+                    field_id=patch_field_data.field_id)
+            if not changes:
+                return field
+
+        if "field_type" in changes or "config" in changes:
+            ft = changes["field_type"] if "field_type" in changes \
+                else field.field_type
+            field_type = ft.value if hasattr(ft, "value") else ft
+            config = changes["config"] if "config" in changes \
+                else field.config
+            self.check_field_type(field_type=field_type)
+            self.validate_field_config_and_default(field_type=field_type,
+                                                   config=config)
+
+        return self.field_storage.patch_field(
+            field_id=patch_field_data.field_id,
+            template_id=patch_field_data.template_id,
+            version=patch_field_data.version,
+            changes=changes)
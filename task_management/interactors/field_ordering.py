@@ -0,0 +1,107 @@
+from bisect import bisect_left
+from dataclasses import replace
+
+from task_management.interactors.dtos import CreateFieldDTO, \
+    TemplateFieldIndexDTO
+
+FIELD_ORDER_GAP = 1000
+
+
+def get_reordered_field_orders(field_ids: list[str],
+                               current_orders: dict[str, int]) -> \
+        dict[str, int]:
+    """
+    Returns the new order of every field in ``field_ids`` whose order has
+    to change so that the fields sort in the given sequence.
+
+    Fields on the longest run that is already in order keep their order;
+    the others are spread evenly through the gaps between them. Only when
+    a gap is too narrow is the whole template renumbered.
+    """
+    orders = [current_orders[field_id] for field_id in field_ids]
+    anchors = _get_longest_increasing_positions(orders)
+
+    new_orders = {}
+    lower_order = 0
+    start = 0
+    for anchor in anchors + [None]:
+        stop = len(field_ids) if anchor is None else anchor
+        count = stop - start
+
+        if count:
+            if anchor is None:
+                step = FIELD_ORDER_GAP
+            else:
+                step = (orders[anchor] - lower_order) // (count + 1)
+            if step < 1:
+                return _renumber_field_orders(field_ids, current_orders)
+
+            for position in range(count):
+                new_orders[field_ids[start + position]] = \
+                    lower_order + step * (position + 1)
+
+        if anchor is not None:
+            lower_order = orders[anchor]
+            start = anchor + 1
+
+    return new_orders
+
+
+def _renumber_field_orders(field_ids: list[str],
+                           current_orders: dict[str, int]) -> dict[str, int]:
+    new_orders = {}
+    for position, field_id in enumerate(field_ids, start=1):
+        order = position * FIELD_ORDER_GAP
+        if current_orders[field_id] != order:
+            new_orders[field_id] = order
+
+    return new_orders
+
+
+def _get_longest_increasing_positions(values: list[int]) -> list[int]:
+    tail_values = []
+    tail_positions = []
+    previous_positions = [None] * len(values)
+
+    for position, value in enumerate(values):
+        index = bisect_left(tail_values, value)
+        if index:
+            previous_positions[position] = tail_positions[index - 1]
+        if index == len(tail_values):
+            tail_values.append(value)
+            tail_positions.append(position)
+        else:
+            tail_values[index] = value
+            tail_positions[index] = position
+
+    positions = []
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        positions.append(position)
+        position = previous_positions[position]
+
+    return positions[::-1]
+
+
+def assign_field_orders(create_fields_data: list[CreateFieldDTO],
+                        field_indexes: dict[str, TemplateFieldIndexDTO]) -> \
+        list[CreateFieldDTO]:
+    """
+    Fills in the order of fields created without one, appending them after
+    the template's existing fields and the explicit orders in the batch.
+    """
+    last_orders = {template_id: max(field_index.field_orders, default=0)
+                   for template_id, field_index in field_indexes.items()}
+    for field in create_fields_data:
+        if field.order is not None:
+            last_orders[field.template_id] = max(
+                last_orders[field.template_id], field.order)
+
+    assigned_fields = []
+    for field in create_fields_data:
+        if field.order is None:
+            last_orders[field.template_id] += FIELD_ORDER_GAP
+            field = replace(field, order=last_orders[field.template_id])
+        assigned_fields.append(field)
+
+    return assigned_fields
@@ -0,0 +1,299 @@
+import re
+from datetime import date
+
+from task_management.exceptions.custom_exceptions import \
+    UnexpectedFieldTypeFoundException, InvalidFieldConfigException, \
+    InvalidFieldDefaultValueException
+from task_management.interactors.dropdown_options import DropdownOptions
+from task_management.interactors.dtos import FieldTypeEnum, \
+    TaskValueErrorEnum
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector
+
+FIELD_TYPE_VALUES = frozenset(field_type.value for field_type in FieldTypeEnum)
+
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+class FieldTypeValidator:
+    """
+    Validates the config of one field type. Allowed keys and the expected
+    default type are bound once, when the validator is registered.
+    """
+
+    def __init__(self, field_type: FieldTypeEnum, config_keys=(),
+                 default_type: type | tuple = str):
+        self.field_type = field_type
+        self.field_type_value = field_type.value
+        self.config_keys = frozenset(config_keys) | {"default"}
+        self.default_type = default_type
+
+    def validate(self, config: dict,
+                 collector: ValidationErrorCollector | None = None):
+        """
+        Checks the config keys, the config and its default. With a
+        collecting ``collector`` a bad key does not hide a bad default; the
+        default is only checked once the config itself is valid.
+        """
+        collector = collector or ValidationErrorCollector()
+        if not isinstance(config, dict):
+            collector.run(self.check_config_is_object, config=config)
+            return
+
+        collector.run(self.check_config_keys, config=config)
+        if collector.run(self.validate_config, config=config):
+            collector.run(self.check_default, config=config)
+
+    def check_config_is_object(self, config):
+        if not isinstance(config, dict):
+            raise InvalidFieldConfigException(
+                field_type=self.field_type_value,
+                message="Config must be an object"
+            )
+
+    def check_config_keys(self, config: dict):
+        invalid_keys = config.keys() - self.config_keys
+
+        if invalid_keys:
+            raise InvalidFieldConfigException(
+                field_type=self.field_type_value,
+                invalid_keys=sorted(invalid_keys)
+            )
+
+    def check_default(self, config: dict):
+        default_value = config.get("default")
+
+        if default_value is not None:
+            if not self.is_valid_default_type(default_value):
+                raise InvalidFieldDefaultValueException(
+                    field_type=self.field_type_value,
+                    default_value=default_value
+                )
+
+            self.validate_default(config=config, default_value=default_value)
+
+    def is_valid_default_type(self, default_value) -> bool:
+        return isinstance(default_value, self.default_type)
+
+    def validate_config(self, config: dict):
+        pass
+
+    def validate_default(self, config: dict, default_value):
+        pass
+
+    def get_value_checks(self, config: dict) -> list:
+        """
+        Returns ``(error, is_valid)`` pairs that a task value of this field
+        type must pass, in order. Bound once per field so that a batch of
+        values is checked without re-reading the config.
+        """
+        return [(TaskValueErrorEnum.INVALID_TYPE, self.is_valid_default_type)]
+
+
+class TextFieldValidator(FieldTypeValidator):
+
+    def __init__(self):
+        super().__init__(field_type=FieldTypeEnum.Text,
+                         config_keys={"max_length"}, default_type=str)
+
+    def validate_config(self, config: dict):
+        max_length = config.get("max_length")
+
+        if max_length is not None and not (
+                isinstance(max_length, int) and
+                not isinstance(max_length, bool) and max_length >= 0):
+            raise InvalidFieldConfigException(
+                field_type=self.field_type_value,
+                message="max_length must be a non-negative integer"
+            )
+
+    def validate_default(self, config: dict, default_value):
+        max_length = config.get("max_length")
+
+        if max_length is not None and len(default_value) > max_length:
+            raise InvalidFieldDefaultValueException(
+                field_type=self.field_type_value,
+                message=f"Default value length {len(default_value)} exceeds max_length {max_length}"
+            )
+
+    def get_value_checks(self, config: dict) -> list:
+        checks = super().get_value_checks(config=config)
+        max_length = config.get("max_length")
+
+        if max_length is not None:
+            checks.append((TaskValueErrorEnum.TOO_LONG,
+                           lambda value: len(value) <= max_length))
+
+        return checks
+
+
+class NumberFieldValidator(FieldTypeValidator):
+
+    def __init__(self):
+        super().__init__(field_type=FieldTypeEnum.Number,
+                         config_keys={"min", "max"},
+                         default_type=(int, float))
+
+    def is_valid_default_type(self, default_value) -> bool:
+        return is_number(default_value)
+
+    def validate_config(self, config: dict):
+        for key in ("min", "max"):
+            if config.get(key) is not None and not is_number(config[key]):
+                raise InvalidFieldConfigException(
+                    field_type=self.field_type_value,
+                    message=f"{key} must be a number"
+                )
+
+        min_val = config.get("min")
+        max_val = config.get("max")
+
+        if min_val is not None and max_val is not None and min_val > max_val:
+            raise InvalidFieldConfigException(
+                field_type=self.field_type_value,
+                message=f"min {min_val} is greater than max {max_val}"
+            )
+
+    def validate_default(self, config: dict, default_value):
+        min_val = config.get("min")
+        max_val = config.get("max")
+
+        if min_val is not None and default_value < min_val:
+            raise InvalidFieldDefaultValueException(
+                field_type=self.field_type_value,
+                message=f"Default value {default_value} is less than minimum {min_val}"
+            )
+
+        if max_val is not None and default_value > max_val:
+            raise InvalidFieldDefaultValueException(
+                field_type=self.field_type_value,
+                message=f"Default value {default_value} is greater than maximum {max_val}"
+            )
+
+    def get_value_checks(self, config: dict) -> list:
+        checks = super().get_value_checks(config=config)
+        min_val = config.get("min")
+        max_val = config.get("max")
+
+        if min_val is not None:
+            checks.append((TaskValueErrorEnum.LESS_THAN_MIN,
+                           lambda value: value >= min_val))
+        if max_val is not None:
+            checks.append((TaskValueErrorEnum.GREATER_THAN_MAX,
+                           lambda value: value <= max_val))
+
+        return checks
+
+
+class DropdownFieldValidator(FieldTypeValidator):
+
+    def __init__(self):
+        super().__init__(field_type=FieldTypeEnum.Dropdown,
+                         config_keys={"options"}, default_type=str)
+
+    def validate_config(self, config: dict):
+        if not config.get("options"):
+            raise InvalidFieldConfigException(
+                field_type=self.field_type_value,
+                message="Dropdown must have non-empty options"
+            )
+
+        DropdownOptions.from_config(options=config["options"])
+
+    def validate_default(self, config: dict, default_value):
+        options = DropdownOptions.from_config(options=config["options"])
+
+        if default_value not in options:
+            raise InvalidFieldDefaultValueException(
+                field_type=self.field_type_value,
+                message="Default value must be one of dropdown options"
+            )
+
+    def get_value_checks(self, config: dict) -> list:
+        options = DropdownOptions.from_config(options=config["options"])
+
+        return [(TaskValueErrorEnum.INVALID_TYPE, self.is_valid_default_type),
+                (TaskValueErrorEnum.INVALID_OPTION, options.__contains__)]
+
+
+class EmailFieldValidator(FieldTypeValidator):
+
+    def __init__(self):
+        super().__init__(field_type=FieldTypeEnum.email, default_type=str)
+
+    def validate_default(self, config: dict, default_value):
+        if not is_valid_email(default_value):
+            raise InvalidFieldDefaultValueException(
+                field_type=self.field_type_value,
+                default_value=default_value
+            )
+
+    def get_value_checks(self, config: dict) -> list:
+        checks = super().get_value_checks(config=config)
+        checks.append((TaskValueErrorEnum.INVALID_EMAIL, is_valid_email))
+
+        return checks
+
+
+class DateFieldValidator(FieldTypeValidator):
+
+    def __init__(self):
+        super().__init__(field_type=FieldTypeEnum.Date, default_type=str)
+
+    def validate_default(self, config: dict, default_value):
+        if not is_valid_date(default_value):
+            raise InvalidFieldDefaultValueException(
+                field_type=self.field_type_value,
+                default_value=default_value
+            )
+
+    def get_value_checks(self, config: dict) -> list:
+        checks = super().get_value_checks(config=config)
+        checks.append((TaskValueErrorEnum.INVALID_DATE, is_valid_date))
+
+        return checks
+
+
+def is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_valid_email(value: str) -> bool:
+    return EMAIL_PATTERN.fullmatch(value) is not None
+
+
+def is_valid_date(value: str) -> bool:
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+
+    return True
+
+
+FIELD_TYPE_VALIDATORS = {}
+
+
+def register_field_type_validator(validator: FieldTypeValidator):
+    FIELD_TYPE_VALIDATORS[validator.field_type] = validator
+    FIELD_TYPE_VALIDATORS[validator.field_type_value] = validator
+
+
+def get_field_type_validator(field_type: FieldTypeEnum | str) -> \
+        FieldTypeValidator:
+    try:
+        return FIELD_TYPE_VALIDATORS[field_type]
+    except KeyError:
+        raise UnexpectedFieldTypeFoundException(
+            field_type=getattr(field_type, "value", field_type))
+
+
+register_field_type_validator(TextFieldValidator())
+register_field_type_validator(NumberFieldValidator())
+register_field_type_validator(DropdownFieldValidator())
+register_field_type_validator(
+    FieldTypeValidator(field_type=FieldTypeEnum.User, default_type=str))
+register_field_type_validator(DateFieldValidator())
+register_field_type_validator(
+    FieldTypeValidator(field_type=FieldTypeEnum.Checkbox, default_type=bool))
+register_field_type_validator(EmailFieldValidator())
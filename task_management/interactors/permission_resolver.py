@@ -0,0 +1,173 @@
+import threading
+import time
+from collections import OrderedDict
+
+from task_management.interactors.dtos import PermissionsEnum, \
+    PermissionActionEnum, PERMISSION_SCOPES
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+
+PERMISSION_ACTIONS = tuple(PermissionActionEnum)
+
+PERMISSION_LEVEL_ACTIONS = {
+    PermissionsEnum.ADMIN: frozenset(PermissionActionEnum),
+    PermissionsEnum.MEMBER: frozenset({PermissionActionEnum.VIEW,
+                                       PermissionActionEnum.CREATE,
+                                       PermissionActionEnum.UPDATE}),
+    PermissionsEnum.GUEST: frozenset({PermissionActionEnum.VIEW}),
+}
+
+DEFAULT_PERMISSION_TTL_SECONDS = 30
+DEFAULT_PERMISSION_CACHE_SIZE = 10000
+
+
+def get_permission_bit(scope: str, action: PermissionActionEnum) -> int:
+    return 1 << (PERMISSION_SCOPES.index(scope) * len(PERMISSION_ACTIONS) +
+                 PERMISSION_ACTIONS.index(action))
+
+
+PERMISSION_BITS = {
+    (scope, action): get_permission_bit(scope=scope, action=action)
+    for scope in PERMISSION_SCOPES
+    for action in PERMISSION_ACTIONS
+}
+
+
+def get_permission_mask(user_permissions: dict[str, PermissionsEnum]) -> int:
+    """
+    Packs a user's permission per scope into one integer with a bit per
+    scope and action.
+    """
+    mask = 0
+    for scope, permission in user_permissions.items():
+        for action in PERMISSION_LEVEL_ACTIONS[permission]:
+            mask |= PERMISSION_BITS[(scope, action)]
+
+    return mask
+
+
+class PermissionResolver(PermissionStorageInterface):
+    """
+    Process-wide cache of user permissions held as bitmasks.
+
+    A user's permissions are loaded once and kept for ``ttl_seconds`` or
+    until ``invalidate`` is called; the least recently used users are
+    evicted beyond ``max_size``. The resolver is itself a permission
+    storage, so interactors can use it in place of the one it wraps.
+
+    Nothing in this app writes permission rows, so a change made elsewhere
+    (admin, shell, another service) is only seen once the cached entry
+    expires, i.e. up to ``ttl_seconds`` later. Code that writes them in
+    this process should call ``invalidate`` once the write commits.
+
+    Every user has a generation counter that ``invalidate`` bumps while
+    loads are in flight; a load that raced an invalidation is returned but
+    never stored. The counters are dropped once no load is in flight.
+    """
+
+    def __init__(self, permission_storage: PermissionStorageInterface,
+                 ttl_seconds: float = DEFAULT_PERMISSION_TTL_SECONDS,
+                 max_size: int = DEFAULT_PERMISSION_CACHE_SIZE,
+                 clock=time.monotonic):
+        self.permission_storage = permission_storage
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._generation = 0
+        self._loads_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_user_access_permissions(self, user_id: str) -> \
+            dict[str, PermissionsEnum]:
+        return dict(self._get_entries(user_ids=[user_id])[user_id][1])
+
+    def get_users_access_permissions(self, user_ids: list[str]) -> \
+            dict[str, dict[str, PermissionsEnum]]:
+        entries = self._get_entries(user_ids=user_ids)
+
+        return {user_id: dict(entries[user_id][1]) for user_id in user_ids}
+
+    def get_permission_mask(self, user_id: str) -> int:
+        return self._get_entries(user_ids=[user_id])[user_id][0]
+
+    def can(self, user_id: str, action: PermissionActionEnum,
+            resource_ids: list[str], scope: str = "List") -> dict[str, bool]:
+        """
+        Returns for every resource of ``scope`` whether the user may perform
+        ``action`` on it. The user's permissions are resolved once for the
+        whole batch.
+        """
+        is_allowed = bool(self.get_permission_mask(user_id=user_id) &
+                          PERMISSION_BITS[(scope, action)])
+
+        return dict.fromkeys(resource_ids, is_allowed)
+
+    def invalidate(self, user_id: str):
+        with self._lock:
+            self._entries.pop(user_id, None)
+            if self._loads_in_flight:
+                self._generations[user_id] = \
+                    self._generations.get(user_id, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _get_entries(self, user_ids: list[str]) -> dict[str, tuple]:
+        now = self.clock()
+        entries = {}
+
+        with self._lock:
+            for user_id in user_ids:
+                entry = self._entries.get(user_id)
+                if entry is not None and entry[2] > now:
+                    self._entries.move_to_end(user_id)
+                    entries[user_id] = entry
+
+            missing_user_ids = [user_id for user_id in dict.fromkeys(user_ids)
+                                if user_id not in entries]
+            if not missing_user_ids:
+                return entries
+
+            generation = self._generation
+            user_generations = {
+                user_id: self._generations.get(user_id, 0)
+                for user_id in missing_user_ids}
+            self._loads_in_flight += 1
+
+        try:
+            users_permissions = \
+                self.permission_storage.get_users_access_permissions(
+                    user_ids=missing_user_ids)
+        except BaseException:
+            with self._lock:
+                self._end_load()
+            raise
+
+        expires_at = now + self.ttl_seconds
+
+        with self._lock:
+            for user_id in missing_user_ids:
+                user_permissions = users_permissions[user_id]
+                entry = (get_permission_mask(user_permissions=user_permissions),
+                         user_permissions, expires_at)
+                entries[user_id] = entry
+                if self._generation == generation and \
+                        self._generations.get(user_id, 0) == \
+                        user_generations[user_id]:
+                    self._entries[user_id] = entry
+                    self._entries.move_to_end(user_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._end_load()
+
+        return entries
+
+    def _end_load(self):
+        self._loads_in_flight -= 1
+        if not self._loads_in_flight:
+            self._generations.clear()
@@ -0,0 +1,78 @@
+from task_management.interactors.dtos import UserDTO
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+
+
+class CachedUserStorage(UserStorageInterface):
+
+    def __init__(self, user_storage: UserStorageInterface):
+        self.user_storage = user_storage
+        self._user_exists = {}
+
+    def check_user_exist(self, user_id: str) -> bool:
+        if user_id not in self._user_exists:
+            self._user_exists[user_id] = self.user_storage.check_user_exist(
+                user_id=user_id)
+
+        return self._user_exists[user_id]
+
+    def get_users(self, user_ids: list[str]) -> list[UserDTO]:
+        return self.user_storage.get_users(user_ids=user_ids)
+
+    def clear(self):
+        self._user_exists.clear()
+
+
+class CachedPermissionStorage(PermissionStorageInterface):
+
+    def __init__(self, permission_storage: PermissionStorageInterface):
+        self.permission_storage = permission_storage
+        self._user_permissions = {}
+
+    def get_user_access_permissions(self, user_id: str):
+        if user_id not in self._user_permissions:
+            self._user_permissions[user_id] = \
+                self.permission_storage.get_user_access_permissions(
+                    user_id=user_id)
+
+        return self._user_permissions[user_id]
+
+    def get_users_access_permissions(self, user_ids: list[str]) -> dict:
+        missing_user_ids = [user_id for user_id in user_ids
+                            if user_id not in self._user_permissions]
+        if missing_user_ids:
+            self._user_permissions.update(
+                self.permission_storage.get_users_access_permissions(
+                    user_ids=missing_user_ids))
+
+        return {user_id: self._user_permissions[user_id]
+                for user_id in user_ids}
+
+    def clear(self):
+        self._user_permissions.clear()
+
+
+class RequestScopedCache:
+    """
+    Unit of work that memoizes user and permission lookups.
+
+    Interactors built with ``user_storage`` and ``permission_storage`` from
+    an open scope resolve each user once, however many of them run. The
+    cached results are dropped when the scope exits, so permissions are
+    never served across requests.
+    """
+
+    def __init__(self, user_storage: UserStorageInterface,
+                 permission_storage: PermissionStorageInterface):
+        self.user_storage = CachedUserStorage(user_storage=user_storage)
+        self.permission_storage = CachedPermissionStorage(
+            permission_storage=permission_storage)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.user_storage.clear()
+        self.permission_storage.clear()
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+from task_management.interactors.dtos import CreateFieldDTO, FieldDTO, \
+    UpdateFieldDTO, TemplateFieldIndexDTO
+
+
+class AsyncFieldStorageInterface(ABC):
+
+    @abstractmethod
+    async def create_field(self, create_field_data: CreateFieldDTO) -> FieldDTO:
+        pass
+
+    @abstractmethod
+    async def bulk_create_fields(self,
+                                 create_fields_data: list[CreateFieldDTO]) -> \
+            list[FieldDTO]:
+        pass
+
+    @abstractmethod
+    async def get_field_by_idempotency_key(self, created_by: str,
+                                           idempotency_key: str) -> \
+            FieldDTO | None:
+        pass
+
+    @abstractmethod
+    async def get_template_field_index(self, template_id: str) -> \
+            TemplateFieldIndexDTO:
+        pass
+
+    @abstractmethod
+    async def update_field(self, update_field_data: UpdateFieldDTO) -> FieldDTO:
+        pass
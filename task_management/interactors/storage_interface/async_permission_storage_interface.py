@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncPermissionStorageInterface(ABC):
+
+    @abstractmethod
+    async def get_user_access_permissions(self, user_id: str):
+        pass
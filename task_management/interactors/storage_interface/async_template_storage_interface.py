@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+from task_management.interactors.dtos import TemplateDTO, CreateTemplateDTO
+
+
+class AsyncTemplateStorageInterface(ABC):
+
+    @abstractmethod
+    async def check_template_exist(self, template_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def create_template(self, template_data: CreateTemplateDTO) -> \
+            TemplateDTO:
+        pass
+
+    @abstractmethod
+    async def get_template_by_idempotency_key(self, created_by: str,
+                                              idempotency_key: str) -> \
+            TemplateDTO | None:
+        pass
+
+    @abstractmethod
+    async def check_template_name_exist(self, template_name: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def check_default_template_exist(self) -> bool:
+        pass
+
+    @abstractmethod
+    def atomic_transaction(self):
+        """Returns an async context manager."""
+        pass
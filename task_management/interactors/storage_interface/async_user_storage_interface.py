@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncUserStorageInterface(ABC):
+
+    @abstractmethod
+    async def check_user_exist(self, user_id: str) -> bool:
+        pass
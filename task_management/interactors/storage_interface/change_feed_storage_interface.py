@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from task_management.interactors.dtos import ChangeDTO
+
+
+class ChangeFeedStorageInterface(ABC):
+
+    @abstractmethod
+    def get_changes(self, since: int, limit: int) -> list[ChangeDTO]:
+        """
+        Returns up to ``limit`` changes with a sequence greater than
+        ``since``, oldest first.
+        """
+        pass
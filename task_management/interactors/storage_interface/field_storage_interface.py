@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 
 from task_management.interactors.dtos import CreateFieldDTO, FieldDTO, \
-    UpdateFieldDTO
+    UpdateFieldDTO, TemplateFieldIndexDTO
+from task_management.interactors.field_batch import FieldBatch
 
 
 class FieldStorageInterface(ABC):
@@ -11,11 +12,32 @@ class FieldStorageInterface(ABC):
         pass
 
     @abstractmethod
-    def check_field_name_exist(self, field_name: str,template_id: str) -> bool:
+    def bulk_create_fields(self, create_fields_data: list[CreateFieldDTO]) -> \
+            list[FieldDTO]:
         pass
 
     @abstractmethod
-    def check_field_order_exist(self, field_order: int, template_id: str) -> bool:
+    def get_field(self, field_id: str, template_id: str) -> FieldDTO | None:
+        pass
+
+    @abstractmethod
+    def get_field_by_idempotency_key(self, created_by: str,
+                                     idempotency_key: str) -> \
+            FieldDTO | None:
+        pass
+
+    @abstractmethod
+    def get_template_field_index(self, template_id: str) -> \
+            TemplateFieldIndexDTO:
+        pass
+
+    @abstractmethod
+    def get_templates_fields(self, template_ids: list[str]) -> list[FieldDTO]:
+        pass
+
+    @abstractmethod
+    def get_templates_field_batch(self, template_ids: list[str]) -> \
+            FieldBatch:
         pass
 
     @abstractmethod
@@ -23,10 +45,16 @@ class FieldStorageInterface(ABC):
         pass
 
     @abstractmethod
-    def check_field_exist(self,field_id: str, template_id: str) -> bool:
+    def patch_field(self, field_id: str, template_id: str, version: int,
+                    changes: dict) -> FieldDTO:
         pass
 
     @abstractmethod
-    def check_field_name_except_this_field(self,field_id: str , field_name: str, template_id: str) -> bool:
+    def update_field_config(self, field_id: str, template_id: str,
+                            config: dict, version: int) -> FieldDTO:
         pass
 
+    @abstractmethod
+    def update_field_orders(self, template_id: str,
+                            field_orders: dict[str, int]):
+        pass
@@ -5,4 +5,8 @@ class PermissionStorageInterface(ABC):
 
     @abstractmethod
     def get_user_access_permissions(self, user_id: str):
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_users_access_permissions(self, user_ids: list[str]) -> dict:
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from task_management.interactors.dtos import SearchResultDTO
+
+
+class SearchStorageInterface(ABC):
+
+    @abstractmethod
+    def search(self, terms: list[str], limit: int) -> list[SearchResultDTO]:
+        """
+        Returns up to ``limit`` templates and fields whose name or
+        description has a word starting with every one of ``terms``, best
+        match first. ``field_id`` is None for a template.
+        """
+        pass
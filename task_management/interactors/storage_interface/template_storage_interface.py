@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from task_management.interactors.dtos import TemplateDTO, CreateTemplateDTO
 
@@ -9,15 +10,52 @@ class TemplateStorageInterface(ABC):
     def check_template_exist(self, template_id: str) -> bool:
         pass
 
+    @abstractmethod
+    def get_templates(self, template_ids: list[str]) -> list[TemplateDTO]:
+        pass
+
+    @abstractmethod
+    def list_templates(self, offset: int, limit: int) -> list[TemplateDTO]:
+        pass
+
     @abstractmethod
     def create_template(self, template_data: CreateTemplateDTO) -> TemplateDTO:
         pass
 
+    @abstractmethod
+    def bulk_create_templates(self,
+                              templates_data: list[CreateTemplateDTO]) -> \
+            list[TemplateDTO]:
+        pass
+
+    @abstractmethod
+    def iter_template_chunks(self, chunk_size: int) -> \
+            Iterator[list[TemplateDTO]]:
+        pass
+
+    @abstractmethod
+    def get_template_by_idempotency_key(self, created_by: str,
+                                        idempotency_key: str) -> \
+            TemplateDTO | None:
+        pass
+
     @abstractmethod
     def check_template_name_exist(self,template_name: str) -> bool:
         pass
 
+    @abstractmethod
+    def get_existing_template_names(self, template_names: list[str]) -> \
+            set[str]:
+        pass
+
     @abstractmethod
     def check_default_template_exist(self)->bool:
         pass
 
+    @abstractmethod
+    def atomic_transaction(self):
+        pass
+
+    @abstractmethod
+    def is_in_transaction(self) -> bool:
+        pass
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
 
+from task_management.interactors.dtos import UserDTO
+
 
 class UserStorageInterface(ABC):
 
     @abstractmethod
     def check_user_exist(self,user_id: str) -> bool:
         pass
+
+    @abstractmethod
+    def get_users(self, user_ids: list[str]) -> list[UserDTO]:
+        pass
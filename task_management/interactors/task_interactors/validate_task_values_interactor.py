@@ -0,0 +1,28 @@
+from task_management.interactors.dtos import TaskValueErrorDTO
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.task_values_validator import \
+    TaskValuesValidatorCache, task_values_validator_cache
+
+
+class ValidateTaskValuesInteractor:
+
+    def __init__(self, template_storage: TemplateStorageInterface,
+                 field_storage: FieldStorageInterface,
+                 validator_cache: TaskValuesValidatorCache =
+                 task_values_validator_cache):
+        self.template_storage = template_storage
+        self.field_storage = field_storage
+        self.validator_cache = validator_cache
+
+    def validate_task_values(self, template_id: str,
+                             tasks_values: list[dict]) -> \
+            dict[int, list[TaskValueErrorDTO]]:
+        validator = self.validator_cache.get_validator(
+            template_id=template_id,
+            template_storage=self.template_storage,
+            field_storage=self.field_storage)
+
+        return validator.validate(tasks_values=tasks_values)
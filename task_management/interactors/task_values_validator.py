@@ -0,0 +1,129 @@
+import threading
+from collections import OrderedDict
+
+from task_management.interactors.dtos import FieldDTO, TaskValueErrorDTO, \
+    TaskValueErrorEnum
+from task_management.interactors.field_type_validators import \
+    get_field_type_validator
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.template_schema_cache import \
+    DEFAULT_TEMPLATE_SCHEMA_CACHE_SIZE, TemplateSchemaCache, \
+    template_schema_cache
+
+
+class TaskValuesValidator:
+    """
+    Validates the custom-field values of many tasks against one template.
+
+    The field rules are compiled once, when the validator is built, and are
+    then applied column by column: each check runs as a single pass over the
+    values of one field that have not failed an earlier check. Errors are
+    returned per task position; tasks without errors are left out.
+    """
+
+    def __init__(self, fields: list[FieldDTO]):
+        self.field_ids = frozenset(field.field_id for field in fields)
+        self.columns = [
+            (field.field_id, field.is_required,
+             get_field_type_validator(field_type=field.field_type)
+             .get_value_checks(config=field.config or {}))
+            for field in fields
+        ]
+
+    def validate(self, tasks_values: list[dict]) -> \
+            dict[int, list[TaskValueErrorDTO]]:
+        errors = {}
+        field_ids = self.field_ids
+
+        for position, task_values in enumerate(tasks_values):
+            for field_id in task_values.keys() - field_ids:
+                errors.setdefault(position, []).append(TaskValueErrorDTO(
+                    field_id=field_id,
+                    error=TaskValueErrorEnum.UNKNOWN_FIELD,
+                    value=task_values[field_id]))
+
+        for field_id, is_required, checks in self.columns:
+            column = [task_values.get(field_id)
+                      for task_values in tasks_values]
+            positions = [position for position, value in enumerate(column)
+                         if value is not None]
+
+            if is_required and len(positions) != len(column):
+                present_positions = set(positions)
+                for position in range(len(column)):
+                    if position not in present_positions:
+                        errors.setdefault(position, []).append(
+                            TaskValueErrorDTO(
+                                field_id=field_id,
+                                error=TaskValueErrorEnum.REQUIRED))
+
+            for error, is_valid in checks:
+                failed_positions = [position for position in positions
+                                    if not is_valid(column[position])]
+                if not failed_positions:
+                    continue
+
+                for position in failed_positions:
+                    errors.setdefault(position, []).append(TaskValueErrorDTO(
+                        field_id=field_id, error=error,
+                        value=column[position]))
+
+                failed_positions = set(failed_positions)
+                positions = [position for position in positions
+                             if position not in failed_positions]
+
+        return errors
+
+
+class TaskValuesValidatorCache:
+    """
+    LRU cache of compiled validators, one per template, keyed by the
+    template's version in ``schema_cache``. A write that bumps the version
+    invalidates the validator together with the schema. Like the schema
+    cache, nothing compiled inside a transaction is stored.
+    """
+
+    def __init__(self, schema_cache: TemplateSchemaCache,
+                 max_size: int = DEFAULT_TEMPLATE_SCHEMA_CACHE_SIZE):
+        self.schema_cache = schema_cache
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_validator(self, template_id: str,
+                      template_storage: TemplateStorageInterface,
+                      field_storage: FieldStorageInterface) -> \
+            TaskValuesValidator:
+        # The schema read below is at least as new as this version.
+        version = self.schema_cache.get_version(template_id=template_id)
+        with self._lock:
+            entry = self._entries.get(template_id)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(template_id)
+                return entry[1]
+
+        template_schema = self.schema_cache.get_template_schema(
+            template_id=template_id, template_storage=template_storage,
+            field_storage=field_storage)
+        validator = TaskValuesValidator(fields=template_schema.fields)
+        if template_storage.is_in_transaction():
+            return validator
+
+        with self._lock:
+            self._entries[template_id] = (version, validator)
+            self._entries.move_to_end(template_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return validator
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+task_values_validator_cache = TaskValuesValidatorCache(
+    schema_cache=template_schema_cache)
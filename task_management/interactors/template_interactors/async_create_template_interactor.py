@@ -0,0 +1,117 @@
+import asyncio
+
+from task_management.exceptions.custom_exceptions import \
+    DuplicateIdempotencyKeyException, AlreadyExistedTemplateNameException
+from task_management.interactors.default_fields_prototype import \
+    DefaultFieldsPrototype, default_fields_prototype
+from task_management.interactors.dtos import CreateTemplateDTO, TemplateDTO
+from task_management.interactors.storage_interface.async_field_storage_interface import \
+    AsyncFieldStorageInterface
+from task_management.interactors.storage_interface.async_permission_storage_interface import \
+    AsyncPermissionStorageInterface
+from task_management.interactors.storage_interface.async_template_storage_interface import \
+    AsyncTemplateStorageInterface
+from task_management.interactors.storage_interface.async_user_storage_interface import \
+    AsyncUserStorageInterface
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+class AsyncCreateTemplateInteractor(ValidationMixin):
+
+    def __init__(self, user_storage: AsyncUserStorageInterface,
+                 field_storage: AsyncFieldStorageInterface,
+                 permission_storage: AsyncPermissionStorageInterface,
+                 template_storage: AsyncTemplateStorageInterface,
+                 default_fields: DefaultFieldsPrototype =
+                 default_fields_prototype):
+        self.user_storage = user_storage
+        self.field_storage = field_storage
+        self.permission_storage = permission_storage
+        self.template_storage = template_storage
+        self.default_fields = default_fields
+
+    async def create_template(self, template_data: CreateTemplateDTO,
+                              collect_errors: bool = False) -> TemplateDTO:
+        """
+        With ``collect_errors`` every check runs and all failures are
+        raised together as ``ValidationErrorsException``.
+        """
+        if template_data.idempotency_key is None:
+            return await self._create_template(
+                template_data=template_data, collect_errors=collect_errors)
+
+        template = await self.get_idempotent_template(
+            template_data=template_data)
+        if template is not None:
+            return template
+
+        try:
+            return await self._create_template(
+                template_data=template_data, collect_errors=collect_errors)
+        except (DuplicateIdempotencyKeyException,
+                AlreadyExistedTemplateNameException):
+            template = await self.get_idempotent_template(
+                template_data=template_data)
+            if template is None:
+                raise
+            return template
+
+    async def get_idempotent_template(self,
+                                      template_data: CreateTemplateDTO) -> \
+            TemplateDTO | None:
+        template = await self.template_storage.get_template_by_idempotency_key(
+            created_by=template_data.created_by,
+            idempotency_key=template_data.idempotency_key)
+
+        if template is not None:
+            self.check_idempotent_template_matches(
+                template_data=template_data, template=template)
+
+        return template
+
+    async def _create_template(self, template_data: CreateTemplateDTO,
+                               collect_errors: bool) -> TemplateDTO:
+        errors = ValidationErrorCollector(collect=collect_errors)
+        user_id = template_data.created_by
+        lookups = [
+            self.user_storage.check_user_exist(user_id=user_id),
+            self.permission_storage.get_user_access_permissions(
+                user_id=user_id),
+            self.template_storage.check_template_name_exist(
+                template_name=template_data.name)
+        ]
+        if template_data.is_default:
+            lookups.append(self.template_storage.check_default_template_exist())
+
+        is_user_exist, user_permissions, is_name_exist, *is_default_exist = \
+            await asyncio.gather(*lookups)
+
+        if errors.run(self.check_user_found, user_id=user_id,
+                      is_exist=is_user_exist):
+            errors.run(self.check_user_permissions_allow_creation,
+                       user_id=user_id, user_permissions=user_permissions)
+        errors.run(self.check_template_name_available,
+                   template_name=template_data.name, is_exist=is_name_exist)
+        if template_data.is_default:
+            errors.run(self.check_default_template_available,
+                       template_name=template_data.name,
+                       is_exist=is_default_exist[0])
+        errors.raise_errors()
+
+        async with self.template_storage.atomic_transaction():
+            result = await self.template_storage.create_template(
+                template_data=template_data)
+            await self.create_template_default_fields(
+                template_id=result.template_id,
+                created_by=result.created_by
+            )
+
+        return result
+
+    async def create_template_default_fields(self, template_id: str,
+                                             created_by: str):
+        await self.field_storage.bulk_create_fields(
+            create_fields_data=self.default_fields.stamp(
+                template_id=template_id, created_by=created_by))
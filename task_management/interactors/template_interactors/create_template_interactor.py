@@ -1,7 +1,8 @@
-from task_management.interactors.dtos import CreateTemplateDTO, TemplateDTO, \
-    CreateFieldDTO, DEFAULT_FIELDS
-from task_management.interactors.field_interactors.create_field_interactor import \
-    CreateFieldInteractor
+from task_management.exceptions.custom_exceptions import \
+    DuplicateIdempotencyKeyException, AlreadyExistedTemplateNameException
+from task_management.interactors.default_fields_prototype import \
+    DefaultFieldsPrototype, default_fields_prototype
+from task_management.interactors.dtos import CreateTemplateDTO, TemplateDTO
 from task_management.interactors.storage_interface.field_storage_interface import \
     FieldStorageInterface
 from task_management.interactors.storage_interface.permission_storage_interface import \
@@ -10,6 +11,8 @@ from task_management.interactors.storage_interface.template_storage_interface im
     TemplateStorageInterface
 from task_management.interactors.storage_interface.user_storage_interface import \
     UserStorageInterface
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector
 from task_management.interactors.validation_mixin import ValidationMixin
 
 
@@ -18,55 +21,85 @@ class CreateTemplateInteractor(ValidationMixin):
     def __init__(self, user_storage: UserStorageInterface,
                  field_storage: FieldStorageInterface,
                  permission_storage: PermissionStorageInterface,
-                 template_storage: TemplateStorageInterface):
+                 template_storage: TemplateStorageInterface,
+                 default_fields: DefaultFieldsPrototype =
+                 default_fields_prototype):
         self.user_storage = user_storage
         self.field_storage = field_storage
         self.permission_storage = permission_storage
         self.template_storage = template_storage
+        self.default_fields = default_fields
 
-    def create_template(self, template_data: CreateTemplateDTO) -> TemplateDTO:
-        self.check_user_exist(user_id=template_data.created_by,
-                              user_storage=self.user_storage)
-        self.check_user_has_access_to_create_template(
-            user_id=template_data.created_by,
-            permission_storage=self.permission_storage)
-        self.check_already_existed_template_name(
-            template_name=template_data.name,
-            template_storage=self.template_storage)
-        if template_data.is_default:
-            self.check_default_template_exists(
-                template_name=template_data.name,
-                template_storage=self.template_storage)
+    def create_template(self, template_data: CreateTemplateDTO,
+                        collect_errors: bool = False) -> TemplateDTO:
+        """
+        With ``collect_errors`` every check runs and all failures are
+        raised together as ``ValidationErrorsException``.
+        """
+        if template_data.idempotency_key is None:
+            return self._create_template(template_data=template_data,
+                                         collect_errors=collect_errors)
 
-        with self.template_storage.atomic_transaction():
-            result = self.template_storage.create_template(template_data)
-            self.create_template_default_fields(
-                template_id=result.template_id,
-                created_by=result.created_by
-            )
+        template = self.get_idempotent_template(template_data=template_data)
+        if template is not None:
+            return template
 
+        try:
+            return self._create_template(template_data=template_data,
+                                         collect_errors=collect_errors)
+        except (DuplicateIdempotencyKeyException,
+                AlreadyExistedTemplateNameException):
+            # A concurrent request with the same key may have committed
+            # first; hand back its template instead of the conflict.
+            template = self.get_idempotent_template(
+                template_data=template_data)
+            if template is None:
+                raise
+            return template
 
-        return result
+    def get_idempotent_template(self, template_data: CreateTemplateDTO) -> \
+            TemplateDTO | None:
+        template = self.template_storage.get_template_by_idempotency_key(
+            created_by=template_data.created_by,
+            idempotency_key=template_data.idempotency_key)
 
-    def create_template_default_fields(self,template_id: str,created_by: str):
+        if template is not None:
+            self.check_idempotent_template_matches(
+                template_data=template_data, template=template)
 
-        create_field_interactor = CreateFieldInteractor(user_storage=self.user_storage,
-                                                        template_storage=self.template_storage,
-                                                        permission_storage=self.permission_storage,
-                                                        field_storage=self.field_storage)
+        return template
 
-        for field in DEFAULT_FIELDS:
-            create_field_dto = CreateFieldDTO(
-                field_type=field["field_type"],
-                field_name=field["field_name"],
-                description=field.get("description", ""),
-                template_id=template_id,
-                order=field["order"],
-                config=field.get("config", {}),
-                is_required=field.get("is_required", False),
-                created_by=created_by
-            )
+    def _create_template(self, template_data: CreateTemplateDTO,
+                         collect_errors: bool) -> TemplateDTO:
+        errors = ValidationErrorCollector(collect=collect_errors)
+        if errors.run(self.check_user_exist,
+                      user_id=template_data.created_by,
+                      user_storage=self.user_storage):
+            errors.run(self.check_user_has_access_to_create_template,
+                       user_id=template_data.created_by,
+                       permission_storage=self.permission_storage)
+        errors.run(self.check_already_existed_template_name,
+                   template_name=template_data.name,
+                   template_storage=self.template_storage)
+        if template_data.is_default:
+            errors.run(self.check_default_template_exists,
+                       template_name=template_data.name,
+                       template_storage=self.template_storage)
+        errors.raise_errors()
 
-            create_field_interactor.create_field(create_field_dto)
+        with self.template_storage.atomic_transaction():
+            result = self.template_storage.create_template(template_data)
+            self.create_template_default_fields(
+                template_id=result.template_id,
+                created_by=result.created_by)
 
+        return result
 
+    def create_template_default_fields(self, template_id: str,
+                                       created_by: str):
+        # The prototype was validated when it was built and the template
+        # has just been created inside this transaction, so the fields are
+        # inserted without re-running the create_field checks.
+        self.field_storage.bulk_create_fields(
+            create_fields_data=self.default_fields.stamp(
+                template_id=template_id, created_by=created_by))
@@ -0,0 +1,60 @@
+import json
+from typing import Iterator
+
+from task_management.interactors.dtos import TemplateDTO
+from task_management.interactors.field_batch import FieldBatch
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+
+DEFAULT_EXPORT_CHUNK_SIZE = 500
+
+
+class ExportTemplatesInteractor:
+    """
+    Streams every template with its fields as JSON Lines in the format
+    ``ImportTemplatesInteractor`` reads. The fields of each chunk of
+    templates are read as one ``FieldBatch`` and written straight from its
+    columns.
+    """
+
+    def __init__(self, template_storage: TemplateStorageInterface,
+                 field_storage: FieldStorageInterface):
+        self.template_storage = template_storage
+        self.field_storage = field_storage
+
+    def export_templates(self, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE) -> \
+            Iterator[str]:
+        for templates in self.template_storage.iter_template_chunks(
+                chunk_size=chunk_size):
+            field_batch = self.field_storage.get_templates_field_batch(
+                template_ids=[template.template_id for template in templates])
+            template_positions = field_batch.get_template_positions()
+
+            for template in templates:
+                yield json.dumps(self.get_template_line(
+                    template=template, field_batch=field_batch,
+                    positions=template_positions.get(template.template_id,
+                                                     []))) + "\n"
+
+    @staticmethod
+    def get_template_line(template: TemplateDTO, field_batch: FieldBatch,
+                          positions: list[int]) -> dict:
+        return {
+            "name": template.name,
+            "description": template.description,
+            "is_default": template.is_default,
+            "created_by": template.created_by,
+            "fields": [
+                {
+                    "field_type": field_batch.get_field_type(position).value,
+                    "field_name": field_batch.field_names[position],
+                    "description": field_batch.descriptions[position],
+                    "order": field_batch.orders[position],
+                    "config": field_batch.configs[position],
+                    "is_required": bool(field_batch.is_required[position]),
+                }
+                for position in positions
+            ],
+        }
@@ -0,0 +1,31 @@
+from task_management.interactors.dtos import ChangesPageDTO
+from task_management.interactors.storage_interface.change_feed_storage_interface import \
+    ChangeFeedStorageInterface
+
+DEFAULT_CHANGES_PAGE_SIZE = 100
+MAX_CHANGES_PAGE_SIZE = 1000
+
+
+class GetChangesInteractor:
+    """
+    Pages through the change feed of templates and fields. A consumer
+    starts from ``since=0`` and passes the returned ``next_since`` back to
+    get the next page; an empty page means it has caught up and can poll
+    again later with the same cursor.
+    """
+
+    def __init__(self, change_feed_storage: ChangeFeedStorageInterface):
+        self.change_feed_storage = change_feed_storage
+
+    def get_changes(self, since: int = 0,
+                    limit: int = DEFAULT_CHANGES_PAGE_SIZE) -> ChangesPageDTO:
+        since = max(since, 0)
+        limit = min(max(limit, 1), MAX_CHANGES_PAGE_SIZE)
+        changes = self.change_feed_storage.get_changes(since=since,
+                                                       limit=limit + 1)
+
+        return ChangesPageDTO(
+            changes=changes[:limit],
+            next_since=changes[:limit][-1].sequence if changes else since,
+            has_more=len(changes) > limit
+        )
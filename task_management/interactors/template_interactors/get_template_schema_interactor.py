@@ -0,0 +1,23 @@
+from task_management.interactors.dtos import TemplateSchemaDTO
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.template_schema_cache import \
+    TemplateSchemaCache, template_schema_cache
+
+
+class GetTemplateSchemaInteractor:
+
+    def __init__(self, template_storage: TemplateStorageInterface,
+                 field_storage: FieldStorageInterface,
+                 schema_cache: TemplateSchemaCache = template_schema_cache):
+        self.template_storage = template_storage
+        self.field_storage = field_storage
+        self.schema_cache = schema_cache
+
+    def get_template_schema(self, template_id: str) -> TemplateSchemaDTO:
+        return self.schema_cache.get_template_schema(
+            template_id=template_id,
+            template_storage=self.template_storage,
+            field_storage=self.field_storage)
@@ -0,0 +1,322 @@
+import json
+from contextlib import contextmanager
+from dataclasses import replace
+from itertools import islice
+from typing import Iterable
+
+from task_management.exceptions.custom_exceptions import \
+    InvalidTemplateImportLineException, TemplateImportErrorsException
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, ImportTemplatesResultDTO, TemplateFieldIndexDTO
+from task_management.interactors.default_fields_prototype import \
+    DefaultFieldsPrototype, default_fields_prototype
+from task_management.interactors.field_ordering import assign_field_orders
+from task_management.interactors.request_scoped_cache import \
+    RequestScopedCache
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector, is_domain_exception, get_exception_details
+from task_management.interactors.validation_mixin import ValidationMixin
+
+DEFAULT_IMPORT_CHUNK_SIZE = 500
+
+# Expected JSON types per key; required keys are listed separately. An
+# optional key may be left out, and the nullable ones may also be null.
+TEMPLATE_LINE_TYPES = {"name": str, "created_by": str, "description": str,
+                       "is_default": bool, "fields": list}
+TEMPLATE_LINE_REQUIRED_KEYS = ("name", "created_by")
+TEMPLATE_LINE_NULLABLE_KEYS = ("fields",)
+FIELD_LINE_TYPES = {"field_type": str, "field_name": str, "description": str,
+                    "order": int, "config": dict, "is_required": bool}
+FIELD_LINE_REQUIRED_KEYS = ("field_type", "field_name")
+FIELD_LINE_NULLABLE_KEYS = ("order",)
+
+
+class ImportTemplatesInteractor(ValidationMixin):
+    """
+    Imports templates with their fields from JSON Lines, one template per
+    line. Lines are parsed lazily and committed ``chunk_size`` templates per
+    transaction, so memory use does not grow with the input. A line without
+    ``fields`` gets the default fields.
+
+    A line that fails validation aborts the import; chunks committed before
+    it stay committed.
+    """
+
+    def __init__(self, user_storage: UserStorageInterface,
+                 field_storage: FieldStorageInterface,
+                 permission_storage: PermissionStorageInterface,
+                 template_storage: TemplateStorageInterface,
+                 default_fields: DefaultFieldsPrototype =
+                 default_fields_prototype):
+        self.user_storage = user_storage
+        self.field_storage = field_storage
+        self.permission_storage = permission_storage
+        self.template_storage = template_storage
+        self.default_fields = default_fields
+
+    def import_templates(self, lines: Iterable[str | bytes],
+                         chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+                         collect_errors: bool = False) -> \
+            ImportTemplatesResultDTO:
+        """
+        With ``collect_errors`` the import validates every line instead of
+        stopping at the first bad one, and raises all failures together as
+        ``TemplateImportErrorsException``, each with its ``line_number``.
+        No chunk is committed from the first failing chunk on; the
+        exception says how much was committed before it.
+        """
+        errors = ValidationErrorCollector(collect=collect_errors)
+        result = ImportTemplatesResultDTO(templates_count=0, fields_count=0)
+        has_default_template = False
+        uncommitted_names = set()
+        last_committed_line = 0
+        numbered_lines = (
+            (line_number, line)
+            for line_number, line in enumerate(lines, start=1)
+            if line.strip()
+        )
+
+        with RequestScopedCache(user_storage=self.user_storage,
+                                permission_storage=self.permission_storage) \
+                as request_cache:
+            while chunk := list(islice(numbered_lines, chunk_size)):
+                templates = self._parse_lines(lines=chunk, errors=errors)
+
+                has_default_template = self._validate_templates(
+                    templates=templates,
+                    has_default_template=has_default_template,
+                    request_cache=request_cache,
+                    uncommitted_names=uncommitted_names,
+                    errors=errors)
+                if errors.errors:
+                    uncommitted_names.update(template_data.name for _,
+                                             template_data, _ in templates)
+                    continue
+
+                fields_count = self._create_templates(templates=templates)
+
+                result.templates_count += len(templates)
+                result.fields_count += fields_count
+                last_committed_line = chunk[-1][0]
+
+        if errors.errors:
+            raise TemplateImportErrorsException(
+                errors=errors.errors, templates_count=result.templates_count,
+                fields_count=result.fields_count,
+                last_committed_line=last_committed_line)
+
+        return result
+
+    def _parse_lines(self, lines: list[tuple],
+                     errors: ValidationErrorCollector) -> list[tuple]:
+        templates = []
+        for line_number, line in lines:
+            try:
+                templates.append(self._parse_line(line_number=line_number,
+                                                  line=line))
+            except InvalidTemplateImportLineException as exc:
+                if not errors.collect:
+                    raise
+                errors.add_error(exception=exc)
+
+        return templates
+
+    def _validate_templates(self, templates: list[tuple],
+                            has_default_template: bool,
+                            request_cache: RequestScopedCache,
+                            uncommitted_names: set[str],
+                            errors: ValidationErrorCollector) -> bool:
+        existing_names = self.template_storage.get_existing_template_names(
+            template_names=[template_data.name
+                            for _, template_data, _ in templates])
+        existing_names |= uncommitted_names
+        if not has_default_template and any(
+                template_data.is_default for _, template_data, _ in templates):
+            has_default_template = \
+                self.template_storage.check_default_template_exist()
+
+        for line_number, template_data, fields in templates:
+            with _reraise_for_line(line_number=line_number), \
+                    errors.context(line_number=line_number):
+                if errors.run(self.check_user_exist,
+                              user_id=template_data.created_by,
+                              user_storage=request_cache.user_storage):
+                    errors.run(
+                        self.check_user_has_access_to_create_template,
+                        user_id=template_data.created_by,
+                        permission_storage=request_cache.permission_storage)
+                errors.run(self.check_template_name_available,
+                           template_name=template_data.name,
+                           is_exist=template_data.name in existing_names)
+                if template_data.is_default:
+                    errors.run(self.check_default_template_available,
+                               template_name=template_data.name,
+                               is_exist=has_default_template)
+                    has_default_template = True
+
+                self._validate_fields(fields=fields or [], errors=errors)
+
+            existing_names.add(template_data.name)
+
+        return has_default_template
+
+    def _validate_fields(self, fields: list[CreateFieldDTO],
+                         errors: ValidationErrorCollector):
+        field_index = TemplateFieldIndexDTO(
+            template_id="", field_ids=set(), field_names={},
+            field_orders={})
+
+        for position, field in enumerate(fields):
+            ft = field.field_type
+            field_type = ft.value if hasattr(ft, "value") else ft
+
+            with errors.context(position=position):
+                if errors.run(self.check_already_existed_field_name,
+                              field_name=field.field_name,
+                              field_index=field_index):
+                    field_index.field_names[field.field_name] = ""
+                if field.order is not None and errors.run(
+                        self.check_field_order_is_valid,
+                        field_order=field.order, field_index=field_index):
+                    field_index.field_orders[field.order] = ""
+                if errors.run(self.check_field_type, field_type=field_type):
+                    self.validate_field_config_and_default(
+                        field_type=field_type, config=field.config,
+                        collector=errors)
+
+    def _create_templates(self, templates: list[tuple]) -> int:
+        with self.template_storage.atomic_transaction():
+            created_templates = self.template_storage.bulk_create_templates(
+                templates_data=[template_data
+                                for _, template_data, _ in templates])
+
+            create_fields_data = []
+            for template, (_, _, fields) in zip(created_templates, templates):
+                if fields is None:
+                    fields = self.default_fields.stamp(
+                        template_id=template.template_id,
+                        created_by=template.created_by)
+                else:
+                    fields = [replace(field, template_id=template.template_id)
+                              for field in fields]
+                create_fields_data.extend(assign_field_orders(
+                    create_fields_data=fields,
+                    field_indexes={template.template_id: TemplateFieldIndexDTO(
+                        template_id=template.template_id, field_ids=set(),
+                        field_names={}, field_orders={})}))
+
+            if create_fields_data:
+                self.field_storage.bulk_create_fields(
+                    create_fields_data=create_fields_data)
+
+        return len(create_fields_data)
+
+    @staticmethod
+    def _parse_line(line_number: int, line: str | bytes) -> tuple:
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise InvalidTemplateImportLineException(
+                line_number=line_number, code="InvalidJSON",
+                details={"error": str(exc)})
+
+        error = _get_line_type_error(data=data)
+        if error is not None:
+            raise InvalidTemplateImportLineException(
+                line_number=line_number, code="InvalidTemplateLine",
+                details={"error": error})
+
+        template_data = CreateTemplateDTO(
+            name=data["name"],
+            description=data.get("description", ""),
+            is_default=data.get("is_default", False),
+            created_by=data["created_by"]
+        )
+        fields = data.get("fields")
+        if fields is not None:
+            fields = [
+                CreateFieldDTO(
+                    field_type=field["field_type"],
+                    field_name=field["field_name"],
+                    description=field.get("description", ""),
+                    template_id="",
+                    order=field.get("order"),
+                    config=field.get("config", {}),
+                    is_required=field.get("is_required", False),
+                    created_by=data["created_by"]
+                )
+                for field in fields
+            ]
+
+        return line_number, template_data, fields
+
+
+def _get_line_type_error(data) -> str | None:
+    """
+    Returns why a parsed line does not have the shape of a template, or
+    None if it does, so that later checks only ever see expected types.
+    """
+    if not isinstance(data, dict):
+        return "line must be a JSON object"
+
+    error = _get_type_error(data=data, types=TEMPLATE_LINE_TYPES,
+                            required_keys=TEMPLATE_LINE_REQUIRED_KEYS,
+                            nullable_keys=TEMPLATE_LINE_NULLABLE_KEYS)
+    if error is not None:
+        return error
+
+    for position, field in enumerate(data.get("fields") or ()):
+        if not isinstance(field, dict):
+            return f"fields[{position}] must be an object"
+
+        error = _get_type_error(data=field, types=FIELD_LINE_TYPES,
+                                required_keys=FIELD_LINE_REQUIRED_KEYS,
+                                nullable_keys=FIELD_LINE_NULLABLE_KEYS)
+        if error is not None:
+            return f"fields[{position}].{error}"
+
+    return None
+
+
+def _get_type_error(data: dict, types: dict, required_keys: tuple,
+                    nullable_keys: tuple = ()) -> str | None:
+    for key in required_keys:
+        if key not in data:
+            return f"{key} is required"
+
+    for key, expected_type in types.items():
+        if key not in data or data[key] is None and key in nullable_keys:
+            continue
+
+        value = data[key]
+        # bool is an int subclass, but true is not an order.
+        if not isinstance(value, expected_type) or \
+                isinstance(value, bool) and expected_type is not bool:
+            return f"{key} must be of type {expected_type.__name__}"
+
+    return None
+
+
+@contextmanager
+def _reraise_for_line(line_number: int):
+    """
+    Re-raises domain exceptions as ``InvalidTemplateImportLineException``
+    carrying the line they came from.
+    """
+    try:
+        yield
+    except Exception as exc:
+        if not is_domain_exception(exc):
+            raise
+
+        raise InvalidTemplateImportLineException(
+            line_number=line_number, code=type(exc).__name__,
+            details=get_exception_details(exc)) from exc
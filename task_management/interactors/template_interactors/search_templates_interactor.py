@@ -0,0 +1,30 @@
+import re
+
+from task_management.interactors.dtos import SearchResultDTO
+from task_management.interactors.storage_interface.search_storage_interface import \
+    SearchStorageInterface
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+_SEARCH_TERM = re.compile(r"\w+")
+
+
+class SearchTemplatesInteractor:
+    """
+    Ranked keyword search over template and field names and descriptions.
+    Every word of the query has to match the start of a word, so "bug tri"
+    finds "Bug triage".
+    """
+
+    def __init__(self, search_storage: SearchStorageInterface):
+        self.search_storage = search_storage
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> \
+            list[SearchResultDTO]:
+        terms = _SEARCH_TERM.findall(query)
+        if not terms:
+            return []
+
+        return self.search_storage.search(
+            terms=terms, limit=min(max(limit, 1), MAX_SEARCH_LIMIT))
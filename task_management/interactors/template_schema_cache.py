@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+
+from task_management.exceptions.custom_exceptions import \
+    TemplateNotFoundException
+from task_management.interactors.dtos import TemplateSchemaDTO
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+
+DEFAULT_TEMPLATE_SCHEMA_CACHE_SIZE = 1024
+
+
+class TemplateSchemaCache:
+    """
+    Read-through LRU cache of assembled template schemas.
+
+    Every template has a version counter that storages bump once a write
+    to the template or its fields commits. An entry is only served while
+    its version is current, and a schema loaded while a write committed is
+    never stored. Neither is one loaded inside a transaction, which may
+    still roll back.
+
+    The counters live in this process only and are kept for the
+    ``max_size`` most recently written templates. A forgotten counter
+    reads as the highest one forgotten so far, so it never goes back to a
+    version an in-flight load may have seen.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_TEMPLATE_SCHEMA_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._versions = OrderedDict()
+        self._forgotten_version = 0
+        self._lock = threading.Lock()
+
+    def get_template_schema(self, template_id: str,
+                            template_storage: TemplateStorageInterface,
+                            field_storage: FieldStorageInterface) -> \
+            TemplateSchemaDTO:
+        with self._lock:
+            version = self._get_version(template_id=template_id)
+            entry = self._entries.get(template_id)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(template_id)
+                return entry[1]
+
+        is_in_transaction = template_storage.is_in_transaction()
+        template_schema = self._load_template_schema(
+            template_id=template_id, template_storage=template_storage,
+            field_storage=field_storage)
+        if is_in_transaction:
+            return template_schema
+
+        with self._lock:
+            if self._get_version(template_id=template_id) == version:
+                self._entries[template_id] = (version, template_schema)
+                self._entries.move_to_end(template_id)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return template_schema
+
+    def bump_version(self, template_id: str):
+        with self._lock:
+            self._versions[template_id] = \
+                self._get_version(template_id=template_id) + 1
+            self._versions.move_to_end(template_id)
+            self._entries.pop(template_id, None)
+            while len(self._versions) > self.max_size:
+                _, version = self._versions.popitem(last=False)
+                self._forgotten_version = max(self._forgotten_version,
+                                              version)
+
+    def get_version(self, template_id: str) -> int:
+        with self._lock:
+            return self._get_version(template_id=template_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get_version(self, template_id: str) -> int:
+        return self._versions.get(template_id, self._forgotten_version)
+
+    @staticmethod
+    def _load_template_schema(template_id: str,
+                              template_storage: TemplateStorageInterface,
+                              field_storage: FieldStorageInterface) -> \
+            TemplateSchemaDTO:
+        templates = template_storage.get_templates(template_ids=[template_id])
+        if not templates:
+            raise TemplateNotFoundException(template_id=template_id)
+
+        fields = field_storage.get_templates_fields(template_ids=[template_id])
+
+        return TemplateSchemaDTO(
+            template=templates[0],
+            fields=sorted(fields, key=lambda field: field.order)
+        )
+
+
+template_schema_cache = TemplateSchemaCache()
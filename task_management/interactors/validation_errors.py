@@ -0,0 +1,66 @@
+from contextlib import contextmanager
+
+from task_management.exceptions import custom_exceptions
+from task_management.exceptions.custom_exceptions import \
+    ValidationErrorsException
+
+
+def is_domain_exception(exception: Exception) -> bool:
+    return type(exception).__module__ == custom_exceptions.__name__
+
+
+def get_exception_details(exception: Exception) -> dict:
+    return {key: value for key, value in vars(exception).items()
+            if key != "message"}
+
+
+class ValidationErrorCollector:
+    """
+    Runs validation checks either failing fast or collecting every domain
+    exception they raise, so an interactor has one code path for both
+    modes. Collected errors carry the exception name as ``code``, its
+    message and attributes, and the context open when it was raised, e.g.
+    the position of the field it is about.
+    """
+
+    def __init__(self, collect: bool = False):
+        self.collect = collect
+        self.errors = []
+        self._context = {}
+
+    def run(self, check, *args, **kwargs) -> bool:
+        """
+        Calls ``check`` and returns whether it passed. Only returns False
+        when collecting; otherwise the exception propagates.
+        """
+        try:
+            check(*args, **kwargs)
+        except Exception as exception:
+            if not self.collect or not is_domain_exception(exception):
+                raise
+
+            self.add_error(exception=exception)
+            return False
+
+        return True
+
+    def add_error(self, exception: Exception):
+        # An exception that carries its own ``code`` keeps it.
+        self.errors.append({"code": type(exception).__name__,
+                            "message": getattr(exception, "message",
+                                               str(exception)),
+                            **self._context,
+                            **get_exception_details(exception)})
+
+    @contextmanager
+    def context(self, **context):
+        previous_context = self._context
+        self._context = {**previous_context, **context}
+        try:
+            yield self
+        finally:
+            self._context = previous_context
+
+    def raise_errors(self):
+        if self.errors:
+            raise ValidationErrorsException(errors=self.errors)
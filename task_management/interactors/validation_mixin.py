@@ -1,51 +1,23 @@
 from task_management.exceptions.custom_exceptions import UserNotFoundException, \
     TemplateNotFoundException, UnexpectedFieldTypeFoundException, \
     FieldNameAlreadyExistsException, FieldOrderAlreadyExistsException, \
-    NotAccessToCreationException, FieldNotFoundException, \
-    InvalidFieldConfigException, InvalidFieldDefaultValueException, \
-    AlreadyExistedTemplateNameException, DefaultTemplateAlreadyExistedException
-from task_management.interactors.dtos import FieldTypeEnum, PermissionsEnum
-from task_management.interactors.storage_interface.field_storage_interface import \
-    FieldStorageInterface
+    NotAccessToCreationException, \
+    InvalidFieldsReorderException, \
+    AlreadyExistedTemplateNameException, \
+    DefaultTemplateAlreadyExistedException, IdempotencyKeyMismatchException
+from task_management.interactors.dtos import FieldTypeEnum, PermissionsEnum, \
+    TemplateFieldIndexDTO, CreateTemplateDTO, TemplateDTO, CreateFieldDTO, \
+    FieldDTO
+from task_management.interactors.field_type_validators import \
+    FIELD_TYPE_VALUES, get_field_type_validator
 from task_management.interactors.storage_interface.permission_storage_interface import \
     PermissionStorageInterface
 from task_management.interactors.storage_interface.template_storage_interface import \
     TemplateStorageInterface
 from task_management.interactors.storage_interface.user_storage_interface import \
     UserStorageInterface
-
-FIELD_TYPE_RULES = {
-    FieldTypeEnum.Text: {
-        "config_keys": {"max_length"},
-        "default_type": str,
-        "default_required": False,
-    },
-    FieldTypeEnum.Number: {
-        "config_keys": {"min", "max"},
-        "default_type": (int, float),
-        "default_required": False,
-    },
-    FieldTypeEnum.Dropdown: {
-        "config_keys": {"options"},
-        "default_type": str,
-        "default_required": False,
-    },
-    FieldTypeEnum.Date: {
-        "config_keys": set(),
-        "default_type": str,
-        "default_required": False,
-    },
-    FieldTypeEnum.Checkbox: {
-        "config_keys": set(),
-        "default_type": bool,
-        "default_required": False,
-    },
-    FieldTypeEnum.email: {
-        "config_keys": set(),
-        "default_type": str,
-        "default_required": False,
-    },
-}
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector
 
 
 class ValidationMixin:
@@ -54,6 +26,10 @@ class ValidationMixin:
     def check_user_exist(user_id: str, user_storage: UserStorageInterface):
         is_exist = user_storage.check_user_exist(user_id=user_id)
 
+        ValidationMixin.check_user_found(user_id=user_id, is_exist=is_exist)
+
+    @staticmethod
+    def check_user_found(user_id: str, is_exist: bool):
         if not is_exist:
             raise UserNotFoundException(user_id=user_id)
 
@@ -63,46 +39,121 @@ class ValidationMixin:
         is_exist = template_storage.check_template_exist(
             template_id=template_id)
 
+        ValidationMixin.check_template_found(template_id=template_id,
+                                             is_exist=is_exist)
+
+    @staticmethod
+    def check_template_found(template_id: str, is_exist: bool):
         if not is_exist:
             raise TemplateNotFoundException(template_id=template_id)
 
     @staticmethod
     def check_field_type(field_type: str):
 
-        field_types = [x.value for x in FieldTypeEnum]
-
-        if field_type not in field_types:
+        if field_type not in FIELD_TYPE_VALUES:
             raise UnexpectedFieldTypeFoundException(field_type=field_type)
 
     @staticmethod
-    def check_already_existed_field_name(field_name: str, template_id: str,
-                                         field_storage: FieldStorageInterface):
-        is_exist = field_storage.check_field_name_exist(field_name=field_name,
-                                                        template_id=template_id)
-
-        if is_exist:
+    def check_already_existed_field_name(field_name: str,
+                                         field_index: TemplateFieldIndexDTO):
+        if field_name in field_index.field_names:
             raise FieldNameAlreadyExistsException(field_name=field_name)
 
     @staticmethod
-    def check_field_name_exist(field_id: str, field_name: str,
-                               template_id: str,
-                               field_storage: FieldStorageInterface):
+    def check_already_existed_field_names(field_names: list[str],
+                                          field_index: TemplateFieldIndexDTO):
+        seen_names = set()
+        for field_name in field_names:
+            if field_name in seen_names or \
+                    field_name in field_index.field_names:
+                raise FieldNameAlreadyExistsException(field_name=field_name)
+            seen_names.add(field_name)
 
-        is_field_name_exist = field_storage.check_field_name_except_this_field(
-            field_id=field_id, field_name=field_name, template_id=template_id)
+    @staticmethod
+    def check_field_order_is_valid(field_order: int,
+                                   field_index: TemplateFieldIndexDTO,
+                                   field_id: str | None = None):
+        existing_field_id = field_index.field_orders.get(field_order)
 
-        if is_field_name_exist:
-            raise FieldNameAlreadyExistsException(field_name=field_name)
+        if existing_field_id is not None and existing_field_id != field_id:
+            raise FieldOrderAlreadyExistsException(field_order=field_order)
+
+    @staticmethod
+    def check_field_orders_are_valid(field_orders: list[int],
+                                     field_index: TemplateFieldIndexDTO):
+        seen_orders = set()
+        for field_order in field_orders:
+            if field_order in seen_orders or \
+                    field_order in field_index.field_orders:
+                raise FieldOrderAlreadyExistsException(field_order=field_order)
+            seen_orders.add(field_order)
 
     @staticmethod
-    def check_field_order_is_valid(field_order: int, template_id: str,
-                                   field_storage: FieldStorageInterface):
+    def check_batch_field_types(create_fields_data: list[CreateFieldDTO],
+                                collector: ValidationErrorCollector) -> \
+            list[str | None]:
+        """
+        Returns the type of every field in the batch as a string, or None
+        where the type is not valid.
+        """
+        field_types = []
+        for position, field in enumerate(create_fields_data):
+            ft = field.field_type
+            field_type = ft.value if hasattr(ft, "value") else ft
+            with collector.context(position=position):
+                is_valid_type = collector.run(
+                    ValidationMixin.check_field_type, field_type=field_type)
+            field_types.append(field_type if is_valid_type else None)
+
+        return field_types
 
-        is_exist = field_storage.check_field_order_exist(
-            field_order=field_order, template_id=template_id)
+    @staticmethod
+    def check_batch_fields(create_fields_data: list[CreateFieldDTO],
+                           field_indexes: dict[str, TemplateFieldIndexDTO],
+                           field_types: list[str | None],
+                           collector: ValidationErrorCollector):
+        # Each field is checked against the stored fields and the fields
+        # before it in the batch.
+        batch_indexes = {
+            template_id: TemplateFieldIndexDTO(
+                template_id=template_id, field_ids=set(),
+                field_names=dict(field_index.field_names),
+                field_orders=dict(field_index.field_orders))
+            for template_id, field_index in field_indexes.items()
+        }
+        for position, field in enumerate(create_fields_data):
+            batch_index = batch_indexes[field.template_id]
+            with collector.context(position=position):
+                if collector.run(
+                        ValidationMixin.check_already_existed_field_name,
+                        field_name=field.field_name,
+                        field_index=batch_index):
+                    batch_index.field_names[field.field_name] = ""
+                if collector.run(ValidationMixin.check_field_order_is_valid,
+                                 field_order=field.order,
+                                 field_index=batch_index):
+                    batch_index.field_orders[field.order] = ""
+
+        for position, field in enumerate(create_fields_data):
+            if field_types[position] is not None:
+                with collector.context(position=position):
+                    ValidationMixin.validate_field_config_and_default(
+                        field_type=field_types[position],
+                        config=field.config, collector=collector)
 
-        if is_exist:
-            raise FieldOrderAlreadyExistsException(field_order=field_order)
+    @staticmethod
+    def check_fields_reorder_is_valid(template_id: str, field_ids: list[str],
+                                      field_index: TemplateFieldIndexDTO):
+        requested_field_ids = set(field_ids)
+        missing_field_ids = field_index.field_ids - requested_field_ids
+        unknown_field_ids = requested_field_ids - field_index.field_ids
+
+        if missing_field_ids or unknown_field_ids or \
+                len(requested_field_ids) != len(field_ids):
+            raise InvalidFieldsReorderException(
+                template_id=template_id,
+                missing_field_ids=sorted(missing_field_ids),
+                unknown_field_ids=sorted(unknown_field_ids))
 
     @staticmethod
     def check_user_has_access_to_create_field(user_id: str,
@@ -111,96 +162,21 @@ class ValidationMixin:
         user_permissions = permission_storage.get_user_access_permissions(
             user_id=user_id)
 
-        if user_permissions == PermissionsEnum.GUEST:
-            raise NotAccessToCreationException(user_id=user_id)
+        ValidationMixin.check_user_permissions_allow_creation(
+            user_id=user_id, user_permissions=user_permissions)
 
     @staticmethod
-    def validate_field(field_id: str, template_id: str,
-                       field_storage: FieldStorageInterface):
-        is_exist = field_storage.check_field_exist(field_id=field_id,
-                                                   template_id=template_id)
+    def check_user_permissions_allow_creation(user_id: str,
+                                              user_permissions: dict):
+        if user_permissions['List'].value == PermissionsEnum.GUEST.value:
+            raise NotAccessToCreationException(user_id=user_id)
 
-        if not is_exist:
-            raise FieldNotFoundException(field_id=field_id)
-
-    @staticmethod
-    def validate_field_config_and_default(field_type: FieldTypeEnum,
-                                          config: dict):
-
-        if isinstance(field_type, FieldTypeEnum):
-            field_type_value = field_type
-        else:
-            try:
-                field_type_value = FieldTypeEnum(field_type)
-            except ValueError:
-                raise UnexpectedFieldTypeFoundException(
-                    field_type=field_type.value)
-
-        default_value = config.get("default")
-
-        if field_type_value not in FIELD_TYPE_RULES:
-            raise UnexpectedFieldTypeFoundException(
-                field_type=field_type_value.value
-            )
-
-        rules = FIELD_TYPE_RULES[field_type_value]
-
-        allowed_keys = rules["config_keys"]
-        invalid_keys = set(config.keys()) - allowed_keys
-
-        if invalid_keys:
-            raise InvalidFieldConfigException(
-                field_type=field_type.value,
-                invalid_keys=list(invalid_keys)
-            )
-
-        if field_type == FieldTypeEnum.Dropdown:
-            if "options" not in config or not config["options"]:
-                raise InvalidFieldConfigException(
-                    field_type=field_type.value,
-                    message="Dropdown must have non-empty options"
-                )
-
-        if default_value is not None:
-            expected_type = rules["default_type"]
-
-            if not isinstance(default_value, expected_type):
-                raise InvalidFieldDefaultValueException(
-                    field_type=field_type.value,
-                    default_value=default_value
-                )
-
-            if field_type == FieldTypeEnum.Dropdown:
-                if default_value not in config.get("options", []):
-                    raise InvalidFieldDefaultValueException(
-                        field_type=field_type.value,
-                        message="Default value must be one of dropdown options"
-                    )
-
-        if field_type_value == FieldTypeEnum.Number and default_value is not None:
-            min_val = config.get("min")
-            max_val = config.get("max")
-
-            if min_val is not None and default_value < min_val:
-                raise InvalidFieldDefaultValueException(
-                    field_type=field_type_value.value,
-                    message=f"Default value {default_value} is less than minimum {min_val}"
-                )
-
-            if max_val is not None and default_value > max_val:
-                raise InvalidFieldDefaultValueException(
-                    field_type=field_type_value.value,
-                    message=f"Default value {default_value} is greater than maximum {max_val}"
-                )
-
-        if field_type_value == FieldTypeEnum.Text and default_value is not None:
-            max_length = config.get("max_length")
-
-            if max_length is not None and len(default_value) > max_length:
-                raise InvalidFieldDefaultValueException(
-                    field_type=field_type_value.value,
-                    message=f"Default value length {len(default_value)} exceeds max_length {max_length}"
-                )
+    @staticmethod
+    def validate_field_config_and_default(
+            field_type: FieldTypeEnum | str, config: dict,
+            collector: ValidationErrorCollector | None = None):
+        validator = get_field_type_validator(field_type=field_type)
+        validator.validate(config=config, collector=collector)
 
     @staticmethod
     def check_already_existed_template_name(template_name: str,
@@ -209,6 +185,11 @@ class ValidationMixin:
         is_exist = template_storage.check_template_name_exist(
             template_name=template_name)
 
+        ValidationMixin.check_template_name_available(
+            template_name=template_name, is_exist=is_exist)
+
+    @staticmethod
+    def check_template_name_available(template_name: str, is_exist: bool):
         if is_exist:
             raise AlreadyExistedTemplateNameException(
                 template_name=template_name)
@@ -219,14 +200,34 @@ class ValidationMixin:
         user_permissions = permission_storage.get_user_access_permissions(
             user_id=user_id)
 
-        if user_permissions['List'].value == PermissionsEnum.GUEST.value:
-            raise NotAccessToCreationException(user_id=user_id)
+        ValidationMixin.check_user_permissions_allow_creation(
+            user_id=user_id, user_permissions=user_permissions)
 
     @staticmethod
     def check_default_template_exists(template_name: str,
                                       template_storage: TemplateStorageInterface):
         is_exist = template_storage.check_default_template_exist()
 
+        ValidationMixin.check_default_template_available(
+            template_name=template_name, is_exist=is_exist)
+
+    @staticmethod
+    def check_default_template_available(template_name: str, is_exist: bool):
         if is_exist:
             raise DefaultTemplateAlreadyExistedException(
                 template_name=template_name)
+
+    @staticmethod
+    def check_idempotent_template_matches(template_data: CreateTemplateDTO,
+                                          template: TemplateDTO):
+        if template.name != template_data.name:
+            raise IdempotencyKeyMismatchException(
+                idempotency_key=template_data.idempotency_key)
+
+    @staticmethod
+    def check_idempotent_field_matches(create_field_data: CreateFieldDTO,
+                                       field: FieldDTO):
+        if field.template_id != create_field_data.template_id or \
+                field.field_name != create_field_data.field_name:
+            raise IdempotencyKeyMismatchException(
+                idempotency_key=create_field_data.idempotency_key)
@@ -0,0 +1,28 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from task_management.container import container
+from task_management.interactors.template_interactors.export_templates_interactor import \
+    ExportTemplatesInteractor, DEFAULT_EXPORT_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = "Export every template with its fields as JSON Lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default="-",
+                            help="output file, '-' for stdout")
+        parser.add_argument("--chunk-size", type=int,
+                            default=DEFAULT_EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        interactor = container.get_interactor(ExportTemplatesInteractor)
+        lines = interactor.export_templates(chunk_size=options["chunk_size"])
+
+        if options["path"] == "-":
+            sys.stdout.writelines(lines)
+            return
+
+        with open(options["path"], "w") as output:
+            output.writelines(lines)
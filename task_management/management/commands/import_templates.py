@@ -0,0 +1,47 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_management.container import container
+from task_management.exceptions.custom_exceptions import \
+    InvalidTemplateImportLineException, TemplateImportErrorsException
+from task_management.interactors.template_interactors.import_templates_interactor import \
+    ImportTemplatesInteractor, DEFAULT_IMPORT_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = "Import templates with their fields from JSON Lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="input file, '-' for stdin")
+        parser.add_argument("--chunk-size", type=int,
+                            default=DEFAULT_IMPORT_CHUNK_SIZE,
+                            help="templates committed per transaction")
+        parser.add_argument("--collect-errors", action="store_true",
+                            help="report every invalid line, not just the "
+                                 "first")
+
+    def handle(self, *args, **options):
+        interactor = container.get_interactor(ImportTemplatesInteractor)
+        import_options = {"chunk_size": options["chunk_size"],
+                          "collect_errors": options["collect_errors"]}
+
+        try:
+            if options["path"] == "-":
+                result = interactor.import_templates(lines=sys.stdin,
+                                                     **import_options)
+            else:
+                with open(options["path"]) as lines:
+                    result = interactor.import_templates(lines=lines,
+                                                         **import_options)
+        except InvalidTemplateImportLineException as exc:
+            raise CommandError(f"{exc.message} {exc.details}") from exc
+        except TemplateImportErrorsException as exc:
+            raise CommandError("\n".join(
+                [exc.message] + [str(error) for error in exc.errors] +
+                [f"Imported {exc.templates_count} templates with "
+                 f"{exc.fields_count} fields through line "
+                 f"{exc.last_committed_line}."])) from exc
+
+        self.stdout.write(f"Imported {result.templates_count} templates "
+                          f"with {result.fields_count} fields.")
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:16
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('user_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('full_name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Template',
+            fields=[
+                ('template_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('is_default', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='templates', to='task_management.user')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Field',
+            fields=[
+                ('field_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('field_name', models.CharField(max_length=100)),
+                ('field_type', models.CharField(choices=[('dropdown', 'Dropdown'), ('user', 'User'), ('text', 'Text'), ('number', 'Number'), ('date', 'Date'), ('checkbox', 'Checkbox'), ('email', 'email')], max_length=20)),
+                ('description', models.TextField(blank=True)),
+                ('order', models.IntegerField()),
+                ('config', models.JSONField(blank=True, default=dict)),
+                ('is_required', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('template', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fields', to='task_management.template')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fields', to='task_management.user')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserPermission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('Workspace', 'Workspace'), ('Space', 'Space'), ('Folder', 'Folder'), ('List', 'List')], max_length=20)),
+                ('permission', models.CharField(choices=[('admin', 'ADMIN'), ('member', 'MEMBER'), ('guest', 'GUEST')], max_length=20)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='permissions', to='task_management.user')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='template',
+            constraint=models.UniqueConstraint(fields=('name',), name='unique_template_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='template',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_default', True)), fields=('is_default',), name='unique_default_template'),
+        ),
+        migrations.AddIndex(
+            model_name='field',
+            index=models.Index(fields=['template', 'order', 'field_name', 'field_id'], name='field_template_index_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='field',
+            constraint=models.UniqueConstraint(fields=('template', 'field_name'), name='unique_template_field_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='field',
+            constraint=models.UniqueConstraint(fields=('template', 'order'), name='unique_template_field_order'),
+        ),
+        migrations.AddConstraint(
+            model_name='userpermission',
+            constraint=models.UniqueConstraint(fields=('user', 'scope'), name='unique_user_permission_scope'),
+        ),
+    ]
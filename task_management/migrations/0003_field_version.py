@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_management', '0002_idempotency_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='field',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_management', '0003_field_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('sequence', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entity', models.CharField(choices=[('template', 'Template'), ('field', 'Field')], max_length=20)),
+                ('entity_id', models.UUIDField()),
+                ('template_id', models.UUIDField()),
+                ('operation', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated')], max_length=20)),
+                ('data', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
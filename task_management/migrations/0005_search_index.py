@@ -0,0 +1,107 @@
+from django.db import migrations
+
+# One FTS5 table per entity, keyed by the rowid of the row it indexes so
+# that the triggers update and delete index entries without a scan.
+SEARCH_INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE task_management_template_search USING fts5(
+        template_id UNINDEXED, name, description,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')
+    """,
+    """
+    CREATE VIRTUAL TABLE task_management_field_search USING fts5(
+        field_id UNINDEXED, template_id UNINDEXED, field_name, description,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')
+    """,
+    """
+    INSERT INTO task_management_template_search(
+        rowid, template_id, name, description)
+    SELECT rowid, template_id, name, description
+    FROM task_management_template
+    """,
+    """
+    INSERT INTO task_management_field_search(
+        rowid, field_id, template_id, field_name, description)
+    SELECT rowid, field_id, template_id, field_name, description
+    FROM task_management_field
+    """,
+    """
+    CREATE TRIGGER task_management_template_search_insert
+    AFTER INSERT ON task_management_template BEGIN
+        INSERT INTO task_management_template_search(
+            rowid, template_id, name, description)
+        VALUES (new.rowid, new.template_id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER task_management_template_search_update
+    AFTER UPDATE OF name, description ON task_management_template BEGIN
+        UPDATE task_management_template_search
+        SET name = new.name, description = new.description
+        WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER task_management_template_search_delete
+    AFTER DELETE ON task_management_template BEGIN
+        DELETE FROM task_management_template_search WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER task_management_field_search_insert
+    AFTER INSERT ON task_management_field BEGIN
+        INSERT INTO task_management_field_search(
+            rowid, field_id, template_id, field_name, description)
+        VALUES (new.rowid, new.field_id, new.template_id, new.field_name,
+                new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER task_management_field_search_update
+    AFTER UPDATE OF field_name, description ON task_management_field BEGIN
+        UPDATE task_management_field_search
+        SET field_name = new.field_name, description = new.description
+        WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER task_management_field_search_delete
+    AFTER DELETE ON task_management_field BEGIN
+        DELETE FROM task_management_field_search WHERE rowid = old.rowid;
+    END
+    """,
+]
+
+DROP_SEARCH_INDEX_SQL = [
+    "DROP TRIGGER IF EXISTS task_management_template_search_insert",
+    "DROP TRIGGER IF EXISTS task_management_template_search_update",
+    "DROP TRIGGER IF EXISTS task_management_template_search_delete",
+    "DROP TRIGGER IF EXISTS task_management_field_search_insert",
+    "DROP TRIGGER IF EXISTS task_management_field_search_update",
+    "DROP TRIGGER IF EXISTS task_management_field_search_delete",
+    "DROP TABLE IF EXISTS task_management_template_search",
+    "DROP TABLE IF EXISTS task_management_field_search",
+]
+
+
+def _run_sqlite(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_management', '0004_change_feed'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run_sqlite(SEARCH_INDEX_SQL),
+                             _run_sqlite(DROP_SEARCH_INDEX_SQL)),
+    ]
@@ -0,0 +1,86 @@
+import importlib
+
+from django.db import migrations
+
+TRIGGER_NAMES = [
+    "task_management_template_search_insert",
+    "task_management_template_search_update",
+    "task_management_template_search_delete",
+    "task_management_field_search_insert",
+    "task_management_field_search_update",
+    "task_management_field_search_delete",
+]
+
+# 0005 keyed the index rows on the rowids of the entity tables, which
+# table rebuilds renumber. Give every entity a rowid of its own in an
+# indexed side table and reindex under those rowids.
+REINDEX_SQL = [
+    *[f"DROP TRIGGER IF EXISTS {name}" for name in TRIGGER_NAMES],
+    """
+    CREATE TABLE task_management_search_rowid (
+        search_rowid INTEGER PRIMARY KEY,
+        entity_id char(32) NOT NULL UNIQUE)
+    """,
+    """
+    INSERT INTO task_management_search_rowid(entity_id)
+    SELECT template_id FROM task_management_template
+    UNION ALL
+    SELECT field_id FROM task_management_field
+    """,
+    "DELETE FROM task_management_template_search",
+    "DELETE FROM task_management_field_search",
+    """
+    INSERT INTO task_management_template_search(
+        rowid, template_id, name, description)
+    SELECT search_rowid, template_id, name, description
+    FROM task_management_template
+    JOIN task_management_search_rowid ON entity_id = template_id
+    """,
+    """
+    INSERT INTO task_management_field_search(
+        rowid, field_id, template_id, field_name, description)
+    SELECT search_rowid, field_id, template_id, field_name, description
+    FROM task_management_field
+    JOIN task_management_search_rowid ON entity_id = field_id
+    """,
+]
+
+DROP_ROWIDS_SQL = [
+    *[f"DROP TRIGGER IF EXISTS {name}" for name in TRIGGER_NAMES],
+    "DROP TABLE IF EXISTS task_management_search_rowid",
+    "DELETE FROM task_management_template_search",
+    "DELETE FROM task_management_field_search",
+]
+
+
+def reindex(apps, schema_editor):
+    from task_management.storages.search_storage import SEARCH_TRIGGERS_SQL
+
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for statement in REINDEX_SQL + SEARCH_TRIGGERS_SQL:
+        schema_editor.execute(statement)
+
+
+def restore_0005_index(apps, schema_editor):
+    search_index = importlib.import_module(
+        "task_management.migrations.0005_search_index")
+
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    # Everything after the two CREATE VIRTUAL TABLE statements.
+    for statement in DROP_ROWIDS_SQL + search_index.SEARCH_INDEX_SQL[2:]:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_management', '0005_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex, restore_0005_index),
+    ]
@@ -0,0 +1,5 @@
+from task_management.models.user import User
+from task_management.models.permission import PermissionScope, UserPermission
+from task_management.models.template import Template
+from task_management.models.field import Field
+from task_management.models.change import Change
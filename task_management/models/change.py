@@ -0,0 +1,28 @@
+from django.db import models
+
+from task_management.interactors.dtos import ChangeEntityEnum, \
+    ChangeOperationEnum
+
+
+class Change(models.Model):
+    """
+    One entry of the append-only change feed. Rows are written in the
+    transaction of the change they record and never updated; consumers
+    tail the feed by ``sequence``.
+    """
+
+    sequence = models.BigAutoField(primary_key=True)
+    entity = models.CharField(
+        max_length=20,
+        choices=[(entity.value, entity.name) for entity in ChangeEntityEnum])
+    entity_id = models.UUIDField()
+    template_id = models.UUIDField()
+    operation = models.CharField(
+        max_length=20,
+        choices=[(operation.value, operation.name)
+                 for operation in ChangeOperationEnum])
+    data = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sequence} {self.operation} {self.entity}"
@@ -0,0 +1,50 @@
+import uuid
+
+from django.db import models
+
+from task_management.interactors.dtos import FieldTypeEnum
+
+
+class Field(models.Model):
+    field_id = models.UUIDField(primary_key=True, default=uuid.uuid4,
+                                editable=False)
+    template = models.ForeignKey("task_management.Template",
+                                 on_delete=models.CASCADE,
+                                 related_name="fields")
+    field_name = models.CharField(max_length=100)
+    field_type = models.CharField(
+        max_length=20,
+        choices=[(field_type.value, field_type.name)
+                 for field_type in FieldTypeEnum])
+    description = models.TextField(blank=True)
+    order = models.IntegerField()
+    config = models.JSONField(default=dict, blank=True)
+    is_required = models.BooleanField(default=False)
+    created_by = models.ForeignKey("task_management.User",
+                                   on_delete=models.CASCADE,
+                                   related_name="fields")
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True)
+    version = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["template", "field_name"],
+                                    name="unique_template_field_name"),
+            models.UniqueConstraint(fields=["template", "order"],
+                                    name="unique_template_field_order"),
+            models.UniqueConstraint(
+                fields=["created_by", "idempotency_key"],
+                condition=models.Q(idempotency_key__isnull=False),
+                name="unique_field_idempotency_key"),
+        ]
+        indexes = [
+            # Covers get_template_field_index without touching the table.
+            models.Index(fields=["template", "order", "field_name",
+                                 "field_id"],
+                         name="field_template_index_idx"),
+        ]
+
+    def __str__(self):
+        return self.field_name
@@ -0,0 +1,30 @@
+from django.db import models
+
+from task_management.interactors.dtos import PermissionsEnum
+
+
+class PermissionScope(models.TextChoices):
+    WORKSPACE = "Workspace"
+    SPACE = "Space"
+    FOLDER = "Folder"
+    LIST = "List"
+
+
+class UserPermission(models.Model):
+    user = models.ForeignKey("task_management.User",
+                             on_delete=models.CASCADE,
+                             related_name="permissions")
+    scope = models.CharField(max_length=20, choices=PermissionScope.choices)
+    permission = models.CharField(
+        max_length=20,
+        choices=[(permission.value, permission.name)
+                 for permission in PermissionsEnum])
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "scope"],
+                                    name="unique_user_permission_scope"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.scope} {self.permission}"
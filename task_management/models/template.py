@@ -0,0 +1,33 @@
+import uuid
+
+from django.db import models
+
+
+class Template(models.Model):
+    template_id = models.UUIDField(primary_key=True, default=uuid.uuid4,
+                                   editable=False)
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    is_default = models.BooleanField(default=False)
+    created_by = models.ForeignKey("task_management.User",
+                                   on_delete=models.CASCADE,
+                                   related_name="templates")
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["name"],
+                                    name="unique_template_name"),
+            models.UniqueConstraint(fields=["is_default"],
+                                    condition=models.Q(is_default=True),
+                                    name="unique_default_template"),
+            models.UniqueConstraint(
+                fields=["created_by", "idempotency_key"],
+                condition=models.Q(idempotency_key__isnull=False),
+                name="unique_template_idempotency_key"),
+        ]
+
+    def __str__(self):
+        return self.name
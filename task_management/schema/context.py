@@ -0,0 +1,40 @@
+from task_management.container import RequestScope, container
+from task_management.schema.loaders import TemplateLoader, \
+    TemplateFieldsLoader, UserLoader, UserPermissionsLoader
+from task_management.storages.async_field_storage import AsyncFieldStorage
+from task_management.storages.async_permission_storage import \
+    AsyncPermissionStorage
+from task_management.storages.async_template_storage import \
+    AsyncTemplateStorage
+from task_management.storages.async_user_storage import AsyncUserStorage
+
+
+class GraphQLContext(RequestScope):
+    """
+    Per-request GraphQL context. Loaders live as long as the request, so
+    every template, field list, user and permission set is fetched at most
+    once and in one batch per resolver level.
+    """
+
+    def __init__(self, request):
+        super().__init__(container=container)
+        self.request = request
+        self.field_storage = container.get_storage("field_storage")
+        self.template_storage = container.get_storage("template_storage")
+
+        self.template_loader = TemplateLoader(
+            template_storage=self.template_storage)
+        self.template_fields_loader = TemplateFieldsLoader(
+            field_storage=self.field_storage)
+        self.user_loader = UserLoader(user_storage=self.user_storage)
+        self.user_permissions_loader = UserPermissionsLoader(
+            permission_storage=self.permission_storage)
+
+        self.async_field_storage = AsyncFieldStorage(
+            field_storage=self.field_storage)
+        self.async_template_storage = AsyncTemplateStorage(
+            template_storage=self.template_storage)
+        self.async_user_storage = AsyncUserStorage(
+            user_storage=self.user_storage)
+        self.async_permission_storage = AsyncPermissionStorage(
+            permission_storage=self.permission_storage)
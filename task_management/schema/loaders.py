@@ -0,0 +1,72 @@
+from aiodataloader import DataLoader
+from asgiref.sync import sync_to_async
+
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+
+
+class TemplateLoader(DataLoader):
+
+    def __init__(self, template_storage: TemplateStorageInterface):
+        super().__init__()
+        self.template_storage = template_storage
+
+    async def batch_load_fn(self, template_ids):
+        templates = await sync_to_async(self.template_storage.get_templates)(
+            template_ids=list(template_ids))
+        templates_by_id = {template.template_id: template
+                           for template in templates}
+
+        return [templates_by_id.get(template_id)
+                for template_id in template_ids]
+
+
+class TemplateFieldsLoader(DataLoader):
+
+    def __init__(self, field_storage: FieldStorageInterface):
+        super().__init__()
+        self.field_storage = field_storage
+
+    async def batch_load_fn(self, template_ids):
+        fields = await sync_to_async(self.field_storage.get_templates_fields)(
+            template_ids=list(template_ids))
+        fields_by_template = {template_id: [] for template_id in template_ids}
+        for field in fields:
+            fields_by_template[field.template_id].append(field)
+
+        return [fields_by_template[template_id]
+                for template_id in template_ids]
+
+
+class UserLoader(DataLoader):
+
+    def __init__(self, user_storage: UserStorageInterface):
+        super().__init__()
+        self.user_storage = user_storage
+
+    async def batch_load_fn(self, user_ids):
+        users = await sync_to_async(self.user_storage.get_users)(
+            user_ids=list(user_ids))
+        users_by_id = {user.user_id: user for user in users}
+
+        return [users_by_id.get(user_id) for user_id in user_ids]
+
+
+class UserPermissionsLoader(DataLoader):
+
+    def __init__(self, permission_storage: PermissionStorageInterface):
+        super().__init__()
+        self.permission_storage = permission_storage
+
+    async def batch_load_fn(self, user_ids):
+        users_permissions = await sync_to_async(
+            self.permission_storage.get_users_access_permissions)(
+            user_ids=list(user_ids))
+
+        return [users_permissions.get(user_id, {}) for user_id in user_ids]
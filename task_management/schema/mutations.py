@@ -0,0 +1,252 @@
+import graphene
+from asgiref.sync import sync_to_async
+from graphene.types.generic import GenericScalar
+from graphql import GraphQLError
+
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, UpdateFieldDTO, AddDropdownOptionsDTO, \
+    RemoveDropdownOptionsDTO, RenameDropdownOptionDTO, PatchFieldDTO
+from task_management.interactors.field_interactors.async_create_field_interactor import \
+    AsyncCreateFieldInteractor
+from task_management.interactors.field_interactors.async_update_field_interactor import \
+    AsyncUpdateFieldInteractor
+from task_management.interactors.field_interactors.dropdown_options_interactor import \
+    DropdownOptionsInteractor
+from task_management.interactors.field_interactors.reorder_fields_interactor import \
+    ReorderFieldsInteractor
+from task_management.interactors.field_interactors.update_field_interactor import \
+    UpdateFieldInteractor
+from task_management.interactors.template_interactors.async_create_template_interactor import \
+    AsyncCreateTemplateInteractor
+from task_management.interactors.validation_errors import \
+    is_domain_exception, get_exception_details
+from task_management.schema.types import TemplateNode, FieldNode, \
+    FieldTypeEnumType
+
+
+async def run_interactor(method, *args, **kwargs):
+    """
+    Awaits an async interactor method and reports domain exceptions as
+    GraphQL errors carrying the exception's attributes.
+    """
+    try:
+        return await method(*args, **kwargs)
+    except Exception as exc:
+        if not is_domain_exception(exc):
+            raise
+
+        extensions = {"code": type(exc).__name__,
+                      **get_exception_details(exc)}
+        raise GraphQLError(getattr(exc, "message", type(exc).__name__),
+                           extensions=extensions) from exc
+
+
+class CreateTemplateInput(graphene.InputObjectType):
+    name = graphene.String(required=True)
+    description = graphene.String(default_value="")
+    is_default = graphene.Boolean(default_value=False)
+    created_by = graphene.ID(required=True)
+    idempotency_key = graphene.String()
+
+
+class FieldInput(graphene.InputObjectType):
+    template_id = graphene.ID(required=True)
+    field_type = FieldTypeEnumType(required=True)
+    field_name = graphene.String(required=True)
+    description = graphene.String(default_value="")
+    config = GenericScalar(default_value={})
+    is_required = graphene.Boolean(default_value=False)
+    created_by = graphene.ID(required=True)
+
+
+class CreateFieldInput(FieldInput):
+    order = graphene.Int()
+    idempotency_key = graphene.String()
+
+
+class UpdateFieldInput(FieldInput):
+    field_id = graphene.ID(required=True)
+    order = graphene.Int(required=True)
+    version = graphene.Int(required=True)
+
+
+class PatchFieldInput(graphene.InputObjectType):
+    field_id = graphene.ID(required=True)
+    template_id = graphene.ID(required=True)
+    version = graphene.Int(required=True)
+    user_id = graphene.ID(required=True)
+    field_type = FieldTypeEnumType()
+    field_name = graphene.String()
+    description = graphene.String()
+    order = graphene.Int()
+    config = GenericScalar()
+    is_required = graphene.Boolean()
+
+
+class CreateTemplate(graphene.Mutation):
+    class Arguments:
+        template_data = CreateTemplateInput(required=True)
+        collect_errors = graphene.Boolean(default_value=False)
+
+    Output = TemplateNode
+
+    @staticmethod
+    async def mutate(root, info, template_data, collect_errors):
+        context = info.context
+        interactor = AsyncCreateTemplateInteractor(
+            user_storage=context.async_user_storage,
+            field_storage=context.async_field_storage,
+            permission_storage=context.async_permission_storage,
+            template_storage=context.async_template_storage
+        )
+
+        return await run_interactor(
+            interactor.create_template, CreateTemplateDTO(**template_data),
+            collect_errors=collect_errors)
+
+
+class CreateField(graphene.Mutation):
+    class Arguments:
+        field_data = CreateFieldInput(required=True)
+        collect_errors = graphene.Boolean(default_value=False)
+
+    Output = FieldNode
+
+    @staticmethod
+    async def mutate(root, info, field_data, collect_errors):
+        context = info.context
+        interactor = AsyncCreateFieldInteractor(
+            field_storage=context.async_field_storage,
+            user_storage=context.async_user_storage,
+            template_storage=context.async_template_storage,
+            permission_storage=context.async_permission_storage
+        )
+
+        return await run_interactor(
+            interactor.create_field, CreateFieldDTO(**field_data),
+            collect_errors=collect_errors)
+
+
+class UpdateField(graphene.Mutation):
+    class Arguments:
+        field_data = UpdateFieldInput(required=True)
+
+    Output = FieldNode
+
+    @staticmethod
+    async def mutate(root, info, field_data):
+        context = info.context
+        interactor = AsyncUpdateFieldInteractor(
+            user_storage=context.async_user_storage,
+            field_storage=context.async_field_storage,
+            permission_storage=context.async_permission_storage,
+            template_storage=context.async_template_storage
+        )
+
+        return await run_interactor(
+            interactor.update_field, UpdateFieldDTO(**field_data))
+
+
+class PatchField(graphene.Mutation):
+    class Arguments:
+        field_data = PatchFieldInput(required=True)
+
+    Output = FieldNode
+
+    @staticmethod
+    async def mutate(root, info, field_data):
+        interactor = info.context.get_interactor(UpdateFieldInteractor)
+
+        return await run_interactor(sync_to_async(interactor.patch_field),
+                                    PatchFieldDTO(**field_data))
+
+
+class ReorderFields(graphene.Mutation):
+    class Arguments:
+        template_id = graphene.ID(required=True)
+        field_ids = graphene.List(graphene.NonNull(graphene.ID), required=True)
+        user_id = graphene.ID(required=True)
+
+    Output = graphene.List(graphene.NonNull(FieldNode), required=True)
+
+    @staticmethod
+    async def mutate(root, info, template_id, field_ids, user_id):
+        context = info.context
+        interactor = context.get_interactor(ReorderFieldsInteractor)
+
+        await run_interactor(sync_to_async(interactor.reorder_fields),
+                             template_id, field_ids, user_id)
+
+        return await sync_to_async(context.field_storage.get_templates_fields)(
+            template_ids=[template_id])
+
+
+class AddDropdownOptions(graphene.Mutation):
+    class Arguments:
+        field_id = graphene.ID(required=True)
+        template_id = graphene.ID(required=True)
+        labels = graphene.List(graphene.NonNull(graphene.String),
+                               required=True)
+        version = graphene.Int(required=True)
+        user_id = graphene.ID(required=True)
+
+    Output = FieldNode
+
+    @staticmethod
+    async def mutate(root, info, **arguments):
+        interactor = info.context.get_interactor(DropdownOptionsInteractor)
+
+        return await run_interactor(
+            sync_to_async(interactor.add_dropdown_options),
+            AddDropdownOptionsDTO(**arguments))
+
+
+class RemoveDropdownOptions(graphene.Mutation):
+    class Arguments:
+        field_id = graphene.ID(required=True)
+        template_id = graphene.ID(required=True)
+        option_ids = graphene.List(graphene.NonNull(graphene.ID),
+                                   required=True)
+        version = graphene.Int(required=True)
+        user_id = graphene.ID(required=True)
+
+    Output = FieldNode
+
+    @staticmethod
+    async def mutate(root, info, **arguments):
+        interactor = info.context.get_interactor(DropdownOptionsInteractor)
+
+        return await run_interactor(
+            sync_to_async(interactor.remove_dropdown_options),
+            RemoveDropdownOptionsDTO(**arguments))
+
+
+class RenameDropdownOption(graphene.Mutation):
+    class Arguments:
+        field_id = graphene.ID(required=True)
+        template_id = graphene.ID(required=True)
+        option_id = graphene.ID(required=True)
+        label = graphene.String(required=True)
+        version = graphene.Int(required=True)
+        user_id = graphene.ID(required=True)
+
+    Output = FieldNode
+
+    @staticmethod
+    async def mutate(root, info, **arguments):
+        interactor = info.context.get_interactor(DropdownOptionsInteractor)
+
+        return await run_interactor(
+            sync_to_async(interactor.rename_dropdown_option),
+            RenameDropdownOptionDTO(**arguments))
+
+
+class Mutation(graphene.ObjectType):
+    create_template = CreateTemplate.Field()
+    create_field = CreateField.Field()
+    update_field = UpdateField.Field()
+    patch_field = PatchField.Field()
+    reorder_fields = ReorderFields.Field()
+    add_dropdown_options = AddDropdownOptions.Field()
+    remove_dropdown_options = RemoveDropdownOptions.Field()
+    rename_dropdown_option = RenameDropdownOption.Field()
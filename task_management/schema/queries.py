@@ -0,0 +1,30 @@
+import graphene
+from asgiref.sync import sync_to_async
+
+from task_management.schema.types import TemplateNode
+
+MAX_TEMPLATES_PAGE_SIZE = 100
+
+
+class Query(graphene.ObjectType):
+    template = graphene.Field(TemplateNode,
+                              template_id=graphene.ID(required=True))
+    templates = graphene.List(graphene.NonNull(TemplateNode), required=True,
+                              offset=graphene.Int(default_value=0),
+                              limit=graphene.Int(default_value=50))
+
+    @staticmethod
+    async def resolve_template(root, info, template_id):
+        return await info.context.template_loader.load(template_id)
+
+    @staticmethod
+    async def resolve_templates(root, info, offset, limit):
+        templates = await sync_to_async(
+            info.context.template_storage.list_templates)(
+            offset=max(offset, 0),
+            limit=min(max(limit, 0), MAX_TEMPLATES_PAGE_SIZE))
+
+        for template in templates:
+            info.context.template_loader.prime(template.template_id, template)
+
+        return templates
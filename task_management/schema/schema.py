@@ -0,0 +1,6 @@
+import graphene
+
+from task_management.schema.mutations import Mutation
+from task_management.schema.queries import Query
+
+schema = graphene.Schema(query=Query, mutation=Mutation)
@@ -0,0 +1,75 @@
+import graphene
+from graphene.types.generic import GenericScalar
+
+from task_management.interactors.dtos import FieldTypeEnum, PermissionsEnum
+
+FieldTypeEnumType = graphene.Enum.from_enum(FieldTypeEnum)
+PermissionsEnumType = graphene.Enum.from_enum(PermissionsEnum)
+
+
+class PermissionNode(graphene.ObjectType):
+    class Meta:
+        name = "Permission"
+
+    scope = graphene.String(required=True)
+    permission = graphene.Field(PermissionsEnumType, required=True)
+
+
+class UserNode(graphene.ObjectType):
+    class Meta:
+        name = "User"
+
+    user_id = graphene.ID(required=True)
+    full_name = graphene.String(required=True)
+    email = graphene.String(required=True)
+    permissions = graphene.List(graphene.NonNull(PermissionNode),
+                                required=True)
+
+    @staticmethod
+    async def resolve_permissions(root, info):
+        user_permissions = await info.context.user_permissions_loader.load(
+            root.user_id)
+
+        return [PermissionNode(scope=scope, permission=permission)
+                for scope, permission in user_permissions.items()]
+
+
+class FieldNode(graphene.ObjectType):
+    class Meta:
+        name = "Field"
+
+    field_id = graphene.ID(required=True)
+    template_id = graphene.ID(required=True)
+    field_type = graphene.Field(FieldTypeEnumType, required=True)
+    field_name = graphene.String(required=True)
+    description = graphene.String(required=True)
+    order = graphene.Int(required=True)
+    config = GenericScalar(required=True)
+    is_required = graphene.Boolean(required=True)
+    version = graphene.Int(required=True)
+    created_by = graphene.Field(UserNode)
+
+    @staticmethod
+    async def resolve_created_by(root, info):
+        return await info.context.user_loader.load(root.created_by)
+
+
+class TemplateNode(graphene.ObjectType):
+    class Meta:
+        name = "Template"
+
+    template_id = graphene.ID(required=True)
+    name = graphene.String(required=True)
+    description = graphene.String(required=True)
+    is_default = graphene.Boolean(required=True)
+    created_by = graphene.Field(UserNode)
+    fields = graphene.List(graphene.NonNull(FieldNode), required=True)
+
+    @staticmethod
+    async def resolve_created_by(root, info):
+        return await info.context.user_loader.load(root.created_by)
+
+    @staticmethod
+    async def resolve_fields(root, info):
+        return await info.context.template_fields_loader.load(
+            root.template_id)
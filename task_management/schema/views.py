@@ -0,0 +1,31 @@
+import json
+
+from django.http import JsonResponse, HttpResponseNotAllowed
+from django.views.decorators.csrf import csrf_exempt
+
+from task_management.schema.context import GraphQLContext
+from task_management.schema.schema import schema
+
+
+@csrf_exempt
+async def graphql_view(request):
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    try:
+        payload = json.loads(request.body or b"{}")
+    except json.JSONDecodeError:
+        return JsonResponse({"errors": [{"message": "Invalid JSON body"}]},
+                            status=400)
+
+    with GraphQLContext(request=request) as context:
+        result = await schema.execute_async(
+            payload.get("query"),
+            variable_values=payload.get("variables"),
+            operation_name=payload.get("operationName"),
+            context_value=context
+        )
+
+    return JsonResponse(result.formatted,
+                        status=400 if result.data is None and result.errors
+                        else 200)
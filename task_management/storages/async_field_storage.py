@@ -0,0 +1,42 @@
+from asgiref.sync import sync_to_async
+
+from task_management.interactors.dtos import CreateFieldDTO, FieldDTO, \
+    UpdateFieldDTO, TemplateFieldIndexDTO
+from task_management.interactors.storage_interface.async_field_storage_interface import \
+    AsyncFieldStorageInterface
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.storages.async_reads import sync_to_async_read
+
+
+class AsyncFieldStorage(AsyncFieldStorageInterface):
+
+    def __init__(self, field_storage: FieldStorageInterface):
+        self.field_storage = field_storage
+
+    async def create_field(self, create_field_data: CreateFieldDTO) -> FieldDTO:
+        return await sync_to_async(self.field_storage.create_field)(
+            create_field_data=create_field_data)
+
+    async def bulk_create_fields(self,
+                                 create_fields_data: list[CreateFieldDTO]) -> \
+            list[FieldDTO]:
+        return await sync_to_async(self.field_storage.bulk_create_fields)(
+            create_fields_data=create_fields_data)
+
+    async def get_field_by_idempotency_key(self, created_by: str,
+                                           idempotency_key: str) -> \
+            FieldDTO | None:
+        return await sync_to_async_read(
+            self.field_storage.get_field_by_idempotency_key)(
+            created_by=created_by, idempotency_key=idempotency_key)
+
+    async def get_template_field_index(self, template_id: str) -> \
+            TemplateFieldIndexDTO:
+        return await sync_to_async_read(
+            self.field_storage.get_template_field_index)(
+            template_id=template_id)
+
+    async def update_field(self, update_field_data: UpdateFieldDTO) -> FieldDTO:
+        return await sync_to_async(self.field_storage.update_field)(
+            update_field_data=update_field_data)
@@ -0,0 +1,16 @@
+from task_management.interactors.storage_interface.async_permission_storage_interface import \
+    AsyncPermissionStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.storages.async_reads import sync_to_async_read
+
+
+class AsyncPermissionStorage(AsyncPermissionStorageInterface):
+
+    def __init__(self, permission_storage: PermissionStorageInterface):
+        self.permission_storage = permission_storage
+
+    async def get_user_access_permissions(self, user_id: str):
+        return await sync_to_async_read(
+            self.permission_storage.get_user_access_permissions)(
+            user_id=user_id)
@@ -0,0 +1,41 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+_in_transaction = ContextVar("in_transaction", default=False)
+
+
+def sync_to_async_read(func):
+    """
+    Wraps a read-only storage call. Outside a transaction it runs on a
+    worker thread of its own, so that independent reads awaited together
+    with ``asyncio.gather`` overlap. Inside ``atomic_transaction`` it stays
+    on the request's sync thread, whose connection holds the transaction.
+
+    Worker threads open connections of their own that no request signal
+    ever closes, so each read closes them again, as Django does at the end
+    of a request, once it returns.
+    """
+    if _in_transaction.get():
+        return sync_to_async(func, thread_sensitive=True)
+
+    @wraps(func)
+    def read(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(read, thread_sensitive=False)
+
+
+@contextmanager
+def reads_in_transaction():
+    token = _in_transaction.set(True)
+    try:
+        yield
+    finally:
+        _in_transaction.reset(token)
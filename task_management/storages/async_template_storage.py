@@ -0,0 +1,60 @@
+import sys
+from contextlib import asynccontextmanager
+
+from asgiref.sync import sync_to_async
+
+from task_management.interactors.dtos import TemplateDTO, CreateTemplateDTO
+from task_management.interactors.storage_interface.async_template_storage_interface import \
+    AsyncTemplateStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.storages.async_reads import sync_to_async_read, \
+    reads_in_transaction
+
+
+class AsyncTemplateStorage(AsyncTemplateStorageInterface):
+
+    def __init__(self, template_storage: TemplateStorageInterface):
+        self.template_storage = template_storage
+
+    async def check_template_exist(self, template_id: str) -> bool:
+        return await sync_to_async_read(
+            self.template_storage.check_template_exist)(
+            template_id=template_id)
+
+    async def create_template(self, template_data: CreateTemplateDTO) -> \
+            TemplateDTO:
+        return await sync_to_async(self.template_storage.create_template)(
+            template_data=template_data)
+
+    async def get_template_by_idempotency_key(self, created_by: str,
+                                              idempotency_key: str) -> \
+            TemplateDTO | None:
+        return await sync_to_async_read(
+            self.template_storage.get_template_by_idempotency_key)(
+            created_by=created_by, idempotency_key=idempotency_key)
+
+    async def check_template_name_exist(self, template_name: str) -> bool:
+        return await sync_to_async_read(
+            self.template_storage.check_template_name_exist)(
+            template_name=template_name)
+
+    async def check_default_template_exist(self) -> bool:
+        return await sync_to_async_read(
+            self.template_storage.check_default_template_exist)()
+
+    @asynccontextmanager
+    async def atomic_transaction(self):
+        # Thread-sensitive sync_to_async calls of one request share a
+        # thread, so the transaction spans every storage call made inside;
+        # reads are kept on that thread too until the block exits.
+        atomic = self.template_storage.atomic_transaction()
+        await sync_to_async(atomic.__enter__)()
+        try:
+            with reads_in_transaction():
+                yield
+        except BaseException:
+            if not await sync_to_async(atomic.__exit__)(*sys.exc_info()):
+                raise
+        else:
+            await sync_to_async(atomic.__exit__)(None, None, None)
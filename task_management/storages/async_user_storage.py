@@ -0,0 +1,15 @@
+from task_management.interactors.storage_interface.async_user_storage_interface import \
+    AsyncUserStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.storages.async_reads import sync_to_async_read
+
+
+class AsyncUserStorage(AsyncUserStorageInterface):
+
+    def __init__(self, user_storage: UserStorageInterface):
+        self.user_storage = user_storage
+
+    async def check_user_exist(self, user_id: str) -> bool:
+        return await sync_to_async_read(self.user_storage.check_user_exist)(
+            user_id=user_id)
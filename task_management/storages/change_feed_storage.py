@@ -0,0 +1,57 @@
+from task_management.interactors.change_feed import \
+    get_template_change_data, get_field_change_data
+from task_management.interactors.dtos import ChangeDTO, ChangeEntityEnum, \
+    ChangeOperationEnum, TemplateDTO, FieldDTO
+from task_management.interactors.storage_interface.change_feed_storage_interface import \
+    ChangeFeedStorageInterface
+from task_management.models import Change
+
+
+class ChangeFeedStorage(ChangeFeedStorageInterface):
+
+    def get_changes(self, since: int, limit: int) -> list[ChangeDTO]:
+        changes = Change.objects.filter(sequence__gt=since).order_by(
+            "sequence")[:limit]
+
+        return [self._get_change_dto(change=change) for change in changes]
+
+    @staticmethod
+    def append_template_changes(templates: list[TemplateDTO],
+                                operation: ChangeOperationEnum):
+        """
+        Must be called inside the transaction that wrote ``templates``.
+        """
+        Change.objects.bulk_create([
+            Change(entity=ChangeEntityEnum.Template.value,
+                   entity_id=template.template_id,
+                   template_id=template.template_id,
+                   operation=operation.value,
+                   data=get_template_change_data(template=template))
+            for template in templates
+        ])
+
+    @staticmethod
+    def append_field_changes(fields: list[FieldDTO],
+                             operation: ChangeOperationEnum):
+        """
+        Must be called inside the transaction that wrote ``fields``.
+        """
+        Change.objects.bulk_create([
+            Change(entity=ChangeEntityEnum.Field.value,
+                   entity_id=field.field_id,
+                   template_id=field.template_id,
+                   operation=operation.value,
+                   data=get_field_change_data(field=field))
+            for field in fields
+        ])
+
+    @staticmethod
+    def _get_change_dto(change: Change) -> ChangeDTO:
+        return ChangeDTO(
+            sequence=change.sequence,
+            entity=ChangeEntityEnum(change.entity),
+            entity_id=str(change.entity_id),
+            template_id=str(change.template_id),
+            operation=ChangeOperationEnum(change.operation),
+            data=change.data
+        )
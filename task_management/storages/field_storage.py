@@ -0,0 +1,356 @@
+from functools import partial
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from task_management.exceptions.custom_exceptions import \
+    FieldNameAlreadyExistsException, FieldOrderAlreadyExistsException, \
+    FieldNotFoundException, DuplicateIdempotencyKeyException, \
+    FieldVersionConflictException
+from task_management.interactors.dtos import CreateFieldDTO, FieldDTO, \
+    UpdateFieldDTO, TemplateFieldIndexDTO, FieldTypeEnum, ChangeOperationEnum
+from task_management.interactors.field_batch import FieldBatch
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.template_schema_cache import \
+    template_schema_cache
+from task_management.models import Field
+from task_management.storages.change_feed_storage import ChangeFeedStorage
+from task_management.storages.uuids import parse_uuid, parse_uuids
+
+
+class FieldStorage(FieldStorageInterface):
+
+    def create_field(self, create_field_data: CreateFieldDTO) -> FieldDTO:
+        field = self._get_field_object(create_field_data=create_field_data)
+
+        try:
+            with transaction.atomic():
+                field.save(force_insert=True)
+                field_dto = self._get_field_dto(field=field)
+                ChangeFeedStorage.append_field_changes(
+                    fields=[field_dto], operation=ChangeOperationEnum.Created)
+        except IntegrityError:
+            self._raise_field_conflict(fields_data=[create_field_data])
+            raise
+
+        self._invalidate_template_schemas(
+            template_ids=[create_field_data.template_id])
+        return field_dto
+
+    def bulk_create_fields(self, create_fields_data: list[CreateFieldDTO]) -> \
+            list[FieldDTO]:
+        fields = [self._get_field_object(create_field_data=field_data)
+                  for field_data in create_fields_data]
+
+        try:
+            with transaction.atomic():
+                Field.objects.bulk_create(fields)
+                field_dtos = [self._get_field_dto(field=field)
+                              for field in fields]
+                ChangeFeedStorage.append_field_changes(
+                    fields=field_dtos, operation=ChangeOperationEnum.Created)
+        except IntegrityError:
+            self._raise_field_conflict(fields_data=create_fields_data)
+            raise
+
+        self._invalidate_template_schemas(
+            template_ids=[field.template_id for field in create_fields_data])
+        return field_dtos
+
+    def get_field(self, field_id: str, template_id: str) -> FieldDTO | None:
+        if not self._is_field_key(field_id=field_id, template_id=template_id):
+            return None
+
+        field = Field.objects.filter(field_id=field_id,
+                                     template_id=template_id).first()
+
+        return None if field is None else self._get_field_dto(field=field)
+
+    def get_field_by_idempotency_key(self, created_by: str,
+                                     idempotency_key: str) -> \
+            FieldDTO | None:
+        created_by = parse_uuid(created_by)
+        if created_by is None:
+            return None
+
+        field = Field.objects.filter(
+            created_by_id=created_by, idempotency_key=idempotency_key).first()
+
+        return None if field is None else self._get_field_dto(field=field)
+
+    def get_template_field_index(self, template_id: str) -> \
+            TemplateFieldIndexDTO:
+        rows = Field.objects.filter(
+            template_id__in=parse_uuids([template_id])).values_list(
+            "field_id", "field_name", "order")
+
+        field_ids = set()
+        field_names = {}
+        field_orders = {}
+        for field_id, field_name, order in rows:
+            field_id = str(field_id)
+            field_ids.add(field_id)
+            field_names[field_name] = field_id
+            field_orders[order] = field_id
+
+        return TemplateFieldIndexDTO(
+            template_id=template_id,
+            field_ids=field_ids,
+            field_names=field_names,
+            field_orders=field_orders
+        )
+
+    def get_templates_fields(self, template_ids: list[str]) -> list[FieldDTO]:
+        fields = Field.objects.filter(
+            template_id__in=parse_uuids(template_ids)).order_by(
+            "template_id", "order")
+
+        return [self._get_field_dto(field=field) for field in fields]
+
+    def get_templates_field_batch(self, template_ids: list[str]) -> \
+            FieldBatch:
+        rows = Field.objects.filter(
+            template_id__in=parse_uuids(template_ids)).order_by(
+            "template_id", "order").values_list(
+            "field_id", "template_id", "field_name", "description",
+            "field_type", "order", "config", "is_required", "created_by_id",
+            "version")
+
+        batch = FieldBatch()
+        for field_id, template_id, field_name, description, field_type, \
+                order, config, is_required, created_by, version \
+                in rows.iterator():
+            batch.append(field_id=str(field_id), template_id=str(template_id),
+                         field_name=field_name, description=description,
+                         field_type=field_type, order=order, config=config,
+                         is_required=is_required, created_by=str(created_by),
+                         version=version)
+
+        return batch
+
+    def update_field(self, update_field_data: UpdateFieldDTO) -> FieldDTO:
+        self._check_field_key(field_id=update_field_data.field_id,
+                              template_id=update_field_data.template_id)
+        ft = update_field_data.field_type
+
+        try:
+            with transaction.atomic():
+                updated_count = Field.objects.filter(
+                    field_id=update_field_data.field_id,
+                    template_id=update_field_data.template_id,
+                    version=update_field_data.version
+                ).update(
+                    field_name=update_field_data.field_name,
+                    field_type=ft.value if hasattr(ft, "value") else ft,
+                    description=update_field_data.description,
+                    order=update_field_data.order,
+                    config=update_field_data.config,
+                    is_required=update_field_data.is_required,
+                    version=F("version") + 1
+                )
+                field = self._get_updated_field(
+                    updated_count=updated_count,
+                    field_id=update_field_data.field_id)
+        except IntegrityError:
+            self._raise_field_conflict(fields_data=[update_field_data])
+            raise
+
+        if field is None:
+            self._raise_field_update_miss(
+                field_id=update_field_data.field_id,
+                template_id=update_field_data.template_id,
+                version=update_field_data.version)
+
+        self._invalidate_template_schemas(
+            template_ids=[update_field_data.template_id])
+        return field
+
+    def patch_field(self, field_id: str, template_id: str, version: int,
+                    changes: dict) -> FieldDTO:
+        self._check_field_key(field_id=field_id, template_id=template_id)
+        changes = dict(changes)
+        if "field_type" in changes:
+            ft = changes["field_type"]
+            changes["field_type"] = ft.value if hasattr(ft, "value") else ft
+
+        try:
+            with transaction.atomic():
+                updated_count = Field.objects.filter(
+                    field_id=field_id, template_id=template_id,
+                    version=version
+                ).update(version=F("version") + 1, **changes)
+                field = self._get_updated_field(updated_count=updated_count,
+                                                field_id=field_id)
+        except IntegrityError:
+            self._raise_field_index_conflict(
+                field_index=self.get_template_field_index(
+                    template_id=template_id),
+                field_id=field_id, field_name=changes.get("field_name"),
+                field_order=changes.get("order"))
+            raise
+
+        if field is None:
+            self._raise_field_update_miss(field_id=field_id,
+                                          template_id=template_id,
+                                          version=version)
+
+        self._invalidate_template_schemas(template_ids=[template_id])
+        return field
+
+    def update_field_config(self, field_id: str, template_id: str,
+                            config: dict, version: int) -> FieldDTO:
+        self._check_field_key(field_id=field_id, template_id=template_id)
+        with transaction.atomic():
+            updated_count = Field.objects.filter(
+                field_id=field_id, template_id=template_id, version=version
+            ).update(config=config, version=F("version") + 1)
+            field = self._get_updated_field(updated_count=updated_count,
+                                            field_id=field_id)
+
+        if field is None:
+            self._raise_field_update_miss(field_id=field_id,
+                                          template_id=template_id,
+                                          version=version)
+
+        self._invalidate_template_schemas(template_ids=[template_id])
+        return field
+
+    def update_field_orders(self, template_id: str,
+                            field_orders: dict[str, int]):
+        fields = [Field(field_id=field_id, template_id=template_id)
+                  for field_id in field_orders]
+
+        with transaction.atomic():
+            # Park the moved fields on negative orders first so that no
+            # row collides with the unique (template, order) constraint
+            # while the new orders are written.
+            for field in fields:
+                field.order = -field_orders[field.field_id]
+            Field.objects.bulk_update(fields, ["order"])
+
+            for field in fields:
+                field.order = field_orders[field.field_id]
+                field.version = F("version") + 1
+            Field.objects.bulk_update(fields, ["order", "version"])
+
+            ChangeFeedStorage.append_field_changes(
+                fields=[self._get_field_dto(field=field) for field in
+                        Field.objects.filter(field_id__in=field_orders)],
+                operation=ChangeOperationEnum.Updated)
+
+        self._invalidate_template_schemas(template_ids=[template_id])
+
+    def _raise_field_conflict(self, fields_data: list):
+        """
+        Maps a unique constraint violation back to the domain exception.
+        Only runs after the database has rejected the write.
+        """
+        field_indexes = {}
+        for field_data in fields_data:
+            template_id = field_data.template_id
+            if template_id not in field_indexes:
+                field_indexes[template_id] = self.get_template_field_index(
+                    template_id=template_id)
+            field_index = field_indexes[template_id]
+            field_id = getattr(field_data, "field_id", None)
+            idempotency_key = getattr(field_data, "idempotency_key", None)
+
+            if idempotency_key is not None and \
+                    self.get_field_by_idempotency_key(
+                        created_by=field_data.created_by,
+                        idempotency_key=idempotency_key) is not None:
+                raise DuplicateIdempotencyKeyException(
+                    idempotency_key=idempotency_key)
+
+            self._raise_field_index_conflict(
+                field_index=field_index, field_id=field_id,
+                field_name=field_data.field_name,
+                field_order=field_data.order)
+
+    @staticmethod
+    def _raise_field_index_conflict(field_index: TemplateFieldIndexDTO,
+                                    field_id: str | None,
+                                    field_name: str | None,
+                                    field_order: int | None):
+        existing_field_id = field_index.field_names.get(field_name)
+        if existing_field_id is not None and existing_field_id != field_id:
+            raise FieldNameAlreadyExistsException(field_name=field_name)
+
+        existing_field_id = field_index.field_orders.get(field_order)
+        if existing_field_id is not None and existing_field_id != field_id:
+            raise FieldOrderAlreadyExistsException(field_order=field_order)
+
+    def _get_updated_field(self, updated_count: int, field_id: str) -> \
+            FieldDTO | None:
+        """
+        Reads back a field written by a conditional update and appends it
+        to the change feed, in the transaction of the update.
+        """
+        if not updated_count:
+            return None
+
+        field = self._get_field_dto(field=Field.objects.get(field_id=field_id))
+        ChangeFeedStorage.append_field_changes(
+            fields=[field], operation=ChangeOperationEnum.Updated)
+        return field
+
+    @staticmethod
+    def _is_field_key(field_id: str, template_id: str) -> bool:
+        return parse_uuid(field_id) is not None and \
+            parse_uuid(template_id) is not None
+
+    def _check_field_key(self, field_id: str, template_id: str):
+        if not self._is_field_key(field_id=field_id, template_id=template_id):
+            raise FieldNotFoundException(field_id=field_id)
+
+    @staticmethod
+    def _raise_field_update_miss(field_id: str, template_id: str,
+                                 version: int):
+        """
+        Tells a missing field apart from a stale version once the
+        conditional update has matched no row.
+        """
+        if Field.objects.filter(field_id=field_id,
+                                template_id=template_id).exists():
+            raise FieldVersionConflictException(field_id=field_id,
+                                                version=version)
+
+        raise FieldNotFoundException(field_id=field_id)
+
+    @staticmethod
+    def _invalidate_template_schemas(template_ids: list[str]):
+        for template_id in set(template_ids):
+            transaction.on_commit(partial(template_schema_cache.bump_version,
+                                          str(template_id)))
+
+    @staticmethod
+    def _get_field_object(create_field_data: CreateFieldDTO) -> Field:
+        ft = create_field_data.field_type
+
+        return Field(
+            template_id=create_field_data.template_id,
+            field_name=create_field_data.field_name,
+            field_type=ft.value if hasattr(ft, "value") else ft,
+            description=create_field_data.description,
+            order=create_field_data.order,
+            config=create_field_data.config,
+            is_required=create_field_data.is_required,
+            created_by_id=create_field_data.created_by,
+            idempotency_key=create_field_data.idempotency_key
+        )
+
+    @staticmethod
+    def _get_field_dto(field: Field) -> FieldDTO:
+        return FieldDTO(
+            field_id=str(field.field_id),
+            field_type=FieldTypeEnum(field.field_type),
+            description=field.description,
+            template_id=str(field.template_id),
+            field_name=field.field_name,
+            order=field.order,
+            config=field.config,
+            is_required=field.is_required,
+            created_by=str(field.created_by_id),
+            version=field.version
+        )
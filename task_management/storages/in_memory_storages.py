@@ -0,0 +1,611 @@
+import re
+import uuid
+from bisect import bisect_right
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import partial
+from typing import Iterator
+
+from task_management.exceptions.custom_exceptions import \
+    FieldNotFoundException, FieldNameAlreadyExistsException, \
+    FieldOrderAlreadyExistsException, AlreadyExistedTemplateNameException, \
+    DefaultTemplateAlreadyExistedException, DuplicateIdempotencyKeyException, \
+    FieldVersionConflictException
+from task_management.interactors.change_feed import \
+    get_template_change_data, get_field_change_data
+from task_management.interactors.dtos import CreateFieldDTO, FieldDTO, \
+    UpdateFieldDTO, TemplateFieldIndexDTO, TemplateDTO, CreateTemplateDTO, \
+    UserDTO, PermissionsEnum, FieldTypeEnum, PERMISSION_SCOPES, \
+    ChangeDTO, ChangeEntityEnum, ChangeOperationEnum, \
+    SearchResultDTO
+from task_management.interactors.field_batch import FieldBatch
+from task_management.interactors.storage_interface.change_feed_storage_interface import \
+    ChangeFeedStorageInterface
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.search_storage_interface import \
+    SearchStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.interactors.template_schema_cache import \
+    template_schema_cache
+
+_MISSING = object()
+_SEARCH_WORD = re.compile(r"\w+")
+
+
+class InMemoryDatabase:
+    """
+    Rows shared by the in-memory storages, with the secondary indexes that
+    make every existence check a single dict or set lookup.
+
+    Writes made inside ``transaction()`` are recorded in an undo log and are
+    reverted if the block raises. Transactions nest like savepoints, and
+    ``on_commit`` callbacks only run once the outermost block commits.
+    """
+
+    def __init__(self):
+        self.users = {}
+        self.user_permissions = {}
+        self.templates = {}
+        self.fields = {}
+
+        self.template_names = {}
+        self.default_template_ids = set()
+        self.template_field_ids = {}
+        self.field_names = {}
+        self.field_orders = {}
+        self.template_idempotency_keys = {}
+        self.field_idempotency_keys = {}
+        self.changes = {}
+
+        self._last_change_sequence = 0
+        self._undo_log = None
+        self._commit_callbacks = []
+
+    def add_user(self, user: UserDTO,
+                 permissions: dict[str, PermissionsEnum] | None = None):
+        self.set_item(self.users, user.user_id, user)
+        self.set_item(self.user_permissions, user.user_id,
+                      dict(permissions or {}))
+
+    @contextmanager
+    def transaction(self):
+        is_outermost = self._undo_log is None
+        if is_outermost:
+            self._undo_log = []
+        savepoint = len(self._undo_log)
+        callbacks_savepoint = len(self._commit_callbacks)
+
+        try:
+            yield
+        except BaseException:
+            self._rollback(savepoint=savepoint)
+            del self._commit_callbacks[callbacks_savepoint:]
+            if is_outermost:
+                self._undo_log = None
+            raise
+
+        if is_outermost:
+            self._undo_log = None
+            callbacks = self._commit_callbacks
+            self._commit_callbacks = []
+            for callback in callbacks:
+                callback()
+
+    def is_in_transaction(self) -> bool:
+        return self._undo_log is not None
+
+    def on_commit(self, callback):
+        if self._undo_log is None:
+            callback()
+        else:
+            self._commit_callbacks.append(callback)
+
+    def append_change(self, entity: ChangeEntityEnum, entity_id: str,
+                      template_id: str, operation: ChangeOperationEnum,
+                      data: dict):
+        # Like a database sequence, a rolled back change leaves a gap
+        # rather than having its sequence reused.
+        self._last_change_sequence += 1
+        self.set_item(self.changes, self._last_change_sequence, ChangeDTO(
+            sequence=self._last_change_sequence, entity=entity,
+            entity_id=entity_id, template_id=template_id,
+            operation=operation, data=data))
+
+    def set_idempotency_key(self, idempotency_keys: dict, created_by: str,
+                            idempotency_key: str | None, row_id: str):
+        if idempotency_key is None:
+            return
+
+        key = (created_by, idempotency_key)
+        if key in idempotency_keys:
+            raise DuplicateIdempotencyKeyException(
+                idempotency_key=idempotency_key)
+
+        self.set_item(idempotency_keys, key, row_id)
+
+    def set_item(self, mapping: dict, key, value):
+        if self._undo_log is not None:
+            self._undo_log.append((mapping, key, mapping.get(key, _MISSING)))
+        mapping[key] = value
+
+    def pop_item(self, mapping: dict, key):
+        if key not in mapping:
+            return
+        if self._undo_log is not None:
+            self._undo_log.append((mapping, key, mapping[key]))
+        del mapping[key]
+
+    def add_to_set(self, values: set, value):
+        if value in values:
+            return
+        if self._undo_log is not None:
+            self._undo_log.append((values, value, _MISSING))
+        values.add(value)
+
+    def _rollback(self, savepoint: int):
+        while len(self._undo_log) > savepoint:
+            container, key, previous = self._undo_log.pop()
+            if isinstance(container, set):
+                if previous is _MISSING:
+                    container.discard(key)
+                else:
+                    container.add(key)
+            elif previous is _MISSING:
+                container.pop(key, None)
+            else:
+                container[key] = previous
+
+
+class InMemoryUserStorage(UserStorageInterface):
+
+    def __init__(self, database: InMemoryDatabase):
+        self.database = database
+
+    def check_user_exist(self, user_id: str) -> bool:
+        return user_id in self.database.users
+
+    def get_users(self, user_ids: list[str]) -> list[UserDTO]:
+        return [self.database.users[user_id] for user_id in user_ids
+                if user_id in self.database.users]
+
+
+class InMemoryPermissionStorage(PermissionStorageInterface):
+
+    def __init__(self, database: InMemoryDatabase):
+        self.database = database
+
+    def get_user_access_permissions(self, user_id: str) -> \
+            dict[str, PermissionsEnum]:
+        return self.get_users_access_permissions(user_ids=[user_id])[user_id]
+
+    def get_users_access_permissions(self, user_ids: list[str]) -> \
+            dict[str, dict[str, PermissionsEnum]]:
+        users_permissions = {}
+        for user_id in user_ids:
+            permissions = {scope: PermissionsEnum.GUEST
+                           for scope in PERMISSION_SCOPES}
+            permissions.update(self.database.user_permissions.get(user_id, {}))
+            users_permissions[user_id] = permissions
+
+        return users_permissions
+
+
+class InMemoryTemplateStorage(TemplateStorageInterface):
+
+    def __init__(self, database: InMemoryDatabase):
+        self.database = database
+
+    def check_template_exist(self, template_id: str) -> bool:
+        return template_id in self.database.templates
+
+    def get_templates(self, template_ids: list[str]) -> list[TemplateDTO]:
+        return [self.database.templates[template_id]
+                for template_id in template_ids
+                if template_id in self.database.templates]
+
+    def list_templates(self, offset: int, limit: int) -> list[TemplateDTO]:
+        template_names = sorted(self.database.template_names)
+
+        return [self.database.templates[self.database.template_names[name]]
+                for name in template_names[offset:offset + limit]]
+
+    def create_template(self, template_data: CreateTemplateDTO) -> TemplateDTO:
+        return self.bulk_create_templates(templates_data=[template_data])[0]
+
+    def bulk_create_templates(self,
+                              templates_data: list[CreateTemplateDTO]) -> \
+            list[TemplateDTO]:
+        database = self.database
+        templates = [
+            TemplateDTO(
+                template_id=str(uuid.uuid4()),
+                name=template_data.name,
+                description=template_data.description,
+                is_default=template_data.is_default,
+                created_by=template_data.created_by
+            )
+            for template_data in templates_data
+        ]
+
+        with database.transaction():
+            for template, template_data in zip(templates, templates_data):
+                database.set_idempotency_key(
+                    idempotency_keys=database.template_idempotency_keys,
+                    created_by=template.created_by,
+                    idempotency_key=template_data.idempotency_key,
+                    row_id=template.template_id)
+                if template.name in database.template_names:
+                    raise AlreadyExistedTemplateNameException(
+                        template_name=template.name)
+                if template.is_default and database.default_template_ids:
+                    raise DefaultTemplateAlreadyExistedException(
+                        template_name=template.name)
+
+                database.set_item(database.templates, template.template_id,
+                                  template)
+                database.set_item(database.template_names, template.name,
+                                  template.template_id)
+                database.set_item(database.template_field_ids,
+                                  template.template_id, set())
+                if template.is_default:
+                    database.add_to_set(database.default_template_ids,
+                                        template.template_id)
+            _append_template_changes(database=database, templates=templates,
+                                     operation=ChangeOperationEnum.Created)
+            _invalidate_template_schemas(
+                database=database,
+                template_ids=[template.template_id for template in templates])
+
+        return templates
+
+    def iter_template_chunks(self, chunk_size: int) -> \
+            Iterator[list[TemplateDTO]]:
+        database = self.database
+        templates = [database.templates[database.template_names[name]]
+                     for name in sorted(database.template_names)]
+
+        for start in range(0, len(templates), chunk_size):
+            yield templates[start:start + chunk_size]
+
+    def get_template_by_idempotency_key(self, created_by: str,
+                                        idempotency_key: str) -> \
+            TemplateDTO | None:
+        template_id = self.database.template_idempotency_keys.get(
+            (created_by, idempotency_key))
+
+        return self.database.templates.get(template_id)
+
+    def check_template_name_exist(self, template_name: str) -> bool:
+        return template_name in self.database.template_names
+
+    def get_existing_template_names(self, template_names: list[str]) -> \
+            set[str]:
+        return set(template_names) & self.database.template_names.keys()
+
+    def check_default_template_exist(self) -> bool:
+        return bool(self.database.default_template_ids)
+
+    def atomic_transaction(self):
+        return self.database.transaction()
+
+    def is_in_transaction(self) -> bool:
+        return self.database.is_in_transaction()
+
+
+class InMemoryFieldStorage(FieldStorageInterface):
+
+    def __init__(self, database: InMemoryDatabase):
+        self.database = database
+
+    def create_field(self, create_field_data: CreateFieldDTO) -> FieldDTO:
+        return self.bulk_create_fields(
+            create_fields_data=[create_field_data])[0]
+
+    def bulk_create_fields(self, create_fields_data: list[CreateFieldDTO]) -> \
+            list[FieldDTO]:
+        database = self.database
+        fields = [
+            FieldDTO(
+                field_id=str(uuid.uuid4()),
+                field_type=_get_field_type(field_data.field_type),
+                description=field_data.description,
+                template_id=field_data.template_id,
+                field_name=field_data.field_name,
+                order=field_data.order,
+                config=field_data.config,
+                is_required=field_data.is_required,
+                created_by=field_data.created_by
+            )
+            for field_data in create_fields_data
+        ]
+
+        with database.transaction():
+            for field, field_data in zip(fields, create_fields_data):
+                database.set_idempotency_key(
+                    idempotency_keys=database.field_idempotency_keys,
+                    created_by=field.created_by,
+                    idempotency_key=field_data.idempotency_key,
+                    row_id=field.field_id)
+                self._add_field_to_indexes(field=field)
+                database.set_item(database.fields, field.field_id, field)
+                field_ids = database.template_field_ids.get(field.template_id)
+                if field_ids is None:
+                    field_ids = set()
+                    database.set_item(database.template_field_ids,
+                                      field.template_id, field_ids)
+                database.add_to_set(field_ids, field.field_id)
+            _append_field_changes(database=database, fields=fields,
+                                  operation=ChangeOperationEnum.Created)
+            _invalidate_template_schemas(
+                database=database,
+                template_ids=[field.template_id for field in fields])
+
+        return fields
+
+    def get_field(self, field_id: str, template_id: str) -> FieldDTO | None:
+        field = self.database.fields.get(field_id)
+        if field is None or field.template_id != template_id:
+            return None
+
+        return field
+
+    def get_field_by_idempotency_key(self, created_by: str,
+                                     idempotency_key: str) -> \
+            FieldDTO | None:
+        field_id = self.database.field_idempotency_keys.get(
+            (created_by, idempotency_key))
+
+        return self.database.fields.get(field_id)
+
+    def get_template_field_index(self, template_id: str) -> \
+            TemplateFieldIndexDTO:
+        fields = [self.database.fields[field_id] for field_id in
+                  self.database.template_field_ids.get(template_id, ())]
+
+        return TemplateFieldIndexDTO(
+            template_id=template_id,
+            field_ids={field.field_id for field in fields},
+            field_names={field.field_name: field.field_id for field in fields},
+            field_orders={field.order: field.field_id for field in fields}
+        )
+
+    def get_templates_fields(self, template_ids: list[str]) -> list[FieldDTO]:
+        fields = [self.database.fields[field_id]
+                  for template_id in sorted(set(template_ids))
+                  for field_id in
+                  self.database.template_field_ids.get(template_id, ())]
+
+        return sorted(fields, key=lambda field: (field.template_id,
+                                                 field.order))
+
+    def get_templates_field_batch(self, template_ids: list[str]) -> \
+            FieldBatch:
+        return FieldBatch.from_fields(
+            self.get_templates_fields(template_ids=template_ids))
+
+    def update_field(self, update_field_data: UpdateFieldDTO) -> FieldDTO:
+        database = self.database
+        field = self._get_field_for_update(
+            field_id=update_field_data.field_id,
+            template_id=update_field_data.template_id,
+            version=update_field_data.version)
+
+        updated_field = replace(
+            field,
+            field_name=update_field_data.field_name,
+            field_type=_get_field_type(update_field_data.field_type),
+            description=update_field_data.description,
+            order=update_field_data.order,
+            config=update_field_data.config,
+            is_required=update_field_data.is_required,
+            version=field.version + 1
+        )
+
+        with database.transaction():
+            self._remove_field_from_indexes(field=field)
+            self._add_field_to_indexes(field=updated_field)
+            database.set_item(database.fields, field.field_id, updated_field)
+            _append_field_changes(database=database, fields=[updated_field],
+                                  operation=ChangeOperationEnum.Updated)
+            _invalidate_template_schemas(database=database,
+                                         template_ids=[field.template_id])
+
+        return updated_field
+
+    def patch_field(self, field_id: str, template_id: str, version: int,
+                    changes: dict) -> FieldDTO:
+        database = self.database
+        field = self._get_field_for_update(field_id=field_id,
+                                           template_id=template_id,
+                                           version=version)
+        changes = dict(changes)
+        if "field_type" in changes:
+            changes["field_type"] = _get_field_type(changes["field_type"])
+        updated_field = replace(field, version=field.version + 1, **changes)
+
+        with database.transaction():
+            self._remove_field_from_indexes(field=field)
+            self._add_field_to_indexes(field=updated_field)
+            database.set_item(database.fields, field_id, updated_field)
+            _append_field_changes(database=database, fields=[updated_field],
+                                  operation=ChangeOperationEnum.Updated)
+            _invalidate_template_schemas(database=database,
+                                         template_ids=[template_id])
+
+        return updated_field
+
+    def update_field_config(self, field_id: str, template_id: str,
+                            config: dict, version: int) -> FieldDTO:
+        database = self.database
+        field = self._get_field_for_update(field_id=field_id,
+                                           template_id=template_id,
+                                           version=version)
+        updated_field = replace(field, config=config,
+                                version=field.version + 1)
+
+        with database.transaction():
+            database.set_item(database.fields, field_id, updated_field)
+            _append_field_changes(database=database, fields=[updated_field],
+                                  operation=ChangeOperationEnum.Updated)
+            _invalidate_template_schemas(database=database,
+                                         template_ids=[template_id])
+
+        return updated_field
+
+    def update_field_orders(self, template_id: str,
+                            field_orders: dict[str, int]):
+        database = self.database
+        fields = [database.fields[field_id] for field_id in field_orders]
+        updated_fields = [replace(field, order=field_orders[field.field_id],
+                                  version=field.version + 1)
+                          for field in fields]
+
+        with database.transaction():
+            for field in fields:
+                database.pop_item(database.field_orders,
+                                  (template_id, field.order))
+            for field in updated_fields:
+                self._add_field_order(field=field)
+                database.set_item(database.fields, field.field_id, field)
+            _append_field_changes(database=database, fields=updated_fields,
+                                  operation=ChangeOperationEnum.Updated)
+            _invalidate_template_schemas(database=database,
+                                         template_ids=[template_id])
+
+    def _get_field_for_update(self, field_id: str, template_id: str,
+                              version: int) -> FieldDTO:
+        field = self.get_field(field_id=field_id, template_id=template_id)
+        if field is None:
+            raise FieldNotFoundException(field_id=field_id)
+        if field.version != version:
+            raise FieldVersionConflictException(field_id=field_id,
+                                                version=version)
+
+        return field
+
+    def _add_field_to_indexes(self, field: FieldDTO):
+        database = self.database
+        name_key = (field.template_id, field.field_name)
+
+        if name_key in database.field_names:
+            raise FieldNameAlreadyExistsException(field_name=field.field_name)
+
+        self._add_field_order(field=field)
+        database.set_item(database.field_names, name_key, field.field_id)
+
+    def _add_field_order(self, field: FieldDTO):
+        database = self.database
+        order_key = (field.template_id, field.order)
+
+        if order_key in database.field_orders:
+            raise FieldOrderAlreadyExistsException(field_order=field.order)
+
+        database.set_item(database.field_orders, order_key, field.field_id)
+
+    def _remove_field_from_indexes(self, field: FieldDTO):
+        database = self.database
+        database.pop_item(database.field_names,
+                          (field.template_id, field.field_name))
+        database.pop_item(database.field_orders,
+                          (field.template_id, field.order))
+
+
+class InMemoryChangeFeedStorage(ChangeFeedStorageInterface):
+
+    def __init__(self, database: InMemoryDatabase):
+        self.database = database
+
+    def get_changes(self, since: int, limit: int) -> list[ChangeDTO]:
+        sequences = list(self.database.changes)
+        start = bisect_right(sequences, since)
+
+        return [self.database.changes[sequence]
+                for sequence in sequences[start:start + limit]]
+
+
+class InMemorySearchStorage(SearchStorageInterface):
+    """
+    Scans every template and field; names weigh ten times as much as
+    descriptions, as in the SQLite index.
+    """
+
+    def __init__(self, database: InMemoryDatabase):
+        self.database = database
+
+    def search(self, terms: list[str], limit: int) -> list[SearchResultDTO]:
+        terms = [term.lower() for term in terms]
+        results = [
+            SearchResultDTO(template_id=template.template_id, field_id=None,
+                            name=template.name, rank=rank)
+            for template in self.database.templates.values()
+            if (rank := _get_search_rank(terms=terms, name=template.name,
+                                         description=template.description))
+        ]
+        results += [
+            SearchResultDTO(template_id=field.template_id,
+                            field_id=field.field_id, name=field.field_name,
+                            rank=rank)
+            for field in self.database.fields.values()
+            if (rank := _get_search_rank(terms=terms, name=field.field_name,
+                                         description=field.description))
+        ]
+
+        return sorted(results, key=lambda result: result.rank)[:limit]
+
+
+def _get_search_rank(terms: list[str], name: str, description: str) -> \
+        float:
+    """
+    Returns 0 unless every term starts a word of the name or description,
+    and a lower rank for better matches otherwise.
+    """
+    name_words = _SEARCH_WORD.findall(name.lower())
+    description_words = _SEARCH_WORD.findall(description.lower())
+    rank = 0.0
+
+    for term in terms:
+        in_name = any(word.startswith(term) for word in name_words)
+        in_description = any(word.startswith(term)
+                             for word in description_words)
+        if not in_name and not in_description:
+            return 0.0
+        rank -= 10 * in_name + in_description
+
+    return rank
+
+
+def _append_template_changes(database: InMemoryDatabase,
+                             templates: list[TemplateDTO],
+                             operation: ChangeOperationEnum):
+    for template in templates:
+        database.append_change(
+            entity=ChangeEntityEnum.Template,
+            entity_id=template.template_id,
+            template_id=template.template_id, operation=operation,
+            data=get_template_change_data(template=template))
+
+
+def _append_field_changes(database: InMemoryDatabase, fields: list[FieldDTO],
+                          operation: ChangeOperationEnum):
+    for field in fields:
+        database.append_change(
+            entity=ChangeEntityEnum.Field, entity_id=field.field_id,
+            template_id=field.template_id, operation=operation,
+            data=get_field_change_data(field=field))
+
+
+def _invalidate_template_schemas(database: InMemoryDatabase,
+                                 template_ids: list[str]):
+    for template_id in set(template_ids):
+        database.on_commit(partial(template_schema_cache.bump_version,
+                                   template_id))
+
+
+def _get_field_type(field_type: FieldTypeEnum | str) -> FieldTypeEnum:
+    return FieldTypeEnum(getattr(field_type, "value", field_type))
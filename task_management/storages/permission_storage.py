@@ -0,0 +1,38 @@
+from task_management.interactors.dtos import PermissionsEnum
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.models import PermissionScope, UserPermission
+from task_management.storages.uuids import parse_uuid
+
+
+class PermissionStorage(PermissionStorageInterface):
+
+    def get_user_access_permissions(self, user_id: str) -> \
+            dict[str, PermissionsEnum]:
+        return self.get_users_access_permissions(user_ids=[user_id])[user_id]
+
+    def get_users_access_permissions(self, user_ids: list[str]) -> \
+            dict[str, dict[str, PermissionsEnum]]:
+        users_permissions = {
+            user_id: {scope: PermissionsEnum.GUEST
+                      for scope in PermissionScope.values}
+            for user_id in user_ids
+        }
+
+        # Callers may spell a UUID in any form Django accepts, so rows are
+        # matched back to every key that names their user.
+        request_keys = {}
+        for user_id in user_ids:
+            user_uuid = parse_uuid(user_id)
+            if user_uuid is not None:
+                request_keys.setdefault(user_uuid, []).append(user_id)
+
+        rows = UserPermission.objects.filter(
+            user_id__in=request_keys).values_list(
+            "user_id", "scope", "permission")
+        for user_id, scope, permission in rows:
+            for request_key in request_keys[user_id]:
+                users_permissions[request_key][scope] = \
+                    PermissionsEnum(permission)
+
+        return users_permissions
@@ -0,0 +1,165 @@
+import uuid
+
+from django.db import connection, connections
+
+from task_management.interactors.dtos import SearchResultDTO
+from task_management.interactors.storage_interface.search_storage_interface import \
+    SearchStorageInterface
+
+# Names weigh ten times as much as descriptions; the id columns are not
+# indexed and get no weight. The two tables keep separate statistics, so
+# template and field ranks are close to, not exactly, comparable.
+SEARCH_SQL = """
+    SELECT template_id, NULL, name,
+           bm25(task_management_template_search, 0, 10, 1) AS rank
+    FROM task_management_template_search
+    WHERE task_management_template_search MATCH %(match)s
+    UNION ALL
+    SELECT template_id, field_id, field_name,
+           bm25(task_management_field_search, 0, 0, 10, 1) AS rank
+    FROM task_management_field_search
+    WHERE task_management_field_search MATCH %(match)s
+    ORDER BY rank
+    LIMIT %(limit)s
+"""
+
+# Index rows are keyed by a rowid taken from an indexed side table of
+# entity ids, so every trigger reaches its row with two index lookups.
+# The rowids of the entity tables themselves are not used: Django
+# rebuilds SQLite tables to alter them, which renumbers rowids and drops
+# the triggers, so ``create_search_triggers`` runs after every migrate.
+SEARCH_TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS task_management_template_search_insert
+    AFTER INSERT ON task_management_template BEGIN
+        INSERT OR IGNORE INTO task_management_search_rowid(entity_id)
+        VALUES (new.template_id);
+        INSERT OR REPLACE INTO task_management_template_search(
+            rowid, template_id, name, description)
+        VALUES (
+            (SELECT search_rowid FROM task_management_search_rowid
+             WHERE entity_id = new.template_id),
+            new.template_id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_management_template_search_update
+    AFTER UPDATE OF name, description ON task_management_template BEGIN
+        UPDATE task_management_template_search
+        SET name = new.name, description = new.description
+        WHERE rowid = (
+            SELECT search_rowid FROM task_management_search_rowid
+            WHERE entity_id = new.template_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_management_template_search_delete
+    AFTER DELETE ON task_management_template BEGIN
+        DELETE FROM task_management_template_search
+        WHERE rowid = (
+            SELECT search_rowid FROM task_management_search_rowid
+            WHERE entity_id = old.template_id);
+        DELETE FROM task_management_search_rowid
+        WHERE entity_id = old.template_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_management_field_search_insert
+    AFTER INSERT ON task_management_field BEGIN
+        INSERT OR IGNORE INTO task_management_search_rowid(entity_id)
+        VALUES (new.field_id);
+        INSERT OR REPLACE INTO task_management_field_search(
+            rowid, field_id, template_id, field_name, description)
+        VALUES (
+            (SELECT search_rowid FROM task_management_search_rowid
+             WHERE entity_id = new.field_id),
+            new.field_id, new.template_id, new.field_name,
+            new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_management_field_search_update
+    AFTER UPDATE OF field_name, description ON task_management_field BEGIN
+        UPDATE task_management_field_search
+        SET field_name = new.field_name, description = new.description
+        WHERE rowid = (
+            SELECT search_rowid FROM task_management_search_rowid
+            WHERE entity_id = new.field_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_management_field_search_delete
+    AFTER DELETE ON task_management_field BEGIN
+        DELETE FROM task_management_field_search
+        WHERE rowid = (
+            SELECT search_rowid FROM task_management_search_rowid
+            WHERE entity_id = old.field_id);
+        DELETE FROM task_management_search_rowid
+        WHERE entity_id = old.field_id;
+    END
+    """,
+]
+
+SEARCH_TRIGGER_NAMES = (
+    "task_management_template_search_insert",
+    "task_management_template_search_update",
+    "task_management_template_search_delete",
+    "task_management_field_search_insert",
+    "task_management_field_search_update",
+    "task_management_field_search_delete",
+)
+
+
+def create_search_triggers(using: str = "default", **kwargs):
+    """
+    Creates the search index triggers that are missing. Connected to
+    ``post_migrate``; does nothing until the index tables exist.
+    """
+    search_connection = connections[using]
+    if search_connection.vendor != "sqlite":
+        return
+
+    with search_connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'table' AND "
+            "name IN ('task_management_template_search', "
+            "'task_management_field_search', 'task_management_search_rowid')")
+        if cursor.fetchone()[0] != 3:
+            return
+
+        for statement in SEARCH_TRIGGERS_SQL:
+            cursor.execute(statement)
+
+
+class SearchStorage(SearchStorageInterface):
+    """
+    Searches the SQLite FTS5 tables created by the ``0005_search_index``
+    migration, which ``SEARCH_TRIGGERS_SQL`` keeps in step with every
+    template and field write.
+    """
+
+    def search(self, terms: list[str], limit: int) -> list[SearchResultDTO]:
+        if not terms:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(SEARCH_SQL, {"match": self._get_match(terms=terms),
+                                        "limit": limit})
+            rows = cursor.fetchall()
+
+        return [
+            SearchResultDTO(
+                template_id=str(uuid.UUID(template_id)),
+                field_id=None if field_id is None else str(uuid.UUID(field_id)),
+                name=name,
+                rank=rank
+            )
+            for template_id, field_id, name, rank in rows
+        ]
+
+    @staticmethod
+    def _get_match(terms: list[str]) -> str:
+        # Every term is quoted, so nothing in it is read as FTS5 syntax,
+        # and matched as a prefix so results appear while a word is typed.
+        return " ".join('"{}"*'.format(term.replace('"', '""'))
+                        for term in terms)
@@ -0,0 +1,136 @@
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+MAX_INTERACTOR_FRAME_DEPTH = 32
+
+
+@dataclass
+class StorageCallRecord:
+    storage: str
+    method: str
+    args: tuple
+    kwargs: dict
+    duration_ms: float
+    interactor: str | None
+    error: str | None = None
+
+
+@dataclass
+class StorageCallTrack:
+    records: list[StorageCallRecord] = field(default_factory=list)
+
+    def get_calls(self, interactor: str | None = None) -> \
+            list[StorageCallRecord]:
+        if interactor is None:
+            return list(self.records)
+
+        return [record for record in self.records
+                if record.interactor == interactor]
+
+
+class StorageTracer:
+    """
+    Wraps storages so that every method call is timed, attributed to the
+    interactor method that issued it and logged through ``structlog``.
+
+    Calls are only kept in memory while a ``track()`` block is open, so a
+    tracer can stay installed in long-running processes. A ``log_level``
+    of None only tracks calls, e.g. for benchmarks.
+    """
+
+    def __init__(self, log_level: str | None = "debug"):
+        self.log_level = log_level
+        self._tracks = []
+
+    def wrap(self, storage, name: str | None = None):
+        return TracingStorage(storage=storage, tracer=self,
+                              name=name or type(storage).__name__)
+
+    @contextmanager
+    def track(self):
+        track = StorageCallTrack()
+        self._tracks.append(track)
+        try:
+            yield track
+        finally:
+            self._tracks.remove(track)
+
+    def record(self, record: StorageCallRecord):
+        for track in self._tracks:
+            track.records.append(record)
+
+        if self.log_level is None:
+            return
+
+        getattr(logger, self.log_level)(
+            "storage_call",
+            storage=record.storage,
+            method=record.method,
+            args=record.args,
+            kwargs=record.kwargs,
+            duration_ms=record.duration_ms,
+            interactor=record.interactor,
+            error=record.error
+        )
+
+
+class TracingStorage:
+
+    def __init__(self, storage, tracer: StorageTracer, name: str):
+        self._storage = storage
+        self._tracer = tracer
+        self._name = name
+
+    def __getattr__(self, attribute: str):
+        value = getattr(self._storage, attribute)
+        if attribute.startswith("_") or not callable(value):
+            return value
+
+        def traced(*args, **kwargs):
+            interactor = get_calling_interactor(frame=sys._getframe(1))
+            error = None
+            started_at = time.perf_counter()
+            try:
+                return value(*args, **kwargs)
+            except Exception as exception:
+                error = type(exception).__name__
+                raise
+            finally:
+                self._tracer.record(StorageCallRecord(
+                    storage=self._name,
+                    method=attribute,
+                    args=args,
+                    kwargs=kwargs,
+                    duration_ms=(time.perf_counter() - started_at) * 1000,
+                    interactor=interactor,
+                    error=error
+                ))
+
+        return traced
+
+
+def get_calling_interactor(frame) -> str | None:
+    """
+    Returns ``<Interactor>.<method>`` for the nearest public interactor
+    method on the call stack, or None when the call was not made by an
+    interactor.
+    """
+    depth = 0
+    while frame is not None and depth < MAX_INTERACTOR_FRAME_DEPTH:
+        instance = frame.f_locals.get("self")
+        if instance is not None:
+            class_name = type(instance).__name__
+            if class_name.endswith("Interactor") and \
+                    not frame.f_code.co_name.startswith("_"):
+                return f"{class_name}.{frame.f_code.co_name}"
+
+        frame = frame.f_back
+        depth += 1
+
+    return None
@@ -0,0 +1,162 @@
+from functools import partial
+from typing import Iterator
+
+from django.db import IntegrityError, transaction
+
+from task_management.exceptions.custom_exceptions import \
+    AlreadyExistedTemplateNameException, \
+    DefaultTemplateAlreadyExistedException, DuplicateIdempotencyKeyException
+from task_management.interactors.dtos import TemplateDTO, CreateTemplateDTO, \
+    ChangeOperationEnum
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.template_schema_cache import \
+    template_schema_cache
+from task_management.models import Template
+from task_management.storages.uuids import parse_uuid, parse_uuids
+from task_management.storages.change_feed_storage import ChangeFeedStorage
+
+
+class TemplateStorage(TemplateStorageInterface):
+
+    def check_template_exist(self, template_id: str) -> bool:
+        template_id = parse_uuid(template_id)
+
+        return template_id is not None and \
+            Template.objects.filter(template_id=template_id).exists()
+
+    def get_templates(self, template_ids: list[str]) -> list[TemplateDTO]:
+        templates = Template.objects.filter(
+            template_id__in=parse_uuids(template_ids))
+
+        return [self._get_template_dto(template=template)
+                for template in templates]
+
+    def list_templates(self, offset: int, limit: int) -> list[TemplateDTO]:
+        templates = Template.objects.order_by("name")[offset:offset + limit]
+
+        return [self._get_template_dto(template=template)
+                for template in templates]
+
+    def create_template(self, template_data: CreateTemplateDTO) -> TemplateDTO:
+        try:
+            with transaction.atomic():
+                template = Template.objects.create(
+                    name=template_data.name,
+                    description=template_data.description,
+                    is_default=template_data.is_default,
+                    created_by_id=template_data.created_by,
+                    idempotency_key=template_data.idempotency_key
+                )
+                template_dto = self._get_template_dto(template=template)
+                ChangeFeedStorage.append_template_changes(
+                    templates=[template_dto],
+                    operation=ChangeOperationEnum.Created)
+        except IntegrityError:
+            self._raise_template_conflict(template_data=template_data)
+            raise
+
+        transaction.on_commit(partial(template_schema_cache.bump_version,
+                                      str(template.template_id)))
+        return template_dto
+
+    def bulk_create_templates(self,
+                              templates_data: list[CreateTemplateDTO]) -> \
+            list[TemplateDTO]:
+        templates = [
+            Template(
+                name=template_data.name,
+                description=template_data.description,
+                is_default=template_data.is_default,
+                created_by_id=template_data.created_by,
+                idempotency_key=template_data.idempotency_key
+            )
+            for template_data in templates_data
+        ]
+
+        try:
+            with transaction.atomic():
+                Template.objects.bulk_create(templates)
+                template_dtos = [self._get_template_dto(template=template)
+                                 for template in templates]
+                ChangeFeedStorage.append_template_changes(
+                    templates=template_dtos,
+                    operation=ChangeOperationEnum.Created)
+        except IntegrityError:
+            for template_data in templates_data:
+                self._raise_template_conflict(template_data=template_data)
+            raise
+
+        for template in templates:
+            transaction.on_commit(partial(template_schema_cache.bump_version,
+                                          str(template.template_id)))
+        return template_dtos
+
+    def iter_template_chunks(self, chunk_size: int) -> \
+            Iterator[list[TemplateDTO]]:
+        templates = Template.objects.order_by("name")
+
+        chunk = []
+        for template in templates.iterator(chunk_size=chunk_size):
+            chunk.append(self._get_template_dto(template=template))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def get_template_by_idempotency_key(self, created_by: str,
+                                        idempotency_key: str) -> \
+            TemplateDTO | None:
+        created_by = parse_uuid(created_by)
+        if created_by is None:
+            return None
+
+        template = Template.objects.filter(
+            created_by_id=created_by, idempotency_key=idempotency_key).first()
+
+        return None if template is None else \
+            self._get_template_dto(template=template)
+
+    def check_template_name_exist(self, template_name: str) -> bool:
+        return Template.objects.filter(name=template_name).exists()
+
+    def get_existing_template_names(self, template_names: list[str]) -> \
+            set[str]:
+        return set(Template.objects.filter(name__in=template_names)
+                   .values_list("name", flat=True))
+
+    def check_default_template_exist(self) -> bool:
+        return Template.objects.filter(is_default=True).exists()
+
+    def atomic_transaction(self):
+        return transaction.atomic()
+
+    def is_in_transaction(self) -> bool:
+        return transaction.get_connection().in_atomic_block
+
+    def _raise_template_conflict(self, template_data: CreateTemplateDTO):
+        if template_data.idempotency_key is not None and \
+                self.get_template_by_idempotency_key(
+                    created_by=template_data.created_by,
+                    idempotency_key=template_data.idempotency_key) is not None:
+            raise DuplicateIdempotencyKeyException(
+                idempotency_key=template_data.idempotency_key)
+
+        if self.check_template_name_exist(template_name=template_data.name):
+            raise AlreadyExistedTemplateNameException(
+                template_name=template_data.name)
+
+        if template_data.is_default and self.check_default_template_exist():
+            raise DefaultTemplateAlreadyExistedException(
+                template_name=template_data.name)
+
+    @staticmethod
+    def _get_template_dto(template: Template) -> TemplateDTO:
+        return TemplateDTO(
+            template_id=str(template.template_id),
+            name=template.name,
+            description=template.description,
+            is_default=template.is_default,
+            created_by=str(template.created_by_id)
+        )
@@ -0,0 +1,26 @@
+from task_management.interactors.dtos import UserDTO
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.models import User
+from task_management.storages.uuids import parse_uuid, parse_uuids
+
+
+class UserStorage(UserStorageInterface):
+
+    def check_user_exist(self, user_id: str) -> bool:
+        user_id = parse_uuid(user_id)
+
+        return user_id is not None and \
+            User.objects.filter(user_id=user_id).exists()
+
+    def get_users(self, user_ids: list[str]) -> list[UserDTO]:
+        users = User.objects.filter(user_id__in=parse_uuids(user_ids))
+
+        return [
+            UserDTO(
+                user_id=str(user.user_id),
+                full_name=user.full_name,
+                email=user.email
+            )
+            for user in users
+        ]
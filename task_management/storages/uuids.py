@@ -0,0 +1,21 @@
+import uuid
+
+
+def parse_uuid(value) -> uuid.UUID | None:
+    """
+    Returns ``value`` as a UUID, or None if it is not one. Ids come from
+    clients, and an id that is not a UUID cannot name any row, so lookups
+    treat it as missing rather than letting the ORM raise.
+    """
+    if isinstance(value, uuid.UUID):
+        return value
+
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def parse_uuids(values) -> list[uuid.UUID]:
+    return [parsed for value in values
+            if (parsed := parse_uuid(value)) is not None]
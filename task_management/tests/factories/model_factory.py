@@ -0,0 +1,44 @@
+import factory
+
+from task_management.models import User, Template, Field, UserPermission
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = User
+
+    full_name = factory.Faker("name")
+    email = factory.Sequence(lambda n: f"user{n}@example.com")
+
+
+class UserPermissionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = UserPermission
+
+    user = factory.SubFactory(UserFactory)
+    scope = "List"
+    permission = "admin"
+
+
+class TemplateFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Template
+
+    name = factory.Sequence(lambda n: f"Template {n}")
+    description = factory.Faker("text")
+    is_default = False
+    created_by = factory.SubFactory(UserFactory)
+
+
+class FieldFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Field
+
+    template = factory.SubFactory(TemplateFactory)
+    field_name = factory.Sequence(lambda n: f"Field {n}")
+    field_type = "text"
+    description = factory.Faker("text")
+    order = factory.Sequence(lambda n: n + 1)
+    config = factory.LazyFunction(dict)
+    is_required = False
+    created_by = factory.SelfAttribute("template.created_by")
@@ -0,0 +1,114 @@
+import asyncio
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import (
+    UserNotFoundException,
+    FieldNameAlreadyExistsException
+)
+from task_management.interactors.dtos import (
+    CreateFieldDTO,
+    FieldDTO,
+    FieldTypeEnum,
+    PermissionsEnum,
+    TemplateFieldIndexDTO
+)
+from task_management.interactors.field_interactors.async_create_field_interactor import \
+    AsyncCreateFieldInteractor
+from task_management.interactors.storage_interface.async_field_storage_interface import \
+    AsyncFieldStorageInterface
+from task_management.interactors.storage_interface.async_permission_storage_interface import \
+    AsyncPermissionStorageInterface
+from task_management.interactors.storage_interface.async_template_storage_interface import \
+    AsyncTemplateStorageInterface
+from task_management.interactors.storage_interface.async_user_storage_interface import \
+    AsyncUserStorageInterface
+
+
+class TestAsyncCreateFieldInteractor:
+
+    def _get_interactor(self, *, user_exists=True, template_exists=True,
+                        field_names=None):
+        field_storage = create_autospec(AsyncFieldStorageInterface)
+        user_storage = create_autospec(AsyncUserStorageInterface)
+        template_storage = create_autospec(AsyncTemplateStorageInterface)
+        permission_storage = create_autospec(AsyncPermissionStorageInterface)
+
+        user_storage.check_user_exist.return_value = user_exists
+        template_storage.check_template_exist.return_value = template_exists
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
+        field_storage.get_template_field_index.return_value = TemplateFieldIndexDTO(
+            template_id="tpl_1",
+            field_ids={"field_9"},
+            field_names={name: "field_9" for name in field_names or []},
+            field_orders={}
+        )
+        field_storage.create_field.return_value = FieldDTO(
+            field_id="field_1",
+            field_type=FieldTypeEnum.Text,
+            description="Task priority",
+            template_id="tpl_1",
+            field_name="Priority",
+            order=1,
+            config={"max_length": 10},
+            is_required=True,
+            created_by="user_1"
+        )
+
+        interactor = AsyncCreateFieldInteractor(
+            field_storage=field_storage,
+            user_storage=user_storage,
+            template_storage=template_storage,
+            permission_storage=permission_storage
+        )
+
+        return interactor, field_storage
+
+    def _get_create_field_data(self):
+        return CreateFieldDTO(
+            field_type=FieldTypeEnum.Text,
+            field_name="Priority",
+            description="Task priority",
+            template_id="tpl_1",
+            order=1,
+            config={"max_length": 10},
+            is_required=True,
+            created_by="user_1"
+        )
+
+    def test_create_field_successfully(self, snapshot):
+        interactor, field_storage = self._get_interactor()
+
+        result = asyncio.run(
+            interactor.create_field(self._get_create_field_data()))
+
+        field_storage.create_field.assert_awaited_once()
+        snapshot.assert_match(
+            repr(result),
+            "test_create_field_successfully.txt"
+        )
+
+    def test_create_field_reports_first_failing_check(self, snapshot):
+        interactor, field_storage = self._get_interactor(
+            user_exists=False, template_exists=False)
+
+        with pytest.raises(UserNotFoundException) as exc:
+            asyncio.run(interactor.create_field(self._get_create_field_data()))
+
+        field_storage.create_field.assert_not_awaited()
+        snapshot.assert_match(
+            repr(exc.value.user_id),
+            "test_create_field_reports_first_failing_check.txt"
+        )
+
+    def test_create_field_duplicate_name(self, snapshot):
+        interactor, _ = self._get_interactor(field_names=["Priority"])
+
+        with pytest.raises(FieldNameAlreadyExistsException) as exc:
+            asyncio.run(interactor.create_field(self._get_create_field_data()))
+
+        snapshot.assert_match(
+            repr(exc.value.field_name),
+            "test_create_field_duplicate_name.txt"
+        )
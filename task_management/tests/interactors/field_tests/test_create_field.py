@@ -19,7 +19,8 @@ from task_management.interactors.dtos import (
     CreateFieldDTO,
     FieldDTO,
     FieldTypeEnum,
-    PermissionsEnum
+    PermissionsEnum,
+    TemplateFieldIndexDTO
 )
 from task_management.interactors.storage_interface.field_storage_interface import \
     FieldStorageInterface
@@ -38,6 +39,14 @@ class FieldEnum(Enum):
 
 class TestCreateFieldInteractor:
 
+    def _get_field_index(self, field_names=None, field_orders=None):
+        return TemplateFieldIndexDTO(
+            template_id="tpl_1",
+            field_ids={"field_9"},
+            field_names={name: "field_9" for name in field_names or []},
+            field_orders={order: "field_9" for order in field_orders or []}
+        )
+
     def _get_field_dto(self):
         return FieldDTO(
             field_id="field_1",
@@ -61,9 +70,8 @@ class TestCreateFieldInteractor:
 
         user_storage.check_user_exist.return_value = True
         template_storage.check_template_exist.return_value = True
-        permission_storage.get_user_access_permissions.return_value = PermissionsEnum.ADMIN
-        field_storage.check_field_name_exist.return_value = False
-        field_storage.check_field_order_exist.return_value = False
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
+        field_storage.get_template_field_index.return_value = self._get_field_index()
 
         field_storage.create_field.return_value = self._get_field_dto()
 
@@ -169,7 +177,7 @@ class TestCreateFieldInteractor:
 
         user_storage.check_user_exist.return_value = True
         template_storage.check_template_exist.return_value = True
-        permission_storage.get_user_access_permissions.return_value = PermissionsEnum.ADMIN
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
 
         interactor = CreateFieldInteractor(
             field_storage=field_storage,
@@ -205,7 +213,7 @@ class TestCreateFieldInteractor:
 
         user_storage.check_user_exist.return_value = True
         template_storage.check_template_exist.return_value = True
-        permission_storage.get_user_access_permissions.return_value = PermissionsEnum.GUEST
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.GUEST}
 
         interactor = CreateFieldInteractor(
             field_storage=field_storage,
@@ -242,10 +250,10 @@ class TestCreateFieldInteractor:
 
         user_storage.check_user_exist.return_value = True
         template_storage.check_template_exist.return_value = True
-        permission_storage.get_user_access_permissions.return_value = PermissionsEnum.ADMIN
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
 
-        field_storage.check_field_name_exist.return_value = False
-        field_storage.check_field_order_exist.return_value = True
+        field_storage.get_template_field_index.return_value = self._get_field_index(
+            field_orders=[1])
 
         interactor = CreateFieldInteractor(
             field_storage=field_storage,
@@ -283,10 +291,10 @@ class TestCreateFieldInteractor:
 
         user_storage.check_user_exist.return_value = True
         template_storage.check_template_exist.return_value = True
-        permission_storage.get_user_access_permissions.return_value = PermissionsEnum.ADMIN
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
 
-        field_storage.check_field_name_exist.return_value = True
-        field_storage.check_field_order_exist.return_value = False
+        field_storage.get_template_field_index.return_value = self._get_field_index(
+            field_names=["Priority"])
 
         interactor = CreateFieldInteractor(
             field_storage=field_storage,
@@ -315,5 +323,116 @@ class TestCreateFieldInteractor:
             "test_create_field_duplicate_name.txt"
         )
 
+    def _get_bulk_interactor(self, *, existing_names=None,
+                             existing_orders=None):
+        field_storage = create_autospec(FieldStorageInterface)
+        user_storage = create_autospec(UserStorageInterface)
+        template_storage = create_autospec(TemplateStorageInterface)
+        permission_storage = create_autospec(PermissionStorageInterface)
+
+        user_storage.check_user_exist.return_value = True
+        template_storage.check_template_exist.return_value = True
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
+        field_storage.get_template_field_index.return_value = self._get_field_index(
+            field_names=existing_names, field_orders=existing_orders)
+        field_storage.bulk_create_fields.side_effect = lambda create_fields_data: [
+            FieldDTO(
+                field_id=f"field_{index}",
+                field_type=field.field_type,
+                description=field.description,
+                template_id=field.template_id,
+                field_name=field.field_name,
+                order=field.order,
+                config=field.config,
+                is_required=field.is_required,
+                created_by=field.created_by
+            )
+            for index, field in enumerate(create_fields_data, start=1)
+        ]
+
+        interactor = CreateFieldInteractor(
+            field_storage=field_storage,
+            user_storage=user_storage,
+            template_storage=template_storage,
+            permission_storage=permission_storage
+        )
+
+        return interactor, field_storage
+
+    def _get_create_fields_data(self):
+        return [
+            CreateFieldDTO(
+                field_type=FieldTypeEnum.Text,
+                field_name="Title",
+                description="",
+                template_id="tpl_1",
+                order=1,
+                config={"max_length": 255},
+                is_required=True,
+                created_by="user_1"
+            ),
+            CreateFieldDTO(
+                field_type=FieldTypeEnum.Number,
+                field_name="Estimate",
+                description="",
+                template_id="tpl_1",
+                order=2,
+                config={"min": 0},
+                is_required=False,
+                created_by="user_1"
+            )
+        ]
+
+    def test_create_fields_successfully(self, snapshot):
+        interactor, field_storage = self._get_bulk_interactor()
+
+        result = interactor.create_fields(self._get_create_fields_data())
+
+        field_storage.bulk_create_fields.assert_called_once()
+        field_storage.get_template_field_index.assert_called_once_with(
+            template_id="tpl_1")
+        snapshot.assert_match(
+            repr(result),
+            "test_create_fields_successfully.txt"
+        )
+
+    def test_create_fields_duplicate_name_in_batch(self, snapshot):
+        interactor, field_storage = self._get_bulk_interactor()
+        create_fields_data = self._get_create_fields_data()
+        create_fields_data[1].field_name = "Title"
+
+        with pytest.raises(FieldNameAlreadyExistsException) as exc:
+            interactor.create_fields(create_fields_data)
+
+        field_storage.bulk_create_fields.assert_not_called()
+        snapshot.assert_match(
+            repr(exc.value.field_name),
+            "test_create_fields_duplicate_name_in_batch.txt"
+        )
 
+    def test_create_fields_duplicate_order_in_storage(self, snapshot):
+        interactor, field_storage = self._get_bulk_interactor(
+            existing_orders=[2])
 
+        with pytest.raises(FieldOrderAlreadyExistsException) as exc:
+            interactor.create_fields(self._get_create_fields_data())
+
+        field_storage.bulk_create_fields.assert_not_called()
+        snapshot.assert_match(
+            repr(exc.value.field_order),
+            "test_create_fields_duplicate_order_in_storage.txt"
+        )
+
+    def test_create_fields_allocates_missing_orders(self, snapshot):
+        interactor, field_storage = self._get_bulk_interactor(
+            existing_orders=[1000])
+        create_fields_data = self._get_create_fields_data()
+        for field in create_fields_data:
+            field.order = None
+
+        result = interactor.create_fields(create_fields_data)
+
+        snapshot.assert_match(
+            repr([field.order for field in result]),
+            "test_create_fields_allocates_missing_orders.txt"
+        )
@@ -0,0 +1,128 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    DropdownOptionAlreadyExistsException, DropdownOptionNotFoundException, \
+    FieldVersionConflictException, InvalidFieldConfigException, \
+    UnexpectedFieldTypeFoundException
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, FieldTypeEnum, UserDTO, PermissionsEnum, \
+    AddDropdownOptionsDTO, RemoveDropdownOptionsDTO, RenameDropdownOptionDTO
+from task_management.interactors.field_interactors.dropdown_options_interactor import \
+    DropdownOptionsInteractor
+from task_management.interactors.validation_mixin import ValidationMixin
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+
+
+class TestDropdownOptionsInteractor:
+
+    @pytest.fixture
+    def database(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        return database
+
+    @pytest.fixture
+    def interactor(self, database):
+        return DropdownOptionsInteractor(
+            field_storage=InMemoryFieldStorage(database),
+            user_storage=InMemoryUserStorage(database),
+            permission_storage=InMemoryPermissionStorage(database))
+
+    @pytest.fixture
+    def field(self, database):
+        template = InMemoryTemplateStorage(database).create_template(
+            CreateTemplateDTO(name="Bugs", description="", is_default=False,
+                              created_by="user_1"))
+
+        return InMemoryFieldStorage(database).create_field(CreateFieldDTO(
+            field_type=FieldTypeEnum.Dropdown, field_name="Priority",
+            description="", template_id=template.template_id, order=1000,
+            config={"options": ["Low", "High"], "default": "Low"},
+            is_required=False, created_by="user_1"))
+
+    def _add(self, interactor, field, labels):
+        return interactor.add_dropdown_options(AddDropdownOptionsDTO(
+            field_id=field.field_id, template_id=field.template_id,
+            labels=labels, version=field.version, user_id="user_1"))
+
+    def test_add_options_keeps_legacy_options_and_default(self, interactor,
+                                                          field):
+        updated_field = self._add(interactor, field, ["Medium"])
+
+        options = updated_field.config["options"]
+        assert [option["label"] for option in options] == \
+            ["Low", "High", "Medium"]
+        assert options[0] == {"id": "Low", "label": "Low"}
+        assert updated_field.config["default"] == "Low"
+        assert updated_field.version == field.version + 1
+        ValidationMixin.validate_field_config_and_default(
+            field_type=FieldTypeEnum.Dropdown, config=updated_field.config)
+
+    def test_add_existing_label(self, interactor, field):
+        with pytest.raises(DropdownOptionAlreadyExistsException) as exc:
+            self._add(interactor, field, ["Medium", "High"])
+
+        assert exc.value.label == "High"
+
+    def test_rename_option_follows_default(self, interactor, field):
+        updated_field = interactor.rename_dropdown_option(
+            RenameDropdownOptionDTO(
+                field_id=field.field_id, template_id=field.template_id,
+                option_id="Low", label="Minor", version=field.version,
+                user_id="user_1"))
+
+        assert updated_field.config == {
+            "options": [{"id": "Low", "label": "Minor"},
+                        {"id": "High", "label": "High"}],
+            "default": "Minor"
+        }
+
+    def test_remove_option_drops_default(self, interactor, field):
+        updated_field = interactor.remove_dropdown_options(
+            RemoveDropdownOptionsDTO(
+                field_id=field.field_id, template_id=field.template_id,
+                option_ids=["Low"], version=field.version, user_id="user_1"))
+
+        assert updated_field.config == {
+            "options": [{"id": "High", "label": "High"}]}
+
+    def test_remove_unknown_option(self, interactor, field):
+        with pytest.raises(DropdownOptionNotFoundException):
+            interactor.remove_dropdown_options(RemoveDropdownOptionsDTO(
+                field_id=field.field_id, template_id=field.template_id,
+                option_ids=["Missing"], version=field.version,
+                user_id="user_1"))
+
+    def test_remove_all_options(self, interactor, field):
+        with pytest.raises(InvalidFieldConfigException):
+            interactor.remove_dropdown_options(RemoveDropdownOptionsDTO(
+                field_id=field.field_id, template_id=field.template_id,
+                option_ids=["Low", "High"], version=field.version,
+                user_id="user_1"))
+
+    def test_stale_version(self, interactor, field):
+        self._add(interactor, field, ["Medium"])
+
+        with pytest.raises(FieldVersionConflictException):
+            self._add(interactor, field, ["Urgent"])
+
+    def test_non_dropdown_field(self, database, interactor, field):
+        text_field = InMemoryFieldStorage(database).create_field(
+            CreateFieldDTO(field_type=FieldTypeEnum.Text, field_name="Notes",
+                           description="", template_id=field.template_id,
+                           order=2000, config={}, is_required=False,
+                           created_by="user_1"))
+
+        with pytest.raises(UnexpectedFieldTypeFoundException):
+            self._add(interactor, text_field, ["Medium"])
+
+    def test_duplicate_option_ids_are_rejected(self):
+        with pytest.raises(InvalidFieldConfigException):
+            ValidationMixin.validate_field_config_and_default(
+                field_type=FieldTypeEnum.Dropdown,
+                config={"options": [{"id": "a", "label": "Low"},
+                                    {"id": "a", "label": "High"}]})
@@ -0,0 +1,109 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    FieldNameAlreadyExistsException, FieldNotFoundException, \
+    FieldVersionConflictException, InvalidFieldConfigException
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, FieldTypeEnum, UserDTO, PermissionsEnum, PatchFieldDTO
+from task_management.interactors.field_interactors.update_field_interactor import \
+    UpdateFieldInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+from task_management.storages.storage_tracer import StorageTracer
+
+
+class TestPatchField:
+
+    @pytest.fixture
+    def tracer(self):
+        return StorageTracer()
+
+    @pytest.fixture
+    def database(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        return database
+
+    @pytest.fixture
+    def interactor(self, database, tracer):
+        return UpdateFieldInteractor(
+            user_storage=tracer.wrap(InMemoryUserStorage(database)),
+            field_storage=tracer.wrap(InMemoryFieldStorage(database)),
+            permission_storage=tracer.wrap(
+                InMemoryPermissionStorage(database)),
+            template_storage=tracer.wrap(InMemoryTemplateStorage(database)))
+
+    @pytest.fixture
+    def fields(self, database):
+        template = InMemoryTemplateStorage(database).create_template(
+            CreateTemplateDTO(name="Bugs", description="", is_default=False,
+                              created_by="user_1"))
+
+        return InMemoryFieldStorage(database).bulk_create_fields([
+            CreateFieldDTO(field_type=FieldTypeEnum.Text, field_name=name,
+                           description="", template_id=template.template_id,
+                           order=order, config={"max_length": 20},
+                           is_required=False, created_by="user_1")
+            for order, name in ((1000, "Severity"), (2000, "Impact"))])
+
+    @staticmethod
+    def _get_patch_dto(field, **changes) -> PatchFieldDTO:
+        return PatchFieldDTO(field_id=field.field_id,
+                             template_id=field.template_id,
+                             version=field.version, user_id="user_1",
+                             **changes)
+
+    def test_rename_touches_only_the_field_name(self, interactor, tracer,
+                                                fields):
+        with tracer.track() as track:
+            field = interactor.patch_field(
+                self._get_patch_dto(fields[0], field_name="Urgency"))
+
+        assert [call.method for call in track.get_calls()] == \
+            ["check_user_exist", "get_user_access_permissions", "patch_field"]
+        assert track.get_calls()[-1].kwargs["changes"] == \
+            {"field_name": "Urgency"}
+        assert (field.field_name, field.order, field.config, field.version) == \
+            ("Urgency", 1000, {"max_length": 20}, 2)
+
+    def test_rename_to_existing_name(self, interactor, fields):
+        with pytest.raises(FieldNameAlreadyExistsException):
+            interactor.patch_field(
+                self._get_patch_dto(fields[0], field_name="Impact"))
+
+    def test_config_is_validated_against_stored_type(self, interactor,
+                                                     fields):
+        with pytest.raises(InvalidFieldConfigException):
+            interactor.patch_field(
+                self._get_patch_dto(fields[0], config={"options": ["Low"]}))
+
+    def test_type_and_config_change_together_without_read(
+            self, interactor, tracer, fields):
+        with tracer.track() as track:
+            field = interactor.patch_field(self._get_patch_dto(
+                fields[0], field_type=FieldTypeEnum.Dropdown,
+                config={"options": ["Low", "High"]}))
+
+        assert "get_field" not in [call.method for call in track.get_calls()]
+        assert field.field_type == FieldTypeEnum.Dropdown
+
+    def test_stale_version(self, interactor, fields):
+        interactor.patch_field(
+            self._get_patch_dto(fields[0], description="First"))
+
+        with pytest.raises(FieldVersionConflictException):
+            interactor.patch_field(
+                self._get_patch_dto(fields[0], description="Second"))
+
+    def test_empty_patch_returns_field(self, interactor, fields):
+        assert interactor.patch_field(self._get_patch_dto(fields[0])) == \
+            fields[0]
+
+    def test_empty_patch_on_missing_field(self, interactor, fields):
+        with pytest.raises(FieldNotFoundException):
+            interactor.patch_field(PatchFieldDTO(
+                field_id="missing", template_id=fields[0].template_id,
+                version=1, user_id="user_1"))
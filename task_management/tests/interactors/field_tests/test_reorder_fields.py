@@ -0,0 +1,101 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import (
+    InvalidFieldsReorderException
+)
+from task_management.interactors.dtos import (
+    PermissionsEnum,
+    TemplateFieldIndexDTO
+)
+from task_management.interactors.field_interactors.reorder_fields_interactor import \
+    ReorderFieldsInteractor
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+
+
+class TestReorderFieldsInteractor:
+
+    def _get_interactor(self, field_orders):
+        field_storage = create_autospec(FieldStorageInterface)
+        user_storage = create_autospec(UserStorageInterface)
+        template_storage = create_autospec(TemplateStorageInterface)
+        permission_storage = create_autospec(PermissionStorageInterface)
+
+        user_storage.check_user_exist.return_value = True
+        template_storage.check_template_exist.return_value = True
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
+        field_storage.get_template_field_index.return_value = TemplateFieldIndexDTO(
+            template_id="tpl_1",
+            field_ids=set(field_orders.values()),
+            field_names={},
+            field_orders=field_orders
+        )
+
+        interactor = ReorderFieldsInteractor(
+            field_storage=field_storage,
+            user_storage=user_storage,
+            template_storage=template_storage,
+            permission_storage=permission_storage
+        )
+
+        return interactor, field_storage
+
+    def test_moving_one_field_writes_one_order(self, snapshot):
+        interactor, field_storage = self._get_interactor(
+            {1000: "f1", 2000: "f2", 3000: "f3", 4000: "f4"})
+
+        result = interactor.reorder_fields(
+            template_id="tpl_1", field_ids=["f1", "f4", "f2", "f3"],
+            user_id="user_1")
+
+        field_storage.update_field_orders.assert_called_once_with(
+            template_id="tpl_1", field_orders=result)
+        snapshot.assert_match(
+            repr(result),
+            "test_moving_one_field_writes_one_order.txt"
+        )
+
+    def test_dense_orders_are_renumbered(self, snapshot):
+        interactor, _ = self._get_interactor({1: "f1", 2: "f2", 3: "f3"})
+
+        result = interactor.reorder_fields(
+            template_id="tpl_1", field_ids=["f2", "f1", "f3"],
+            user_id="user_1")
+
+        snapshot.assert_match(
+            repr(result),
+            "test_dense_orders_are_renumbered.txt"
+        )
+
+    def test_unchanged_order_writes_nothing(self):
+        interactor, field_storage = self._get_interactor(
+            {1000: "f1", 2000: "f2"})
+
+        result = interactor.reorder_fields(
+            template_id="tpl_1", field_ids=["f1", "f2"], user_id="user_1")
+
+        assert result == {}
+        field_storage.update_field_orders.assert_not_called()
+
+    def test_reorder_must_list_every_field_once(self, snapshot):
+        interactor, field_storage = self._get_interactor(
+            {1000: "f1", 2000: "f2", 3000: "f3"})
+
+        with pytest.raises(InvalidFieldsReorderException) as exc:
+            interactor.reorder_fields(
+                template_id="tpl_1", field_ids=["f2", "f1", "f9"],
+                user_id="user_1")
+
+        field_storage.update_field_orders.assert_not_called()
+        snapshot.assert_match(
+            repr((exc.value.missing_field_ids, exc.value.unknown_field_ids)),
+            "test_reorder_must_list_every_field_once.txt"
+        )
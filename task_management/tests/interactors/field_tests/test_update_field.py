@@ -10,7 +10,8 @@ from task_management.exceptions.custom_exceptions import (
     UnexpectedFieldTypeFoundException,
     FieldNameAlreadyExistsException,
     FieldOrderAlreadyExistsException,
-    NotAccessToCreationException
+    NotAccessToCreationException,
+    FieldVersionConflictException
 )
 from task_management.interactors.field_interactors.update_field_interactor import (
     UpdateFieldInteractor
@@ -47,29 +48,27 @@ class TestUpdateFieldInteractor:
             order=1,
             config={"max_length": 10},
             is_required=True,
-            created_by="user_1"
+            created_by="user_1",
+            version=2
         )
 
     def _get_interactor(self, *,
                         user_exists=True,
                         template_exists=True,
                         permission=PermissionsEnum.ADMIN,
-                        name_exists=False,
-                        order_exists=False):
+                        update_error=None):
 
         field_storage = create_autospec(FieldStorageInterface)
         user_storage = create_autospec(UserStorageInterface)
         template_storage = create_autospec(TemplateStorageInterface)
         permission_storage = create_autospec(PermissionStorageInterface)
 
-        field_storage.check_field_exist.return_value = True
-        field_storage.check_field_name_except_this_field.return_value = name_exists
-        field_storage.check_field_order_exist.return_value = order_exists
         field_storage.update_field.return_value = self._get_field_dto()
+        field_storage.update_field.side_effect = update_error
 
         user_storage.check_user_exist.return_value = user_exists
         template_storage.check_template_exist.return_value = template_exists
-        permission_storage.get_user_access_permissions.return_value = permission
+        permission_storage.get_user_access_permissions.return_value = {'List': permission}
 
         interactor = UpdateFieldInteractor(
             user_storage=user_storage,
@@ -90,7 +89,8 @@ class TestUpdateFieldInteractor:
             order=1,
             config={"max_length": 10},
             is_required=True,
-            created_by="user_1"
+            created_by="user_1",
+            version=1
         )
         return replace(data, **overrides)
 
@@ -159,7 +159,8 @@ class TestUpdateFieldInteractor:
         )
 
     def test_update_field_duplicate_name(self, snapshot):
-        interactor = self._get_interactor(name_exists=True)
+        interactor = self._get_interactor(
+            update_error=FieldNameAlreadyExistsException(field_name="Priority"))
         update_field_data = self._get_update_dto()
 
         with pytest.raises(FieldNameAlreadyExistsException) as exc:
@@ -171,7 +172,8 @@ class TestUpdateFieldInteractor:
         )
 
     def test_update_field_duplicate_order(self, snapshot):
-        interactor = self._get_interactor(order_exists=True)
+        interactor = self._get_interactor(
+            update_error=FieldOrderAlreadyExistsException(field_order=1))
         update_field_data = self._get_update_dto()
 
         with pytest.raises(FieldOrderAlreadyExistsException) as exc:
@@ -180,4 +182,15 @@ class TestUpdateFieldInteractor:
         snapshot.assert_match(
             repr(exc.value.field_order),
             "test_update_field_duplicate_order.txt"
-        )
\ No newline at end of file
+        )
+
+    def test_update_field_stale_version(self):
+        interactor = self._get_interactor(
+            update_error=FieldVersionConflictException(field_id="field_1",
+                                                       version=1))
+        update_field_data = self._get_update_dto()
+
+        with pytest.raises(FieldVersionConflictException) as exc:
+            interactor.update_field(update_field_data)
+
+        assert (exc.value.field_id, exc.value.version) == ("field_1", 1)
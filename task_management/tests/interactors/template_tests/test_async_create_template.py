@@ -0,0 +1,91 @@
+import asyncio
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import (
+    NotAccessToCreationException
+)
+from task_management.interactors.dtos import (
+    CreateTemplateDTO,
+    TemplateDTO,
+    PermissionsEnum,
+    TemplateFieldIndexDTO
+)
+from task_management.interactors.storage_interface.async_field_storage_interface import \
+    AsyncFieldStorageInterface
+from task_management.interactors.storage_interface.async_permission_storage_interface import \
+    AsyncPermissionStorageInterface
+from task_management.interactors.storage_interface.async_template_storage_interface import \
+    AsyncTemplateStorageInterface
+from task_management.interactors.storage_interface.async_user_storage_interface import \
+    AsyncUserStorageInterface
+from task_management.interactors.template_interactors.async_create_template_interactor import \
+    AsyncCreateTemplateInteractor
+
+
+class TestAsyncCreateTemplateInteractor:
+
+    def _get_interactor(self, *, permission=PermissionsEnum.ADMIN):
+        field_storage = create_autospec(AsyncFieldStorageInterface)
+        user_storage = create_autospec(AsyncUserStorageInterface)
+        template_storage = create_autospec(AsyncTemplateStorageInterface)
+        permission_storage = create_autospec(AsyncPermissionStorageInterface)
+
+        user_storage.check_user_exist.return_value = True
+        permission_storage.get_user_access_permissions.return_value = {'List': permission}
+        template_storage.check_template_name_exist.return_value = False
+        template_storage.check_template_exist.return_value = True
+        template_storage.create_template.return_value = TemplateDTO(
+            template_id="tpl_1",
+            name="Bugs",
+            description="Bug tracking",
+            is_default=False,
+            created_by="user_1"
+        )
+        field_storage.get_template_field_index.return_value = TemplateFieldIndexDTO(
+            template_id="tpl_1", field_ids=set(), field_names={},
+            field_orders={})
+
+        interactor = AsyncCreateTemplateInteractor(
+            user_storage=user_storage,
+            field_storage=field_storage,
+            permission_storage=permission_storage,
+            template_storage=template_storage
+        )
+
+        return interactor, field_storage, template_storage
+
+    def _get_template_data(self):
+        return CreateTemplateDTO(
+            name="Bugs",
+            description="Bug tracking",
+            is_default=False,
+            created_by="user_1"
+        )
+
+    def test_create_template_successfully(self, snapshot):
+        interactor, field_storage, template_storage = self._get_interactor()
+
+        result = asyncio.run(
+            interactor.create_template(self._get_template_data()))
+
+        template_storage.check_default_template_exist.assert_not_awaited()
+        field_storage.bulk_create_fields.assert_awaited_once()
+        snapshot.assert_match(
+            repr(result),
+            "test_create_template_successfully.txt"
+        )
+
+    def test_create_template_permission_denied(self, snapshot):
+        interactor, field_storage, template_storage = self._get_interactor(
+            permission=PermissionsEnum.GUEST)
+
+        with pytest.raises(NotAccessToCreationException) as exc:
+            asyncio.run(interactor.create_template(self._get_template_data()))
+
+        template_storage.create_template.assert_not_awaited()
+        snapshot.assert_match(
+            repr(exc.value.user_id),
+            "test_create_template_permission_denied.txt"
+        )
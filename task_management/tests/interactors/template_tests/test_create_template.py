@@ -0,0 +1,138 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import (
+    UserNotFoundException,
+    NotAccessToCreationException,
+    AlreadyExistedTemplateNameException,
+    DefaultTemplateAlreadyExistedException
+)
+from task_management.interactors.dtos import (
+    CreateTemplateDTO,
+    TemplateDTO,
+    PermissionsEnum,
+    TemplateFieldIndexDTO
+)
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+
+
+class TestCreateTemplateInteractor:
+
+    def _get_storages(self, *, user_exists=True,
+                      permission=PermissionsEnum.ADMIN,
+                      name_exists=False, default_exists=False):
+        field_storage = create_autospec(FieldStorageInterface)
+        user_storage = create_autospec(UserStorageInterface)
+        template_storage = create_autospec(TemplateStorageInterface)
+        permission_storage = create_autospec(PermissionStorageInterface)
+
+        user_storage.check_user_exist.return_value = user_exists
+        permission_storage.get_user_access_permissions.return_value = {'List': permission}
+        template_storage.check_template_name_exist.return_value = name_exists
+        template_storage.check_default_template_exist.return_value = default_exists
+        template_storage.check_template_exist.return_value = True
+        template_storage.create_template.return_value = TemplateDTO(
+            template_id="tpl_1",
+            name="Bugs",
+            description="Bug tracking",
+            is_default=False,
+            created_by="user_1"
+        )
+        field_storage.get_template_field_index.return_value = TemplateFieldIndexDTO(
+            template_id="tpl_1", field_ids=set(), field_names={},
+            field_orders={})
+
+        return field_storage, user_storage, template_storage, permission_storage
+
+    def _get_interactor(self, storages):
+        field_storage, user_storage, template_storage, permission_storage = storages
+
+        return CreateTemplateInteractor(
+            user_storage=user_storage,
+            field_storage=field_storage,
+            permission_storage=permission_storage,
+            template_storage=template_storage
+        )
+
+    def _get_template_data(self, is_default=False):
+        return CreateTemplateDTO(
+            name="Bugs",
+            description="Bug tracking",
+            is_default=is_default,
+            created_by="user_1"
+        )
+
+    def test_create_template_successfully(self, snapshot):
+        storages = self._get_storages()
+        field_storage, user_storage, _, permission_storage = storages
+        interactor = self._get_interactor(storages)
+
+        result = interactor.create_template(self._get_template_data())
+
+        user_storage.check_user_exist.assert_called_once_with(user_id="user_1")
+        permission_storage.get_user_access_permissions.assert_called_once_with(
+            user_id="user_1")
+        field_storage.bulk_create_fields.assert_called_once()
+        snapshot.assert_match(
+            repr(result) + "\n" + "\n".join(
+                repr(field) for field in
+                field_storage.bulk_create_fields.call_args.kwargs[
+                    "create_fields_data"]),
+            "test_create_template_successfully.txt"
+        )
+
+    def test_create_template_user_not_found(self, snapshot):
+        interactor = self._get_interactor(self._get_storages(user_exists=False))
+
+        with pytest.raises(UserNotFoundException) as exc:
+            interactor.create_template(self._get_template_data())
+
+        snapshot.assert_match(
+            repr(exc.value.user_id),
+            "test_create_template_user_not_found.txt"
+        )
+
+    def test_create_template_permission_denied(self, snapshot):
+        interactor = self._get_interactor(
+            self._get_storages(permission=PermissionsEnum.GUEST))
+
+        with pytest.raises(NotAccessToCreationException) as exc:
+            interactor.create_template(self._get_template_data())
+
+        snapshot.assert_match(
+            repr(exc.value.user_id),
+            "test_create_template_permission_denied.txt"
+        )
+
+    def test_create_template_duplicate_name(self, snapshot):
+        interactor = self._get_interactor(self._get_storages(name_exists=True))
+
+        with pytest.raises(AlreadyExistedTemplateNameException) as exc:
+            interactor.create_template(self._get_template_data())
+
+        snapshot.assert_match(
+            repr(exc.value.template_name),
+            "test_create_template_duplicate_name.txt"
+        )
+
+    def test_create_template_default_already_exists(self, snapshot):
+        interactor = self._get_interactor(
+            self._get_storages(default_exists=True))
+
+        with pytest.raises(DefaultTemplateAlreadyExistedException) as exc:
+            interactor.create_template(self._get_template_data(is_default=True))
+
+        snapshot.assert_match(
+            repr(exc.value.template_name),
+            "test_create_template_default_already_exists.txt"
+        )
@@ -0,0 +1,110 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    AlreadyExistedTemplateNameException
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    UserDTO, PermissionsEnum, ChangeEntityEnum, ChangeOperationEnum, \
+    UpdateFieldDTO, DEFAULT_FIELDS
+from task_management.interactors.field_interactors.update_field_interactor import \
+    UpdateFieldInteractor
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.interactors.template_interactors.get_changes_interactor import \
+    GetChangesInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage, InMemoryChangeFeedStorage
+
+
+class TestGetChanges:
+
+    @pytest.fixture
+    def database(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        return database
+
+    @pytest.fixture
+    def interactor(self, database):
+        return GetChangesInteractor(
+            change_feed_storage=InMemoryChangeFeedStorage(database))
+
+    @pytest.fixture
+    def template(self, database):
+        return CreateTemplateInteractor(
+            user_storage=InMemoryUserStorage(database),
+            field_storage=InMemoryFieldStorage(database),
+            permission_storage=InMemoryPermissionStorage(database),
+            template_storage=InMemoryTemplateStorage(database)
+        ).create_template(CreateTemplateDTO(
+            name="Bugs", description="", is_default=False,
+            created_by="user_1"))
+
+    def test_create_template_appends_template_then_fields(self, interactor,
+                                                          template):
+        page = interactor.get_changes()
+
+        assert [(change.entity, change.operation)
+                for change in page.changes] == \
+            [(ChangeEntityEnum.Template, ChangeOperationEnum.Created)] + \
+            [(ChangeEntityEnum.Field, ChangeOperationEnum.Created)] * \
+            len(DEFAULT_FIELDS)
+        assert {change.template_id for change in page.changes} == \
+            {template.template_id}
+        assert page.changes[0].data["name"] == "Bugs"
+        assert (page.next_since, page.has_more) == \
+            (page.changes[-1].sequence, False)
+
+    def test_update_field_appends_new_version(self, database, interactor,
+                                              template):
+        since = interactor.get_changes().next_since
+        field = InMemoryFieldStorage(database).get_templates_fields(
+            template_ids=[template.template_id])[0]
+
+        UpdateFieldInteractor(
+            field_storage=InMemoryFieldStorage(database),
+            user_storage=InMemoryUserStorage(database),
+            template_storage=InMemoryTemplateStorage(database),
+            permission_storage=InMemoryPermissionStorage(database)
+        ).update_field(UpdateFieldDTO(
+            field_id=field.field_id, template_id=template.template_id,
+            field_type=field.field_type, field_name="Renamed",
+            description=field.description, order=field.order,
+            config=field.config, is_required=field.is_required,
+            created_by="user_1", version=field.version))
+
+        [change] = interactor.get_changes(since=since).changes
+        assert (change.entity_id, change.operation) == \
+            (field.field_id, ChangeOperationEnum.Updated)
+        assert (change.data["field_name"], change.data["version"]) == \
+            ("Renamed", field.version + 1)
+
+    def test_rolled_back_write_appends_nothing(self, database, interactor,
+                                               template):
+        since = interactor.get_changes().next_since
+
+        with pytest.raises(AlreadyExistedTemplateNameException):
+            InMemoryTemplateStorage(database).bulk_create_templates([
+                CreateTemplateDTO(name="Tasks", description="",
+                                  is_default=False, created_by="user_1"),
+                CreateTemplateDTO(name="Bugs", description="",
+                                  is_default=False, created_by="user_1"),
+            ])
+
+        assert interactor.get_changes(since=since).changes == []
+
+    def test_pages_follow_the_cursor(self, interactor, template):
+        first_page = interactor.get_changes(limit=2)
+        second_page = interactor.get_changes(since=first_page.next_since,
+                                             limit=len(DEFAULT_FIELDS))
+
+        assert first_page.has_more is True
+        assert second_page.has_more is False
+        assert [change.sequence for change in
+                first_page.changes + second_page.changes] == \
+            [change.sequence for change in interactor.get_changes().changes]
+        assert interactor.get_changes(
+            since=second_page.next_since).next_since == \
+            second_page.next_since
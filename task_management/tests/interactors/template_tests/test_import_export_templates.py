@@ -0,0 +1,190 @@
+import json
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    InvalidTemplateImportLineException, ValidationErrorsException, \
+    TemplateImportErrorsException
+from task_management.interactors.dtos import UserDTO, PermissionsEnum, \
+    ImportTemplatesResultDTO, DEFAULT_FIELDS
+from task_management.interactors.template_interactors.export_templates_interactor import \
+    ExportTemplatesInteractor
+from task_management.interactors.template_interactors.import_templates_interactor import \
+    ImportTemplatesInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+
+
+class TestImportExportTemplates:
+
+    @pytest.fixture
+    def database(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        database.add_user(UserDTO(user_id="guest", full_name="Guest",
+                                  email="guest@example.com"))
+        return database
+
+    @pytest.fixture
+    def interactor(self, database):
+        return ImportTemplatesInteractor(
+            user_storage=InMemoryUserStorage(database),
+            field_storage=InMemoryFieldStorage(database),
+            permission_storage=InMemoryPermissionStorage(database),
+            template_storage=InMemoryTemplateStorage(database))
+
+    @staticmethod
+    def _get_line(name: str, fields=None, **template) -> str:
+        line = {"name": name, "created_by": "user_1", **template}
+        if fields is not None:
+            line["fields"] = fields
+        return json.dumps(line) + "\n"
+
+    def test_import_then_export_round_trips(self, database, interactor):
+        lines = [
+            self._get_line("Bugs", fields=[
+                {"field_type": "text", "field_name": "Title",
+                 "config": {"max_length": 80}, "is_required": True},
+                {"field_type": "number", "field_name": "Points",
+                 "order": 500},
+            ]),
+            "\n",
+            self._get_line("Tasks", is_default=True),
+        ]
+
+        result = interactor.import_templates(lines=lines, chunk_size=1)
+        exported = [json.loads(line) for line in ExportTemplatesInteractor(
+            template_storage=InMemoryTemplateStorage(database),
+            field_storage=InMemoryFieldStorage(database)
+        ).export_templates(chunk_size=1)]
+
+        assert result == ImportTemplatesResultDTO(
+            templates_count=2, fields_count=2 + len(DEFAULT_FIELDS))
+        assert [(field["field_name"], field["order"])
+                for field in exported[0]["fields"]] == \
+            [("Points", 500), ("Title", 1500)]
+        assert exported[1]["is_default"] is True
+        assert len(exported[1]["fields"]) == len(DEFAULT_FIELDS)
+        assert interactor.import_templates(lines=[]) == \
+            ImportTemplatesResultDTO(templates_count=0, fields_count=0)
+
+    @pytest.mark.parametrize("bad_line, code", [
+        ("{not json", "InvalidJSON"),
+        ('{"name": "No owner"}', "InvalidTemplateLine"),
+        ('{"name": "Bugs", "created_by": "user_1"}',
+         "AlreadyExistedTemplateNameException"),
+        ('{"name": "Guest", "created_by": "guest"}',
+         "NotAccessToCreationException"),
+        ('{"name": "Rated", "created_by": "user_1", "fields": '
+         '[{"field_type": "rating", "field_name": "Stars"}]}',
+         "UnexpectedFieldTypeFoundException"),
+        ('{"name": "Twice", "created_by": "user_1", "fields": '
+         '[{"field_type": "text", "field_name": "A", "order": 1}, '
+         '{"field_type": "text", "field_name": "B", "order": 1}]}',
+         "FieldOrderAlreadyExistsException"),
+    ])
+    def test_invalid_line_stops_import_after_committed_chunks(
+            self, database, interactor, bad_line, code):
+        lines = [self._get_line("Bugs"), self._get_line("Tasks"), bad_line]
+
+        with pytest.raises(InvalidTemplateImportLineException) as exc:
+            interactor.import_templates(lines=lines, chunk_size=2)
+
+        assert (exc.value.line_number, exc.value.code) == (3, code)
+        assert sorted(database.template_names) == ["Bugs", "Tasks"]
+
+    def test_invalid_line_rolls_back_its_chunk(self, database, interactor):
+        lines = [self._get_line("Bugs"), self._get_line("Bugs")]
+
+        with pytest.raises(InvalidTemplateImportLineException) as exc:
+            interactor.import_templates(lines=lines, chunk_size=2)
+
+        assert exc.value.line_number == 2
+        assert database.templates == {}
+        assert database.fields == {}
+
+    def test_collect_errors_reports_every_line(self, database, interactor):
+        lines = [
+            self._get_line("Bugs"),
+            "{not json",
+            self._get_line("Bugs"),
+            self._get_line("Guest", created_by="guest", fields=[
+                {"field_type": "text", "field_name": "A"},
+                {"field_type": "rating", "field_name": "A"},
+            ]),
+            self._get_line("Tasks"),
+        ]
+
+        with pytest.raises(TemplateImportErrorsException) as exc:
+            interactor.import_templates(lines=lines, chunk_size=1,
+                                        collect_errors=True)
+
+        assert [(error["line_number"], error["code"], error.get("position"))
+                for error in exc.value.errors] == [
+            (2, "InvalidJSON", None),
+            (3, "AlreadyExistedTemplateNameException", None),
+            (4, "NotAccessToCreationException", None),
+            (4, "FieldNameAlreadyExistsException", 1),
+            (4, "UnexpectedFieldTypeFoundException", 1),
+        ]
+        assert list(database.template_names) == ["Bugs"]
+        assert (exc.value.templates_count, exc.value.fields_count,
+                exc.value.last_committed_line) == (1, len(DEFAULT_FIELDS), 1)
+
+    @pytest.mark.parametrize("field, code", [
+        ({"field_type": "text", "field_name": "A", "config": "bad"},
+         "InvalidTemplateLine"),
+        ({"field_type": "text", "field_name": "A", "order": "7"},
+         "InvalidTemplateLine"),
+        ({"field_type": "text", "field_name": "A", "order": True},
+         "InvalidTemplateLine"),
+        ({"field_type": ["text"], "field_name": "A"}, "InvalidTemplateLine"),
+        ({"field_type": "text", "field_name": "A", "is_required": "yes"},
+         "InvalidTemplateLine"),
+        ({"field_type": "number", "field_name": "A",
+          "config": {"min": "a", "default": 3}},
+         "InvalidFieldConfigException"),
+        ({"field_type": "text", "field_name": "A",
+          "config": {"max_length": "80"}}, "InvalidFieldConfigException"),
+    ])
+    @pytest.mark.parametrize("collect_errors", [False, True])
+    def test_wrongly_typed_field_is_reported_for_its_line(
+            self, database, interactor, field, code, collect_errors):
+        lines = [self._get_line("Bugs", fields=[field])]
+
+        with pytest.raises((InvalidTemplateImportLineException,
+                            ValidationErrorsException)) as exc:
+            interactor.import_templates(lines=lines,
+                                        collect_errors=collect_errors)
+
+        errors = exc.value.errors if collect_errors else \
+            [{"line_number": exc.value.line_number, "code": exc.value.code}]
+        assert [(error["line_number"], error["code"])
+                for error in errors] == [(1, code)]
+        assert database.templates == {}
+
+    @pytest.mark.parametrize("line", [
+        '["Bugs"]',
+        '{"name": 1, "created_by": "user_1"}',
+        '{"name": "Bugs", "created_by": ["user_1"]}',
+        '{"name": "Bugs", "created_by": "user_1", "is_default": "no"}',
+        '{"name": "Bugs", "created_by": "user_1", "fields": {}}',
+        '{"name": "Bugs", "created_by": "user_1", "fields": ["Title"]}',
+        '{"name": "Bugs", "created_by": "user_1", "fields": [{"field_type": '
+        '"text"}]}',
+    ])
+    def test_wrongly_typed_template_line_is_invalid(self, interactor, line):
+        with pytest.raises(InvalidTemplateImportLineException) as exc:
+            interactor.import_templates(lines=[line])
+
+        assert (exc.value.line_number, exc.value.code) == \
+            (1, "InvalidTemplateLine")
+
+    def test_null_fields_get_the_default_fields(self, interactor):
+        result = interactor.import_templates(lines=[json.dumps(
+            {"name": "Bugs", "created_by": "user_1", "fields": None})])
+
+        assert result.fields_count == len(DEFAULT_FIELDS)
@@ -0,0 +1,52 @@
+import pytest
+
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, FieldTypeEnum, SearchResultDTO
+from task_management.interactors.template_interactors.search_templates_interactor import \
+    SearchTemplatesInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryTemplateStorage, InMemoryFieldStorage, InMemorySearchStorage
+
+
+class TestSearchTemplates:
+
+    @pytest.fixture
+    def database(self):
+        return InMemoryDatabase()
+
+    @pytest.fixture
+    def interactor(self, database):
+        return SearchTemplatesInteractor(
+            search_storage=InMemorySearchStorage(database))
+
+    @pytest.fixture
+    def template(self, database):
+        return InMemoryTemplateStorage(database).create_template(
+            CreateTemplateDTO(name="Sprint planning",
+                              description="Bug triage board",
+                              is_default=False, created_by="user_1"))
+
+    def test_search_ranks_names_first(self, database, interactor, template):
+        field = InMemoryFieldStorage(database).create_field(CreateFieldDTO(
+            field_type=FieldTypeEnum.Text, field_name="Bug severity",
+            description="", template_id=template.template_id, order=1000,
+            config={}, is_required=False, created_by="user_1"))
+
+        assert interactor.search(query="bug") == [
+            SearchResultDTO(template_id=template.template_id,
+                            field_id=field.field_id, name="Bug severity",
+                            rank=-10),
+            SearchResultDTO(template_id=template.template_id, field_id=None,
+                            name="Sprint planning", rank=-1),
+        ]
+
+    def test_every_word_must_match_a_word_prefix(self, interactor, template):
+        assert [result.name for result in
+                interactor.search(query="  spr, TRI! ")] == \
+            ["Sprint planning"]
+        assert interactor.search(query="sprint ugs") == []
+
+    @pytest.mark.parametrize("query", ["", "  ", "-*()"])
+    def test_query_without_words_returns_nothing(self, interactor, template,
+                                                 query):
+        assert interactor.search(query=query) == []
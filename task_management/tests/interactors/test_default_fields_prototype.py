@@ -0,0 +1,78 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    FieldNameAlreadyExistsException, InvalidFieldConfigException
+from task_management.interactors.default_fields_prototype import \
+    DefaultFieldsPrototype, default_fields_prototype
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    FieldTypeEnum, UserDTO, PermissionsEnum, DEFAULT_FIELDS
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+
+
+class TestDefaultFieldsPrototype:
+
+    def test_stamp_copies_default_fields(self):
+        fields = default_fields_prototype.stamp(template_id="tpl_1",
+                                                created_by="user_1")
+
+        assert [field.field_name for field in fields] == \
+            [field["field_name"] for field in DEFAULT_FIELDS]
+        assert {field.template_id for field in fields} == {"tpl_1"}
+
+    def test_stamps_do_not_share_configs(self):
+        first = default_fields_prototype.stamp(template_id="tpl_1",
+                                               created_by="user_1")
+        first[0].config["max_length"] = 1
+
+        second = default_fields_prototype.stamp(template_id="tpl_2",
+                                                created_by="user_1")
+
+        assert second[0].config == {"max_length": 255}
+
+    def test_missing_orders_are_assigned(self):
+        prototype = DefaultFieldsPrototype(fields=[
+            {"field_type": FieldTypeEnum.Text, "field_name": "Title"},
+            {"field_type": "checkbox", "field_name": "Done"},
+        ])
+
+        assert [field.order for field in prototype.stamp(
+            template_id="tpl_1", created_by="user_1")] == [1000, 2000]
+
+    @pytest.mark.parametrize("fields, exception", [
+        ([{"field_type": "text", "field_name": "Title"},
+          {"field_type": "number", "field_name": "Title"}],
+         FieldNameAlreadyExistsException),
+        ([{"field_type": "dropdown", "field_name": "Status",
+           "config": {"options": []}}],
+         InvalidFieldConfigException),
+    ])
+    def test_invalid_prototype_is_rejected_when_built(self, fields,
+                                                      exception):
+        with pytest.raises(exception):
+            DefaultFieldsPrototype(fields=fields)
+
+    def test_workspace_prototype_is_stamped_on_new_templates(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.ADMIN})
+        field_storage = InMemoryFieldStorage(database)
+        interactor = CreateTemplateInteractor(
+            user_storage=InMemoryUserStorage(database),
+            field_storage=field_storage,
+            permission_storage=InMemoryPermissionStorage(database),
+            template_storage=InMemoryTemplateStorage(database),
+            default_fields=DefaultFieldsPrototype(fields=[
+                {"field_type": "text", "field_name": "Customer"}]))
+
+        template = interactor.create_template(CreateTemplateDTO(
+            name="Support", description="", is_default=False,
+            created_by="user_1"))
+
+        assert [field.field_name for field in
+                field_storage.get_templates_fields([template.template_id])] \
+            == ["Customer"]
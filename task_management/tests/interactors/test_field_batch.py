@@ -0,0 +1,38 @@
+from task_management.interactors.dtos import FieldDTO, FieldTypeEnum
+from task_management.interactors.field_batch import FieldBatch
+
+
+def _get_field(position: int, field_type: FieldTypeEnum, config: dict,
+               template_id: str = "tpl_1") -> FieldDTO:
+    return FieldDTO(field_id=f"field_{position}", field_type=field_type,
+                    description="", template_id=template_id,
+                    field_name=f"Field {position}", order=position * 1000,
+                    config=config, is_required=position % 2 == 0,
+                    created_by="user_1")
+
+
+class TestFieldBatch:
+
+    def test_round_trips_fields(self):
+        fields = [_get_field(position, field_type, {"default": None})
+                  for position, field_type in enumerate(FieldTypeEnum)]
+
+        batch = FieldBatch.from_fields(fields)
+
+        assert len(batch) == len(fields)
+        assert list(batch) == fields
+        assert batch.get_field_type(position=2) == fields[2].field_type
+
+    def test_shares_equal_configs_and_interns_ids(self):
+        template_id = "".join(["tpl", "_2"])
+        fields = [_get_field(position, FieldTypeEnum.Dropdown,
+                             {"options": ["Low", "High"]},
+                             template_id=template_id if position else "tpl_1")
+                  for position in range(3)]
+
+        batch = FieldBatch.from_fields(fields)
+
+        assert batch.configs[0] is batch.configs[1] is batch.configs[2]
+        assert batch.template_ids[1] is batch.template_ids[2]
+        assert batch.get_template_positions() == {"tpl_1": [0],
+                                                  "tpl_2": [1, 2]}
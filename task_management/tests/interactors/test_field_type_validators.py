@@ -0,0 +1,76 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    UnexpectedFieldTypeFoundException, InvalidFieldConfigException, \
+    InvalidFieldDefaultValueException
+from task_management.interactors.dtos import FieldTypeEnum, DEFAULT_FIELDS
+from task_management.interactors.field_type_validators import \
+    get_field_type_validator
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+class TestFieldTypeValidators:
+
+    @pytest.mark.parametrize("field_type", list(FieldTypeEnum))
+    def test_every_field_type_has_a_validator(self, field_type):
+        assert get_field_type_validator(field_type) is \
+            get_field_type_validator(field_type.value)
+
+    @pytest.mark.parametrize("field", DEFAULT_FIELDS,
+                             ids=[field["field_name"] for field in DEFAULT_FIELDS])
+    def test_default_fields_are_valid(self, field):
+        ValidationMixin.validate_field_config_and_default(
+            field_type=field["field_type"].value,
+            config=field.get("config", {}))
+
+    def test_unknown_field_type(self):
+        with pytest.raises(UnexpectedFieldTypeFoundException) as exc:
+            ValidationMixin.validate_field_config_and_default(
+                field_type="rating", config={})
+
+        assert exc.value.field_type == "rating"
+
+    @pytest.mark.parametrize("field_type, config", [
+        (FieldTypeEnum.Text, {"options": ["a"]}),
+        (FieldTypeEnum.Dropdown, {"options": []}),
+        (FieldTypeEnum.Checkbox, {"max_length": 1}),
+        (FieldTypeEnum.Text, "bad"),
+        (FieldTypeEnum.Text, {"max_length": "80"}),
+        (FieldTypeEnum.Text, {"max_length": -1}),
+        (FieldTypeEnum.Number, {"min": "a", "default": 3}),
+        (FieldTypeEnum.Number, {"max": False}),
+        (FieldTypeEnum.Number, {"min": 10, "max": 1}),
+        (FieldTypeEnum.Text, {"max_length": True}),
+        (FieldTypeEnum.Text, {"max_length": 8.0}),
+    ])
+    def test_invalid_config(self, field_type, config):
+        with pytest.raises(InvalidFieldConfigException):
+            ValidationMixin.validate_field_config_and_default(
+                field_type=field_type.value, config=config)
+
+    @pytest.mark.parametrize("field_type, config", [
+        (FieldTypeEnum.Text, {"max_length": 2, "default": "abc"}),
+        (FieldTypeEnum.Number, {"min": 1, "default": 0}),
+        (FieldTypeEnum.Number, {"default": True}),
+        (FieldTypeEnum.Dropdown, {"options": ["Low"], "default": "High"}),
+        (FieldTypeEnum.Checkbox, {"default": "yes"}),
+        (FieldTypeEnum.Date, {"default": "18/10/2026"}),
+        (FieldTypeEnum.email, {"default": "not-an-email"}),
+    ])
+    def test_invalid_default_value(self, field_type, config):
+        with pytest.raises(InvalidFieldDefaultValueException):
+            ValidationMixin.validate_field_config_and_default(
+                field_type=field_type.value, config=config)
+
+    @pytest.mark.parametrize("field_type, config", [
+        (FieldTypeEnum.Number, {"min": 0, "max": 10, "default": 5}),
+        (FieldTypeEnum.Number, {"min": 3, "max": 3}),
+        (FieldTypeEnum.Text, {"max_length": 0}),
+        (FieldTypeEnum.User, {"default": "user_1"}),
+        (FieldTypeEnum.Date, {"default": "2026-10-18"}),
+        (FieldTypeEnum.Checkbox, {"default": False}),
+        (FieldTypeEnum.email, {"default": "ada@example.com"}),
+    ])
+    def test_valid_default_value(self, field_type, config):
+        ValidationMixin.validate_field_config_and_default(
+            field_type=field_type.value, config=config)
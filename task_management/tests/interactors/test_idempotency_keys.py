@@ -0,0 +1,120 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    IdempotencyKeyMismatchException, DuplicateIdempotencyKeyException
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, FieldTypeEnum, UserDTO, PermissionsEnum, TemplateDTO
+from task_management.interactors.field_interactors.create_field_interactor import \
+    CreateFieldInteractor
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+from task_management.storages.storage_tracer import StorageTracer
+from task_management.tests.storage_call_budget import \
+    assert_storage_call_budget
+
+
+class TestIdempotencyKeys:
+
+    @pytest.fixture
+    def tracer(self):
+        return StorageTracer()
+
+    @pytest.fixture
+    def storages(self, tracer):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+
+        return {
+            "user_storage": tracer.wrap(InMemoryUserStorage(database)),
+            "permission_storage": tracer.wrap(
+                InMemoryPermissionStorage(database)),
+            "template_storage": tracer.wrap(InMemoryTemplateStorage(database)),
+            "field_storage": tracer.wrap(InMemoryFieldStorage(database)),
+        }
+
+    @staticmethod
+    def _get_template_data(name="Bugs", idempotency_key="key-1"):
+        return CreateTemplateDTO(name=name, description="", is_default=False,
+                                 created_by="user_1",
+                                 idempotency_key=idempotency_key)
+
+    @staticmethod
+    def _get_field_data(template_id: str, field_name="Severity"):
+        return CreateFieldDTO(field_type=FieldTypeEnum.Text,
+                              field_name=field_name, description="",
+                              template_id=template_id, order=None, config={},
+                              is_required=False, created_by="user_1",
+                              idempotency_key="key-1")
+
+    def test_retried_create_template_returns_stored_template(
+            self, tracer, storages):
+        interactor = CreateTemplateInteractor(**storages)
+        template = interactor.create_template(self._get_template_data())
+
+        with assert_storage_call_budget(tracer, max_calls=1):
+            result = interactor.create_template(self._get_template_data())
+
+        assert result == template
+        assert len(storages["field_storage"].get_templates_fields(
+            [template.template_id])) == 5
+
+    def test_retried_create_field_returns_stored_field(self, tracer,
+                                                       storages):
+        template = CreateTemplateInteractor(**storages).create_template(
+            self._get_template_data(idempotency_key=None))
+        interactor = CreateFieldInteractor(**storages)
+        field = interactor.create_field(
+            self._get_field_data(template.template_id))
+
+        with assert_storage_call_budget(tracer, max_calls=1):
+            result = interactor.create_field(
+                self._get_field_data(template.template_id))
+
+        assert result == field
+
+    def test_reused_key_with_other_request_is_rejected(self, storages):
+        interactor = CreateTemplateInteractor(**storages)
+        interactor.create_template(self._get_template_data())
+
+        with pytest.raises(IdempotencyKeyMismatchException):
+            interactor.create_template(self._get_template_data(name="Tasks"))
+
+    def test_request_losing_a_race_returns_winners_template(self):
+        template = TemplateDTO(template_id="tpl_1", name="Bugs",
+                               description="", is_default=False,
+                               created_by="user_1")
+        template_storage = create_autospec(TemplateStorageInterface)
+        user_storage = create_autospec(UserStorageInterface)
+        permission_storage = create_autospec(PermissionStorageInterface)
+        user_storage.check_user_exist.return_value = True
+        permission_storage.get_user_access_permissions.return_value = \
+            {"List": PermissionsEnum.MEMBER}
+        template_storage.check_template_name_exist.return_value = False
+        template_storage.get_template_by_idempotency_key.side_effect = \
+            [None, template]
+        template_storage.create_template.side_effect = \
+            DuplicateIdempotencyKeyException(idempotency_key="key-1")
+
+        result = CreateTemplateInteractor(
+            user_storage=user_storage,
+            field_storage=create_autospec(FieldStorageInterface),
+            permission_storage=permission_storage,
+            template_storage=template_storage
+        ).create_template(self._get_template_data())
+
+        assert result == template
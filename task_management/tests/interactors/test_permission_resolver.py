@@ -0,0 +1,123 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.interactors.dtos import PermissionsEnum, \
+    PermissionActionEnum, PERMISSION_SCOPES
+from task_management.interactors.permission_resolver import \
+    PermissionResolver
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPermissionResolver:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def permission_storage(self):
+        permission_storage = create_autospec(PermissionStorageInterface)
+        levels = {"admin": PermissionsEnum.ADMIN,
+                  "member": PermissionsEnum.MEMBER}
+
+        permission_storage.get_users_access_permissions.side_effect = \
+            lambda user_ids: {
+                user_id: {scope: levels.get(user_id, PermissionsEnum.GUEST)
+                          for scope in PERMISSION_SCOPES}
+                for user_id in user_ids}
+        return permission_storage
+
+    @pytest.fixture
+    def resolver(self, permission_storage, clock):
+        return PermissionResolver(permission_storage=permission_storage,
+                                  ttl_seconds=10, max_size=2, clock=clock)
+
+    @pytest.mark.parametrize("user_id, action, expected", [
+        ("admin", PermissionActionEnum.DELETE, True),
+        ("member", PermissionActionEnum.CREATE, True),
+        ("member", PermissionActionEnum.DELETE, False),
+        ("guest", PermissionActionEnum.VIEW, True),
+        ("guest", PermissionActionEnum.CREATE, False),
+    ])
+    def test_can(self, resolver, user_id, action, expected):
+        result = resolver.can(user_id=user_id, action=action,
+                              resource_ids=["tpl_1", "tpl_2"])
+
+        assert result == {"tpl_1": expected, "tpl_2": expected}
+
+    def test_permissions_are_loaded_once_until_they_expire(
+            self, resolver, permission_storage, clock):
+        resolver.get_user_access_permissions(user_id="member")
+        resolver.can(user_id="member", action=PermissionActionEnum.VIEW,
+                     resource_ids=["tpl_1"] * 500)
+        clock.now = 11
+        result = resolver.get_user_access_permissions(user_id="member")
+
+        assert result["List"] == PermissionsEnum.MEMBER
+        assert permission_storage.get_users_access_permissions.call_count == 2
+
+    def test_batch_loads_only_missing_users(self, resolver,
+                                            permission_storage):
+        resolver.get_user_access_permissions(user_id="admin")
+        resolver.get_users_access_permissions(user_ids=["admin", "member"])
+
+        permission_storage.get_users_access_permissions.assert_called_with(
+            user_ids=["member"])
+
+    def test_invalidate_and_lru_eviction(self, resolver, permission_storage):
+        for user_id in ["admin", "member", "admin", "guest", "admin"]:
+            resolver.get_permission_mask(user_id=user_id)
+        resolver.invalidate(user_id="admin")
+        resolver.get_permission_mask(user_id="admin")
+        resolver.get_permission_mask(user_id="member")
+
+        assert permission_storage.get_users_access_permissions.call_count == 5
+
+    @pytest.mark.parametrize("invalidate", [
+        lambda resolver: resolver.invalidate(user_id="member"),
+        lambda resolver: resolver.clear(),
+    ])
+    def test_invalidation_during_a_load_is_not_overwritten(
+            self, resolver, permission_storage, invalidate):
+        load = permission_storage.get_users_access_permissions.side_effect
+
+        def load_and_invalidate(user_ids):
+            users_permissions = load(user_ids)
+            invalidate(resolver)
+            return users_permissions
+
+        permission_storage.get_users_access_permissions.side_effect = \
+            load_and_invalidate
+        resolver.get_permission_mask(user_id="member")
+        permission_storage.get_users_access_permissions.side_effect = load
+        resolver.get_permission_mask(user_id="member")
+        resolver.get_permission_mask(user_id="member")
+
+        assert permission_storage.get_users_access_permissions.call_count == 2
+        assert resolver._generations == {}
+
+    def test_failed_load_is_not_counted_as_in_flight(
+            self, resolver, permission_storage):
+        permission_storage.get_users_access_permissions.side_effect = \
+            RuntimeError
+
+        with pytest.raises(RuntimeError):
+            resolver.get_permission_mask(user_id="member")
+
+        assert resolver._loads_in_flight == 0
+
+    def test_scopes_match_model_choices(self):
+        from task_management.models import PermissionScope
+
+        assert tuple(PermissionScope.values) == PERMISSION_SCOPES
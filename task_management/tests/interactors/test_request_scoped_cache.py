@@ -0,0 +1,48 @@
+from unittest.mock import create_autospec
+
+from task_management.interactors.dtos import PermissionsEnum
+from task_management.interactors.request_scoped_cache import \
+    RequestScopedCache
+from task_management.interactors.storage_interface.permission_storage_interface import \
+    PermissionStorageInterface
+from task_management.interactors.storage_interface.user_storage_interface import \
+    UserStorageInterface
+
+
+class TestRequestScopedCache:
+
+    def _get_storages(self):
+        user_storage = create_autospec(UserStorageInterface)
+        permission_storage = create_autospec(PermissionStorageInterface)
+
+        user_storage.check_user_exist.return_value = True
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.ADMIN}
+
+        return user_storage, permission_storage
+
+    def test_lookups_are_resolved_once_per_scope(self):
+        user_storage, permission_storage = self._get_storages()
+
+        with RequestScopedCache(user_storage=user_storage,
+                                permission_storage=permission_storage) as cache:
+            for _ in range(3):
+                assert cache.user_storage.check_user_exist(user_id="user_1")
+                assert cache.permission_storage.get_user_access_permissions(
+                    user_id="user_1") == {'List': PermissionsEnum.ADMIN}
+
+        user_storage.check_user_exist.assert_called_once_with(user_id="user_1")
+        permission_storage.get_user_access_permissions.assert_called_once_with(
+            user_id="user_1")
+
+    def test_cache_is_discarded_when_scope_exits(self):
+        user_storage, permission_storage = self._get_storages()
+
+        with RequestScopedCache(user_storage=user_storage,
+                                permission_storage=permission_storage) as cache:
+            cache.permission_storage.get_user_access_permissions(
+                user_id="user_1")
+
+        permission_storage.get_user_access_permissions.return_value = {'List': PermissionsEnum.GUEST}
+
+        assert cache.permission_storage.get_user_access_permissions(
+            user_id="user_1") == {'List': PermissionsEnum.GUEST}
@@ -0,0 +1,132 @@
+import pytest
+from structlog.testing import capture_logs
+
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, UpdateFieldDTO, FieldTypeEnum, UserDTO, PermissionsEnum, \
+    PatchFieldDTO
+from task_management.interactors.field_interactors.create_field_interactor import \
+    CreateFieldInteractor
+from task_management.interactors.field_interactors.update_field_interactor import \
+    UpdateFieldInteractor
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+from task_management.storages.storage_tracer import StorageTracer
+from task_management.tests.storage_call_budget import \
+    assert_storage_call_budget
+
+
+class TestStorageCallBudgets:
+
+    @pytest.fixture
+    def tracer(self):
+        return StorageTracer()
+
+    @pytest.fixture
+    def storages(self, tracer):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+
+        return {
+            "user_storage": tracer.wrap(InMemoryUserStorage(database)),
+            "permission_storage": tracer.wrap(
+                InMemoryPermissionStorage(database)),
+            "template_storage": tracer.wrap(InMemoryTemplateStorage(database)),
+            "field_storage": tracer.wrap(InMemoryFieldStorage(database)),
+        }
+
+    @pytest.fixture
+    def template(self, storages):
+        return CreateTemplateInteractor(**storages).create_template(
+            CreateTemplateDTO(name="Bugs", description="", is_default=False,
+                              created_by="user_1"))
+
+    @staticmethod
+    def _get_create_field_dto(template_id: str, field_name: str) -> \
+            CreateFieldDTO:
+        return CreateFieldDTO(field_type=FieldTypeEnum.Text,
+                              field_name=field_name, description="",
+                              template_id=template_id, order=None, config={},
+                              is_required=False, created_by="user_1")
+
+    def test_create_template_budget(self, tracer, storages):
+        with assert_storage_call_budget(tracer, max_calls=6):
+            CreateTemplateInteractor(**storages).create_template(
+                CreateTemplateDTO(name="Bugs", description="",
+                                  is_default=False, created_by="user_1"))
+
+    def test_create_template_default_fields_are_one_insert(self, tracer,
+                                                          storages):
+        with tracer.track() as track:
+            CreateTemplateInteractor(**storages).create_template(
+                CreateTemplateDTO(name="Bugs", description="",
+                                  is_default=False, created_by="user_1"))
+
+        assert [call.method for call in track.get_calls()
+                if call.storage == "InMemoryFieldStorage"] == \
+            ["bulk_create_fields"]
+
+    def test_create_field_budget(self, tracer, storages, template):
+        with assert_storage_call_budget(tracer, max_calls=5):
+            CreateFieldInteractor(**storages).create_field(
+                self._get_create_field_dto(template.template_id, "Severity"))
+
+    def test_create_fields_budget_does_not_grow_with_batch(
+            self, tracer, storages, template):
+        with assert_storage_call_budget(tracer, max_calls=5):
+            CreateFieldInteractor(**storages).create_fields([
+                self._get_create_field_dto(template.template_id,
+                                           f"Field {position}")
+                for position in range(50)])
+
+    def test_update_field_budget(self, tracer, storages, template):
+        field = CreateFieldInteractor(**storages).create_field(
+            self._get_create_field_dto(template.template_id, "Severity"))
+
+        with assert_storage_call_budget(tracer, max_calls=4):
+            UpdateFieldInteractor(**storages).update_field(UpdateFieldDTO(
+                field_id=field.field_id, field_type=field.field_type,
+                description="", template_id=field.template_id,
+                field_name="Impact", order=field.order, config={},
+                is_required=False, created_by="user_1",
+                version=field.version))
+
+    def test_patch_field_description_budget(self, tracer, storages,
+                                            template):
+        field = CreateFieldInteractor(**storages).create_field(
+            self._get_create_field_dto(template.template_id, "Severity"))
+
+        with assert_storage_call_budget(tracer, max_calls=3):
+            UpdateFieldInteractor(**storages).patch_field(PatchFieldDTO(
+                field_id=field.field_id, template_id=field.template_id,
+                version=field.version, user_id="user_1",
+                description="How bad it is"))
+
+    def test_exceeded_budget_fails(self, tracer, storages):
+        with pytest.raises(AssertionError, match="used 6 storage calls"):
+            with assert_storage_call_budget(tracer, max_calls=5):
+                CreateTemplateInteractor(**storages).create_template(
+                    CreateTemplateDTO(name="Bugs", description="",
+                                      is_default=False, created_by="user_1"))
+
+    def test_calls_are_logged_with_issuing_interactor(self, tracer, storages,
+                                                      template):
+        with capture_logs() as logs:
+            CreateFieldInteractor(**storages).create_field(
+                self._get_create_field_dto(template.template_id, "Severity"))
+
+        assert [(log["storage"], log["method"]) for log in logs] == [
+            ("InMemoryUserStorage", "check_user_exist"),
+            ("InMemoryTemplateStorage", "check_template_exist"),
+            ("InMemoryPermissionStorage", "get_user_access_permissions"),
+            ("InMemoryFieldStorage", "get_template_field_index"),
+            ("InMemoryFieldStorage", "create_field"),
+        ]
+        assert {log["interactor"] for log in logs} == \
+            {"CreateFieldInteractor.create_field"}
+        assert logs[0]["kwargs"] == {"user_id": "user_1"}
+        assert all(log["duration_ms"] >= 0 for log in logs)
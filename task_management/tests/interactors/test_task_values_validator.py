@@ -0,0 +1,154 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    InvalidFieldDefaultValueException
+from task_management.interactors.dtos import FieldDTO, FieldTypeEnum, \
+    TaskValueErrorDTO, TaskValueErrorEnum, TemplateDTO
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.task_values_validator import \
+    TaskValuesValidator, TaskValuesValidatorCache
+from task_management.interactors.template_schema_cache import \
+    TemplateSchemaCache
+from task_management.interactors.validation_mixin import ValidationMixin
+
+
+def _get_field(field_id: str, field_type: FieldTypeEnum, config=None,
+               is_required=False) -> FieldDTO:
+    return FieldDTO(field_id=field_id, field_type=field_type, description="",
+                    template_id="tpl_1", field_name=field_id, order=1000,
+                    config=config or {}, is_required=is_required,
+                    created_by="user_1")
+
+
+class TestTaskValuesValidator:
+
+    @pytest.fixture
+    def validator(self):
+        return TaskValuesValidator(fields=[
+            _get_field("title", FieldTypeEnum.Text, {"max_length": 5},
+                       is_required=True),
+            _get_field("points", FieldTypeEnum.Number, {"min": 0, "max": 10}),
+            _get_field("status", FieldTypeEnum.Dropdown,
+                       {"options": ["Todo", "Done"]}),
+            _get_field("due", FieldTypeEnum.Date),
+            _get_field("owner", FieldTypeEnum.email),
+            _get_field("done", FieldTypeEnum.Checkbox),
+        ])
+
+    def test_valid_tasks_have_no_errors(self, validator):
+        result = validator.validate(tasks_values=[
+            {"title": "Task", "points": 3, "status": "Done",
+             "due": "2024-05-01", "owner": "a@example.com", "done": True},
+            {"title": "Other"},
+        ])
+
+        assert result == {}
+
+    @pytest.mark.parametrize("task_values, expected", [
+        ({}, TaskValueErrorDTO(field_id="title",
+                               error=TaskValueErrorEnum.REQUIRED)),
+        ({"title": 1}, TaskValueErrorDTO(
+            field_id="title", error=TaskValueErrorEnum.INVALID_TYPE, value=1)),
+        ({"title": "Too long"}, TaskValueErrorDTO(
+            field_id="title", error=TaskValueErrorEnum.TOO_LONG,
+            value="Too long")),
+        ({"title": "T", "points": True}, TaskValueErrorDTO(
+            field_id="points", error=TaskValueErrorEnum.INVALID_TYPE,
+            value=True)),
+        ({"title": "T", "points": -1}, TaskValueErrorDTO(
+            field_id="points", error=TaskValueErrorEnum.LESS_THAN_MIN,
+            value=-1)),
+        ({"title": "T", "points": 11}, TaskValueErrorDTO(
+            field_id="points", error=TaskValueErrorEnum.GREATER_THAN_MAX,
+            value=11)),
+        ({"title": "T", "status": "Blocked"}, TaskValueErrorDTO(
+            field_id="status", error=TaskValueErrorEnum.INVALID_OPTION,
+            value="Blocked")),
+        ({"title": "T", "due": "01/05/2024"}, TaskValueErrorDTO(
+            field_id="due", error=TaskValueErrorEnum.INVALID_DATE,
+            value="01/05/2024")),
+        ({"title": "T", "owner": "nobody"}, TaskValueErrorDTO(
+            field_id="owner", error=TaskValueErrorEnum.INVALID_EMAIL,
+            value="nobody")),
+        ({"title": "T", "done": "yes"}, TaskValueErrorDTO(
+            field_id="done", error=TaskValueErrorEnum.INVALID_TYPE,
+            value="yes")),
+        ({"title": "T", "rating": 5}, TaskValueErrorDTO(
+            field_id="rating", error=TaskValueErrorEnum.UNKNOWN_FIELD,
+            value=5)),
+    ])
+    def test_invalid_value(self, validator, task_values, expected):
+        result = validator.validate(tasks_values=[{"title": "Ok"},
+                                                  task_values])
+
+        assert result == {1: [expected]}
+
+    def test_value_reports_only_its_first_failed_check(self, validator):
+        result = validator.validate(tasks_values=[{"title": 123456}])
+
+        assert [error.error for error in result[0]] == \
+            [TaskValueErrorEnum.INVALID_TYPE]
+
+    def test_errors_are_collected_per_task(self, validator):
+        tasks_values = [{"title": "T", "points": position % 12}
+                        for position in range(1000)]
+
+        result = validator.validate(tasks_values=tasks_values)
+
+        assert sorted(result) == [position for position in range(1000)
+                                  if position % 12 == 11]
+
+
+class TestFieldFormatDefaults:
+
+    @pytest.mark.parametrize("field_type, default", [
+        (FieldTypeEnum.email, "not-an-email"),
+        (FieldTypeEnum.Date, "tomorrow"),
+    ])
+    def test_malformed_default(self, field_type, default):
+        with pytest.raises(InvalidFieldDefaultValueException):
+            ValidationMixin.validate_field_config_and_default(
+                field_type=field_type.value, config={"default": default})
+
+
+class TestTaskValuesValidatorCache:
+
+    @pytest.fixture
+    def storages(self):
+        template_storage = create_autospec(TemplateStorageInterface)
+        field_storage = create_autospec(FieldStorageInterface)
+        template_storage.is_in_transaction.return_value = False
+        template_storage.get_templates.return_value = [
+            TemplateDTO(template_id="tpl_1", name="Bugs", description="",
+                        is_default=False, created_by="user_1")]
+        field_storage.get_templates_fields.return_value = [
+            _get_field("title", FieldTypeEnum.Text, is_required=True)]
+
+        return {"template_storage": template_storage,
+                "field_storage": field_storage}
+
+    def test_validator_is_compiled_once_per_schema_version(self, storages):
+        schema_cache = TemplateSchemaCache()
+        cache = TaskValuesValidatorCache(schema_cache=schema_cache)
+
+        validator = cache.get_validator(template_id="tpl_1", **storages)
+        assert cache.get_validator(template_id="tpl_1", **storages) is \
+            validator
+
+        schema_cache.bump_version(template_id="tpl_1")
+        assert cache.get_validator(template_id="tpl_1", **storages) is not \
+            validator
+        assert storages["template_storage"].get_templates.call_count == 2
+
+    def test_validator_compiled_inside_a_transaction_is_not_stored(
+            self, storages):
+        storages["template_storage"].is_in_transaction.return_value = True
+        cache = TaskValuesValidatorCache(schema_cache=TemplateSchemaCache())
+
+        assert cache.get_validator(template_id="tpl_1", **storages) is not \
+            cache.get_validator(template_id="tpl_1", **storages)
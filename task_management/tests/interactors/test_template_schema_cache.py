@@ -0,0 +1,137 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    TemplateNotFoundException
+from task_management.interactors.dtos import TemplateDTO, FieldDTO, \
+    FieldTypeEnum
+from task_management.interactors.storage_interface.field_storage_interface import \
+    FieldStorageInterface
+from task_management.interactors.storage_interface.template_storage_interface import \
+    TemplateStorageInterface
+from task_management.interactors.template_schema_cache import \
+    TemplateSchemaCache
+
+
+class TestTemplateSchemaCache:
+
+    def _get_storages(self):
+        template_storage = create_autospec(TemplateStorageInterface)
+        field_storage = create_autospec(FieldStorageInterface)
+        template_storage.is_in_transaction.return_value = False
+
+        template_storage.get_templates.side_effect = lambda template_ids: [
+            TemplateDTO(template_id=template_id, name=template_id,
+                        description="", is_default=False, created_by="user_1")
+            for template_id in template_ids
+        ]
+        field_storage.get_templates_fields.return_value = [
+            FieldDTO(field_id="field_2", field_type=FieldTypeEnum.Date,
+                     description="", template_id="tpl_1",
+                     field_name="Due Date", order=2000, config={},
+                     is_required=False, created_by="user_1"),
+            FieldDTO(field_id="field_1", field_type=FieldTypeEnum.Text,
+                     description="", template_id="tpl_1", field_name="Title",
+                     order=1000, config={}, is_required=True,
+                     created_by="user_1"),
+        ]
+
+        return template_storage, field_storage
+
+    def test_schema_is_read_through_once(self):
+        template_storage, field_storage = self._get_storages()
+        cache = TemplateSchemaCache()
+
+        for _ in range(3):
+            result = cache.get_template_schema(
+                template_id="tpl_1", template_storage=template_storage,
+                field_storage=field_storage)
+
+        template_storage.get_templates.assert_called_once()
+        field_storage.get_templates_fields.assert_called_once()
+        assert [field.field_name for field in result.fields] == \
+            ["Title", "Due Date"]
+
+    def test_bumped_version_is_reloaded(self):
+        template_storage, field_storage = self._get_storages()
+        cache = TemplateSchemaCache()
+
+        cache.get_template_schema(
+            template_id="tpl_1", template_storage=template_storage,
+            field_storage=field_storage)
+        cache.bump_version(template_id="tpl_1")
+        cache.get_template_schema(
+            template_id="tpl_1", template_storage=template_storage,
+            field_storage=field_storage)
+
+        assert template_storage.get_templates.call_count == 2
+
+    def test_schema_loaded_during_a_write_is_not_stored(self):
+        template_storage, field_storage = self._get_storages()
+        cache = TemplateSchemaCache()
+        field_storage.get_templates_fields.side_effect = \
+            lambda template_ids: cache.bump_version(template_id="tpl_1") or []
+
+        cache.get_template_schema(
+            template_id="tpl_1", template_storage=template_storage,
+            field_storage=field_storage)
+        field_storage.get_templates_fields.side_effect = None
+        cache.get_template_schema(
+            template_id="tpl_1", template_storage=template_storage,
+            field_storage=field_storage)
+
+        assert template_storage.get_templates.call_count == 2
+
+    def test_schema_loaded_inside_a_transaction_is_not_stored(self):
+        template_storage, field_storage = self._get_storages()
+        template_storage.is_in_transaction.return_value = True
+        cache = TemplateSchemaCache()
+
+        for _ in range(2):
+            cache.get_template_schema(
+                template_id="tpl_1", template_storage=template_storage,
+                field_storage=field_storage)
+
+        assert template_storage.get_templates.call_count == 2
+
+    def test_versions_are_bounded_and_never_go_back(self):
+        template_storage, field_storage = self._get_storages()
+        cache = TemplateSchemaCache(max_size=2)
+        field_storage.get_templates_fields.side_effect = \
+            lambda template_ids: [cache.bump_version(template_id=template_id)
+                                  for template_id in
+                                  ["tpl_1", "tpl_2", "tpl_3"]] and []
+
+        cache.get_template_schema(
+            template_id="tpl_1", template_storage=template_storage,
+            field_storage=field_storage)
+        field_storage.get_templates_fields.side_effect = None
+        cache.get_template_schema(
+            template_id="tpl_1", template_storage=template_storage,
+            field_storage=field_storage)
+
+        assert list(cache._versions) == ["tpl_2", "tpl_3"]
+        assert cache.get_version(template_id="tpl_1") == 1
+        assert template_storage.get_templates.call_count == 2
+
+    def test_least_recently_used_schema_is_evicted(self):
+        template_storage, field_storage = self._get_storages()
+        cache = TemplateSchemaCache(max_size=2)
+
+        for template_id in ["tpl_1", "tpl_2", "tpl_1", "tpl_3", "tpl_1"]:
+            cache.get_template_schema(
+                template_id=template_id, template_storage=template_storage,
+                field_storage=field_storage)
+
+        assert template_storage.get_templates.call_count == 3
+
+    def test_missing_template(self):
+        template_storage, field_storage = self._get_storages()
+        template_storage.get_templates.side_effect = None
+        template_storage.get_templates.return_value = []
+
+        with pytest.raises(TemplateNotFoundException):
+            TemplateSchemaCache().get_template_schema(
+                template_id="tpl_9", template_storage=template_storage,
+                field_storage=field_storage)
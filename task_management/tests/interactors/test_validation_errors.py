@@ -0,0 +1,179 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from task_management.exceptions.custom_exceptions import \
+    ValidationErrorsException, UserNotFoundException
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, FieldTypeEnum, UserDTO, PermissionsEnum
+from task_management.interactors.field_interactors.async_create_field_interactor import \
+    AsyncCreateFieldInteractor
+from task_management.interactors.field_interactors.create_field_interactor import \
+    CreateFieldInteractor
+from task_management.interactors.template_interactors.async_create_template_interactor import \
+    AsyncCreateTemplateInteractor
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.interactors.validation_errors import \
+    ValidationErrorCollector
+from task_management.interactors.validation_mixin import ValidationMixin
+from task_management.storages.async_field_storage import AsyncFieldStorage
+from task_management.storages.async_permission_storage import \
+    AsyncPermissionStorage
+from task_management.storages.async_template_storage import \
+    AsyncTemplateStorage
+from task_management.storages.async_user_storage import AsyncUserStorage
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+
+
+class TestValidationErrors:
+
+    @pytest.fixture
+    def database(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        return database
+
+    @pytest.fixture
+    def template_id(self, database):
+        return InMemoryTemplateStorage(database).create_template(
+            CreateTemplateDTO(name="Bugs", description="", is_default=False,
+                              created_by="user_1")).template_id
+
+    @staticmethod
+    def _get_storages(database: InMemoryDatabase, is_async: bool) -> dict:
+        storages = {
+            "field_storage": InMemoryFieldStorage(database),
+            "user_storage": InMemoryUserStorage(database),
+            "template_storage": InMemoryTemplateStorage(database),
+            "permission_storage": InMemoryPermissionStorage(database),
+        }
+        if is_async:
+            storages = {
+                "field_storage": AsyncFieldStorage(storages["field_storage"]),
+                "user_storage": AsyncUserStorage(storages["user_storage"]),
+                "template_storage": AsyncTemplateStorage(
+                    storages["template_storage"]),
+                "permission_storage": AsyncPermissionStorage(
+                    storages["permission_storage"]),
+            }
+        return storages
+
+    @staticmethod
+    def _get_field(template_id: str, field_name: str, **field) -> \
+            CreateFieldDTO:
+        return CreateFieldDTO(**{
+            "field_type": FieldTypeEnum.Text, "field_name": field_name,
+            "description": "", "template_id": template_id, "order": None,
+            "config": {}, "is_required": False, "created_by": "user_1",
+            **field})
+
+    def test_collector_fails_fast_by_default(self):
+        errors = ValidationErrorCollector()
+
+        with pytest.raises(UserNotFoundException):
+            errors.run(ValidationMixin.check_user_exist, user_id="missing",
+                       user_storage=InMemoryUserStorage(InMemoryDatabase()))
+
+    def test_collector_does_not_swallow_other_exceptions(self):
+        errors = ValidationErrorCollector(collect=True)
+
+        with pytest.raises(KeyError):
+            errors.run({}.__getitem__, "missing")
+
+    def test_config_reports_bad_keys_and_bad_default(self):
+        errors = ValidationErrorCollector(collect=True)
+
+        ValidationMixin.validate_field_config_and_default(
+            field_type=FieldTypeEnum.Text.value,
+            config={"max_length": 3, "colour": "red", "default": "Too long"},
+            collector=errors)
+
+        assert [error["code"] for error in errors.errors] == [
+            "InvalidFieldConfigException", "InvalidFieldDefaultValueException"]
+
+    def test_collected_errors_keep_the_message(self):
+        errors = ValidationErrorCollector(collect=True)
+
+        ValidationMixin.validate_field_config_and_default(
+            field_type=FieldTypeEnum.Number.value,
+            config={"min": 1, "default": 0}, collector=errors)
+
+        assert errors.errors == [{
+            "code": "InvalidFieldDefaultValueException",
+            "message": "Default value 0 is less than minimum 1",
+            "field_type": "number",
+            "default_value": None,
+        }]
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_create_fields_collects_every_field(self, database, template_id,
+                                                is_async):
+        storages = self._get_storages(database=database, is_async=is_async)
+        if is_async:
+            create_fields = async_to_sync(
+                AsyncCreateFieldInteractor(**storages).create_fields)
+        else:
+            create_fields = CreateFieldInteractor(**storages).create_fields
+
+        with pytest.raises(ValidationErrorsException) as exc:
+            create_fields(create_fields_data=[
+                self._get_field(template_id, "Title"),
+                self._get_field(template_id, "Title"),
+                self._get_field(template_id, "Stars", field_type="rating"),
+                self._get_field(template_id, "Code",
+                                config={"colour": "red"}),
+            ], collect_errors=True)
+
+        assert [(error["position"], error["code"])
+                for error in exc.value.errors] == [
+            (2, "UnexpectedFieldTypeFoundException"),
+            (1, "FieldNameAlreadyExistsException"),
+            (3, "InvalidFieldConfigException"),
+        ]
+        assert database.fields == {}
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_create_template_collects_every_error(self, database,
+                                                  template_id, is_async):
+        storages = self._get_storages(database=database, is_async=is_async)
+        if is_async:
+            create_template = async_to_sync(
+                AsyncCreateTemplateInteractor(**storages).create_template)
+        else:
+            create_template = \
+                CreateTemplateInteractor(**storages).create_template
+
+        with pytest.raises(ValidationErrorsException) as exc:
+            create_template(CreateTemplateDTO(
+                name="Bugs", description="", is_default=False,
+                created_by="missing"), collect_errors=True)
+
+        assert {error["code"] for error in exc.value.errors} == {
+            "UserNotFoundException", "AlreadyExistedTemplateNameException"}
+        assert len(database.templates) == 1
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_create_field_collects_every_error(self, database, template_id,
+                                               is_async):
+        storages = self._get_storages(database=database, is_async=is_async)
+        if is_async:
+            create_field = async_to_sync(
+                AsyncCreateFieldInteractor(**storages).create_field)
+        else:
+            create_field = CreateFieldInteractor(**storages).create_field
+        create_field(self._get_field(template_id, "Title", order=1000))
+
+        with pytest.raises(ValidationErrorsException) as exc:
+            create_field(self._get_field(template_id, "Title", order=1000,
+                                         config={"colour": "red"}),
+                         collect_errors=True)
+
+        assert [error["code"] for error in exc.value.errors] == [
+            "FieldNameAlreadyExistsException",
+            "FieldOrderAlreadyExistsException",
+            "InvalidFieldConfigException",
+        ]
@@ -0,0 +1,163 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from task_management.schema.context import GraphQLContext
+from task_management.schema.schema import schema
+from task_management.tests.factories.model_factory import TemplateFactory, \
+    FieldFactory, UserPermissionFactory, UserFactory
+
+TEMPLATES_QUERY = """
+query {
+    templates(limit: 20) {
+        templateId
+        name
+        createdBy { fullName permissions { scope permission } }
+        fields { fieldName fieldType order createdBy { email } }
+    }
+}
+"""
+
+CREATE_TEMPLATE_MUTATION = """
+mutation CreateTemplate($templateData: CreateTemplateInput!) {
+    createTemplate(templateData: $templateData) {
+        name
+        fields { fieldName fieldType order }
+    }
+}
+"""
+
+COLLECT_CREATE_TEMPLATE_MUTATION = """
+mutation CreateTemplate($templateData: CreateTemplateInput!) {
+    createTemplate(templateData: $templateData, collectErrors: true) {
+        name
+    }
+}
+"""
+
+RENAME_DROPDOWN_OPTION_MUTATION = """
+mutation RenameDropdownOption($fieldId: ID!, $templateId: ID!,
+                              $optionId: ID!, $label: String!,
+                              $version: Int!, $userId: ID!) {
+    renameDropdownOption(fieldId: $fieldId, templateId: $templateId,
+                         optionId: $optionId, label: $label,
+                         version: $version, userId: $userId) {
+        config
+        version
+    }
+}
+"""
+
+
+def execute(query, variables=None):
+    async def execute_async():
+        with GraphQLContext(request=None) as context:
+            return await schema.execute_async(
+                query, variable_values=variables, context_value=context)
+
+    return async_to_sync(execute_async)()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestGraphQLAPI:
+
+    def test_templates_query_uses_constant_number_of_queries(
+            self, django_assert_num_queries):
+        for _ in range(10):
+            user = UserFactory()
+            UserPermissionFactory(user=user)
+            template = TemplateFactory(created_by=user)
+            FieldFactory.create_batch(3, template=template)
+
+        # templates, fields, users, permissions
+        with django_assert_num_queries(4):
+            result = execute(TEMPLATES_QUERY)
+
+        assert result.errors is None
+        assert len(result.data["templates"]) == 10
+        assert all(len(template["fields"]) == 3
+                   for template in result.data["templates"])
+
+    def test_create_template_mutation(self):
+        user = UserFactory()
+        UserPermissionFactory(user=user, permission="admin")
+
+        result = execute(CREATE_TEMPLATE_MUTATION, {"templateData": {
+            "name": "Bugs", "createdBy": str(user.user_id)}})
+
+        assert result.errors is None
+        assert result.data["createTemplate"]["name"] == "Bugs"
+        assert [field["fieldName"] for field in
+                result.data["createTemplate"]["fields"]] == \
+            ["Title", "Assignee", "Due Date", "Priority", "Status"]
+
+    def test_create_template_mutation_is_idempotent(self):
+        user = UserFactory()
+        UserPermissionFactory(user=user, permission="admin")
+        variables = {"templateData": {"name": "Bugs",
+                                      "createdBy": str(user.user_id),
+                                      "idempotencyKey": "key-1"}}
+
+        first = execute(CREATE_TEMPLATE_MUTATION, variables)
+        retry = execute(CREATE_TEMPLATE_MUTATION, variables)
+
+        assert retry.errors is None
+        assert retry.data == first.data
+
+    def test_create_template_mutation_reports_domain_error(self):
+        user = UserFactory()
+        UserPermissionFactory(user=user, permission="guest")
+
+        result = execute(CREATE_TEMPLATE_MUTATION, {"templateData": {
+            "name": "Bugs", "createdBy": str(user.user_id)}})
+
+        assert result.errors[0].extensions == {
+            "code": "NotAccessToCreationException",
+            "user_id": str(user.user_id)}
+
+    def test_create_template_mutation_collects_every_error(self):
+        user = UserFactory()
+        UserPermissionFactory(user=user, permission="guest")
+        TemplateFactory(name="Bugs")
+
+        result = execute(COLLECT_CREATE_TEMPLATE_MUTATION, {"templateData": {
+            "name": "Bugs", "createdBy": str(user.user_id)}})
+
+        assert result.errors[0].extensions["code"] == \
+            "ValidationErrorsException"
+        assert [error["code"] for error in
+                result.errors[0].extensions["errors"]] == [
+            "NotAccessToCreationException",
+            "AlreadyExistedTemplateNameException"]
+
+    def test_rename_dropdown_option_mutation_checks_version(self):
+        user = UserFactory()
+        UserPermissionFactory(user=user, permission="admin")
+        field = FieldFactory(template__created_by=user,
+                             field_type="dropdown",
+                             config={"options": ["Low", "High"]})
+        variables = {"fieldId": str(field.field_id),
+                     "templateId": str(field.template_id),
+                     "optionId": "Low", "label": "Minor", "version": 1,
+                     "userId": str(user.user_id)}
+
+        result = execute(RENAME_DROPDOWN_OPTION_MUTATION, variables)
+        stale = execute(RENAME_DROPDOWN_OPTION_MUTATION, variables)
+
+        assert result.errors is None
+        assert result.data["renameDropdownOption"] == {
+            "config": {"options": [{"id": "Low", "label": "Minor"},
+                                   {"id": "High", "label": "High"}]},
+            "version": 2}
+        assert stale.errors[0].extensions == {
+            "code": "FieldVersionConflictException",
+            "field_id": str(field.field_id), "version": 1}
+
+    def test_graphql_endpoint(self, client):
+        TemplateFactory(name="Bugs")
+
+        response = client.post("/graphql/",
+                               data={"query": "{ templates { name } }"},
+                               content_type="application/json")
+
+        assert response.status_code == 200
+        assert response.json() == {"data": {"templates": [{"name": "Bugs"}]}}
@@ -0,0 +1,22 @@
+from contextlib import contextmanager
+
+from task_management.storages.storage_tracer import StorageTracer
+
+
+@contextmanager
+def assert_storage_call_budget(tracer: StorageTracer, max_calls: int,
+                               interactor: str | None = None):
+    """
+    Fails when the block makes more than ``max_calls`` storage calls through
+    storages wrapped by ``tracer``. ``interactor`` limits the count to calls
+    issued by one interactor method, e.g. ``"CreateFieldInteractor.create_field"``.
+    """
+    with tracer.track() as track:
+        yield track
+
+    calls = track.get_calls(interactor=interactor)
+    assert len(calls) <= max_calls, (
+        f"{interactor or 'block'} used {len(calls)} storage calls, "
+        f"budget is {max_calls}:\n" + "\n".join(
+            f"  {call.interactor}: {call.storage}.{call.method}"
+            for call in calls))
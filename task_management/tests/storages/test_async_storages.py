@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+
+from asgiref.sync import async_to_sync
+
+from task_management.interactors.dtos import CreateFieldDTO, \
+    CreateTemplateDTO, FieldTypeEnum, PermissionsEnum, UserDTO
+from task_management.interactors.field_interactors.async_create_field_interactor import \
+    AsyncCreateFieldInteractor
+from task_management.storages import async_reads
+from task_management.storages.async_field_storage import AsyncFieldStorage
+from task_management.storages.async_permission_storage import \
+    AsyncPermissionStorage
+from task_management.storages.async_template_storage import \
+    AsyncTemplateStorage
+from task_management.storages.async_user_storage import AsyncUserStorage
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+
+READ_DELAY = 0.1
+
+
+class SlowReads:
+    """
+    Delays the wrapped storage's reads like a remote database would and
+    records the thread each read ran on.
+    """
+
+    def __init__(self, storage, reads: tuple[str, ...],
+                 events: list | None = None):
+        self._storage = storage
+        self._reads = reads
+        self.read_threads = []
+        self.events = [] if events is None else events
+
+    def __getattr__(self, name):
+        method = getattr(self._storage, name)
+        if name not in self._reads:
+            return method
+
+        def read(*args, **kwargs):
+            self.read_threads.append(threading.get_ident())
+            self.events.append(("read", threading.get_ident()))
+            time.sleep(READ_DELAY)
+            return method(*args, **kwargs)
+
+        return read
+
+
+class TestAsyncStorages:
+
+    def _get_database(self) -> tuple[InMemoryDatabase, str]:
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        template = InMemoryTemplateStorage(database).create_template(
+            CreateTemplateDTO(name="Bugs", description="", is_default=False,
+                              created_by="user_1"))
+        return database, template.template_id
+
+    def test_independent_reads_overlap(self):
+        database, template_id = self._get_database()
+        interactor = AsyncCreateFieldInteractor(
+            field_storage=AsyncFieldStorage(SlowReads(
+                InMemoryFieldStorage(database),
+                reads=("get_template_field_index",))),
+            user_storage=AsyncUserStorage(SlowReads(
+                InMemoryUserStorage(database), reads=("check_user_exist",))),
+            template_storage=AsyncTemplateStorage(SlowReads(
+                InMemoryTemplateStorage(database),
+                reads=("check_template_exist",))),
+            permission_storage=AsyncPermissionStorage(SlowReads(
+                InMemoryPermissionStorage(database),
+                reads=("get_user_access_permissions",))))
+
+        started_at = time.perf_counter()
+        async_to_sync(interactor.create_field)(CreateFieldDTO(
+            field_type=FieldTypeEnum.Text, field_name="Title",
+            description="", template_id=template_id, order=None, config={},
+            is_required=False, created_by="user_1"))
+        elapsed = time.perf_counter() - started_at
+
+        # Four reads one after another would take 4 * READ_DELAY.
+        assert elapsed < 2 * READ_DELAY
+
+    def test_worker_threads_close_their_connections_after_each_read(
+            self, monkeypatch):
+        database, template_id = self._get_database()
+        events = []
+
+        def close_old_connections():
+            events.append(("close", threading.get_ident()))
+
+        monkeypatch.setattr(async_reads, "close_old_connections",
+                            close_old_connections)
+        user_storage = AsyncUserStorage(SlowReads(
+            InMemoryUserStorage(database), reads=("check_user_exist",),
+            events=events))
+        template_storage = AsyncTemplateStorage(SlowReads(
+            InMemoryTemplateStorage(database),
+            reads=("check_template_exist",), events=events))
+
+        async def read():
+            return await asyncio.gather(
+                user_storage.check_user_exist(user_id="user_1"),
+                template_storage.check_template_exist(
+                    template_id=template_id))
+
+        assert async_to_sync(read)() == [True, True]
+        read_threads = {thread for event, thread in events
+                        if event == "read"}
+        assert threading.get_ident() not in read_threads
+        for thread in read_threads:
+            thread_events = [event for event, event_thread in events
+                             if event_thread == thread]
+            assert thread_events == ["read", "close"] * \
+                (len(thread_events) // 2)
+
+    def test_reads_inside_a_transaction_stay_on_its_thread(self):
+        database, template_id = self._get_database()
+        template_storage = SlowReads(InMemoryTemplateStorage(database),
+                                     reads=("check_template_exist",))
+        async_template_storage = AsyncTemplateStorage(template_storage)
+
+        async def read_in_transaction():
+            async with async_template_storage.atomic_transaction():
+                await async_template_storage.check_template_exist(
+                    template_id=template_id)
+
+        async_to_sync(read_in_transaction)()
+
+        assert template_storage.read_threads == [threading.get_ident()]
@@ -0,0 +1,71 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    FieldNameAlreadyExistsException, FieldVersionConflictException
+from task_management.interactors.dtos import CreateFieldDTO, FieldTypeEnum, \
+    CreateTemplateDTO, ChangeEntityEnum, ChangeOperationEnum
+from task_management.storages.change_feed_storage import ChangeFeedStorage
+from task_management.storages.field_storage import FieldStorage
+from task_management.storages.template_storage import TemplateStorage
+from task_management.tests.factories.model_factory import FieldFactory, \
+    UserFactory
+
+
+@pytest.mark.django_db
+class TestChangeFeedStorage:
+
+    def _get_changes(self, since: int = 0) -> list[tuple]:
+        return [(change.entity, change.entity_id, change.operation,
+                 change.data.get("version"))
+                for change in ChangeFeedStorage().get_changes(
+                    since=since, limit=100)]
+
+    def test_writes_append_changes_in_order(self):
+        user = UserFactory()
+        storage = FieldStorage()
+        template = TemplateStorage().create_template(CreateTemplateDTO(
+            name="Bugs", description="", is_default=False,
+            created_by=str(user.user_id)))
+        field = storage.create_field(CreateFieldDTO(
+            field_type=FieldTypeEnum.Text, field_name="Title",
+            description="", template_id=template.template_id, order=1000,
+            config={}, is_required=False, created_by=str(user.user_id)))
+
+        storage.patch_field(field_id=field.field_id,
+                            template_id=template.template_id, version=1,
+                            changes={"description": "Short summary"})
+        storage.update_field_orders(template_id=template.template_id,
+                                    field_orders={field.field_id: 2000})
+
+        assert self._get_changes() == [
+            (ChangeEntityEnum.Template, template.template_id,
+             ChangeOperationEnum.Created, None),
+            (ChangeEntityEnum.Field, field.field_id,
+             ChangeOperationEnum.Created, 1),
+            (ChangeEntityEnum.Field, field.field_id,
+             ChangeOperationEnum.Updated, 2),
+            (ChangeEntityEnum.Field, field.field_id,
+             ChangeOperationEnum.Updated, 3),
+        ]
+        [change] = ChangeFeedStorage().get_changes(
+            since=ChangeFeedStorage().get_changes(since=0, limit=3)[-1]
+            .sequence, limit=100)
+        assert (change.data["order"], change.data["description"]) == \
+            (2000, "Short summary")
+
+    def test_rejected_writes_append_nothing(self):
+        field = FieldFactory(order=1000)
+        storage = FieldStorage()
+
+        with pytest.raises(FieldNameAlreadyExistsException):
+            storage.create_field(CreateFieldDTO(
+                field_type=FieldTypeEnum.Text, field_name=field.field_name,
+                description="", template_id=str(field.template_id),
+                order=2000, config={}, is_required=False,
+                created_by=str(field.created_by_id)))
+        with pytest.raises(FieldVersionConflictException):
+            storage.update_field_config(
+                field_id=str(field.field_id),
+                template_id=str(field.template_id), config={}, version=2)
+
+        assert self._get_changes() == []
@@ -0,0 +1,219 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    FieldNameAlreadyExistsException, FieldOrderAlreadyExistsException, \
+    FieldNotFoundException, FieldVersionConflictException
+from task_management.interactors.dtos import CreateFieldDTO, FieldTypeEnum, \
+    UpdateFieldDTO
+from task_management.interactors.template_schema_cache import \
+    template_schema_cache
+from task_management.storages.field_storage import FieldStorage
+from task_management.tests.factories.model_factory import TemplateFactory, \
+    FieldFactory
+
+
+@pytest.mark.django_db
+class TestFieldStorage:
+
+    def _get_create_field_dto(self, template, **overrides):
+        data = dict(
+            field_type=FieldTypeEnum.Text,
+            field_name="Title",
+            description="",
+            template_id=str(template.template_id),
+            order=1,
+            config={"max_length": 255},
+            is_required=True,
+            created_by=str(template.created_by_id)
+        )
+        data.update(overrides)
+        return CreateFieldDTO(**data)
+
+    def test_bulk_create_fields(self):
+        template = TemplateFactory()
+        storage = FieldStorage()
+
+        result = storage.bulk_create_fields([
+            self._get_create_field_dto(template),
+            self._get_create_field_dto(template, field_name="Estimate",
+                                       field_type=FieldTypeEnum.Number,
+                                       order=2, config={})
+        ])
+
+        field_index = storage.get_template_field_index(
+            template_id=str(template.template_id))
+        assert field_index.field_ids == {field.field_id for field in result}
+        assert field_index.field_names == {
+            "Title": result[0].field_id, "Estimate": result[1].field_id}
+        assert field_index.field_orders == {
+            1: result[0].field_id, 2: result[1].field_id}
+
+    def test_create_field_duplicate_name_is_rejected_by_database(self):
+        field = FieldFactory(field_name="Title", order=1)
+
+        with pytest.raises(FieldNameAlreadyExistsException):
+            FieldStorage().create_field(
+                self._get_create_field_dto(field.template, order=2))
+
+    def test_create_field_duplicate_order_is_rejected_by_database(self):
+        field = FieldFactory(field_name="Title", order=1)
+
+        with pytest.raises(FieldOrderAlreadyExistsException):
+            FieldStorage().create_field(
+                self._get_create_field_dto(field.template,
+                                           field_name="Estimate"))
+
+    def test_update_field_duplicate_order_is_rejected_by_database(self):
+        field = FieldFactory(order=1)
+        other_field = FieldFactory(template=field.template, order=2)
+
+        with pytest.raises(FieldOrderAlreadyExistsException):
+            FieldStorage().update_field(UpdateFieldDTO(
+                field_id=str(other_field.field_id),
+                field_type=FieldTypeEnum.Text,
+                description="",
+                template_id=str(field.template_id),
+                field_name=other_field.field_name,
+                order=1,
+                config={},
+                is_required=False,
+                created_by=str(field.created_by_id),
+                version=other_field.version
+            ))
+
+    def test_update_missing_field(self):
+        template = TemplateFactory()
+
+        with pytest.raises(FieldNotFoundException):
+            FieldStorage().update_field(UpdateFieldDTO(
+                field_id="7c1f7f0c-1c3a-4a8c-9d1f-0b8e6f0f8a11",
+                field_type=FieldTypeEnum.Text,
+                description="",
+                template_id=str(template.template_id),
+                field_name="Title",
+                order=1,
+                config={},
+                is_required=False,
+                created_by=str(template.created_by_id),
+                version=1
+            ))
+
+    def _get_update_field_dto(self, field, **overrides):
+        data = dict(
+            field_id=str(field.field_id),
+            field_type=FieldTypeEnum.Text,
+            description="",
+            template_id=str(field.template_id),
+            field_name="Impact",
+            order=field.order,
+            config={},
+            is_required=False,
+            created_by=str(field.created_by_id),
+            version=field.version
+        )
+        data.update(overrides)
+        return UpdateFieldDTO(**data)
+
+    def test_ids_that_are_not_uuids_name_no_rows(self):
+        field = FieldFactory(order=1)
+        storage = FieldStorage()
+
+        assert storage.get_field(field_id="nope",
+                                 template_id=str(field.template_id)) is None
+        assert storage.get_template_field_index(
+            template_id="nope").field_ids == set()
+        assert storage.get_templates_fields(template_ids=["nope"]) == []
+        assert storage.get_field_by_idempotency_key(
+            created_by="nope", idempotency_key="key-1") is None
+        with pytest.raises(FieldNotFoundException):
+            storage.update_field(self._get_update_field_dto(
+                field, template_id="nope"))
+        with pytest.raises(FieldNotFoundException):
+            storage.patch_field(field_id="nope",
+                                template_id=str(field.template_id),
+                                version=1, changes={"description": "x"})
+
+    def test_update_field_increments_version(self):
+        field = FieldFactory(order=1)
+
+        updated_field = FieldStorage().update_field(
+            self._get_update_field_dto(field))
+
+        assert (updated_field.field_name, updated_field.version) == \
+            ("Impact", 2)
+
+    def test_update_field_with_stale_version_conflicts(self):
+        field = FieldFactory(order=1)
+        storage = FieldStorage()
+        storage.update_field(self._get_update_field_dto(field))
+
+        with pytest.raises(FieldVersionConflictException) as exc:
+            storage.update_field(self._get_update_field_dto(
+                field, field_name="Effort"))
+
+        assert exc.value.version == 1
+        field.refresh_from_db()
+        assert (field.field_name, field.version) == ("Impact", 2)
+
+    def test_patch_field_writes_only_changed_columns(self):
+        field = FieldFactory(order=1, description="Before")
+
+        patched_field = FieldStorage().patch_field(
+            field_id=str(field.field_id), template_id=str(field.template_id),
+            version=1, changes={"description": "After"})
+
+        assert (patched_field.field_name, patched_field.description,
+                patched_field.version) == (field.field_name, "After", 2)
+
+    def test_patch_field_duplicate_name_is_rejected_by_database(self):
+        field = FieldFactory(order=1)
+        other_field = FieldFactory(template=field.template, order=2)
+
+        with pytest.raises(FieldNameAlreadyExistsException):
+            FieldStorage().patch_field(
+                field_id=str(other_field.field_id),
+                template_id=str(field.template_id), version=1,
+                changes={"field_name": field.field_name})
+
+    def test_update_field_orders_swaps_without_conflicts(self):
+        field = FieldFactory(order=1000)
+        other_field = FieldFactory(template=field.template, order=2000)
+        storage = FieldStorage()
+
+        storage.update_field_orders(
+            template_id=str(field.template_id),
+            field_orders={str(field.field_id): 2000,
+                          str(other_field.field_id): 1000})
+
+        field_index = storage.get_template_field_index(
+            template_id=str(field.template_id))
+        assert field_index.field_orders == {
+            1000: str(other_field.field_id), 2000: str(field.field_id)}
+        field.refresh_from_db()
+        assert field.version == 2
+
+    def test_committed_writes_bump_template_schema_version(
+            self, django_capture_on_commit_callbacks):
+        field = FieldFactory(order=1000)
+        template_id = str(field.template_id)
+        version = template_schema_cache.get_version(template_id=template_id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            FieldStorage().create_field(
+                self._get_create_field_dto(field.template, order=2000))
+
+        assert template_schema_cache.get_version(
+            template_id=template_id) == version + 1
+
+    def test_get_templates_field_batch(self):
+        field = FieldFactory(order=1000)
+        other_field = FieldFactory(template=field.template, order=2000)
+        FieldFactory()
+
+        batch = FieldStorage().get_templates_field_batch(
+            template_ids=[str(field.template_id)])
+
+        assert batch.field_ids == [str(field.field_id),
+                                   str(other_field.field_id)]
+        assert list(batch) == FieldStorage().get_templates_fields(
+            template_ids=[str(field.template_id)])
@@ -0,0 +1,165 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    FieldNameAlreadyExistsException, FieldOrderAlreadyExistsException, \
+    AlreadyExistedTemplateNameException, DefaultTemplateAlreadyExistedException, \
+    FieldVersionConflictException
+from task_management.interactors.dtos import CreateTemplateDTO, \
+    CreateFieldDTO, UpdateFieldDTO, FieldTypeEnum, UserDTO, PermissionsEnum
+from task_management.interactors.field_interactors.create_field_interactor import \
+    CreateFieldInteractor
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.interactors.template_schema_cache import \
+    template_schema_cache
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage
+
+
+class TestInMemoryStorages:
+
+    @pytest.fixture
+    def database(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        return database
+
+    @pytest.fixture
+    def template(self, database):
+        return InMemoryTemplateStorage(database).create_template(
+            CreateTemplateDTO(name="Bugs", description="", is_default=True,
+                              created_by="user_1"))
+
+    @staticmethod
+    def _get_create_field_dto(template_id: str, field_name="Severity",
+                              order=1000) -> CreateFieldDTO:
+        return CreateFieldDTO(field_type=FieldTypeEnum.Text,
+                              field_name=field_name, description="",
+                              template_id=template_id, order=order, config={},
+                              is_required=False, created_by="user_1")
+
+    def test_checks_use_indexes(self, database, template):
+        template_storage = InMemoryTemplateStorage(database)
+        field_storage = InMemoryFieldStorage(database)
+        field = field_storage.create_field(
+            self._get_create_field_dto(template.template_id))
+
+        field_index = field_storage.get_template_field_index(
+            template_id=template.template_id)
+
+        assert template_storage.check_template_name_exist("Bugs")
+        assert template_storage.check_default_template_exist()
+        assert field_index.field_names == {"Severity": field.field_id}
+        assert field_index.field_orders == {1000: field.field_id}
+        assert InMemoryPermissionStorage(database).get_user_access_permissions(
+            user_id="user_1")["List"] == PermissionsEnum.MEMBER
+
+    @pytest.mark.parametrize("field_name, order, exception", [
+        ("Severity", 2000, FieldNameAlreadyExistsException),
+        ("Other", 1000, FieldOrderAlreadyExistsException),
+    ])
+    def test_duplicate_field_is_rejected(self, database, template, field_name,
+                                         order, exception):
+        field_storage = InMemoryFieldStorage(database)
+        field_storage.create_field(
+            self._get_create_field_dto(template.template_id))
+
+        with pytest.raises(exception):
+            field_storage.bulk_create_fields([
+                self._get_create_field_dto(template.template_id, "New", 3000),
+                self._get_create_field_dto(template.template_id, field_name,
+                                           order)])
+
+        assert "New" not in field_storage.get_template_field_index(
+            template_id=template.template_id).field_names
+
+    def test_duplicate_templates_are_rejected(self, database, template):
+        template_storage = InMemoryTemplateStorage(database)
+
+        with pytest.raises(AlreadyExistedTemplateNameException):
+            template_storage.create_template(CreateTemplateDTO(
+                name="Bugs", description="", is_default=False,
+                created_by="user_1"))
+        with pytest.raises(DefaultTemplateAlreadyExistedException):
+            template_storage.create_template(CreateTemplateDTO(
+                name="Tasks", description="", is_default=True,
+                created_by="user_1"))
+
+    def test_update_field_moves_its_index_entries(self, database, template):
+        field_storage = InMemoryFieldStorage(database)
+        field = field_storage.create_field(
+            self._get_create_field_dto(template.template_id))
+
+        field_storage.update_field(UpdateFieldDTO(
+            field_id=field.field_id, field_type=FieldTypeEnum.Text,
+            description="", template_id=template.template_id,
+            field_name="Impact", order=2000, config={}, is_required=False,
+            created_by="user_1", version=field.version))
+        field_storage.create_field(
+            self._get_create_field_dto(template.template_id))
+
+        assert set(field_storage.get_template_field_index(
+            template_id=template.template_id).field_names) == \
+            {"Impact", "Severity"}
+
+    def test_update_field_with_stale_version_conflicts(self, database,
+                                                       template):
+        field_storage = InMemoryFieldStorage(database)
+        field = field_storage.create_field(
+            self._get_create_field_dto(template.template_id))
+        update_field_data = UpdateFieldDTO(
+            field_id=field.field_id, field_type=FieldTypeEnum.Text,
+            description="", template_id=template.template_id,
+            field_name="Impact", order=2000, config={}, is_required=False,
+            created_by="user_1", version=field.version)
+
+        assert field_storage.update_field(update_field_data).version == 2
+        with pytest.raises(FieldVersionConflictException):
+            field_storage.update_field(update_field_data)
+
+    def test_atomic_transaction_rolls_back_and_drops_invalidations(
+            self, database):
+        template_storage = InMemoryTemplateStorage(database)
+        versions = dict(template_schema_cache._versions)
+
+        with pytest.raises(FieldNameAlreadyExistsException):
+            with template_storage.atomic_transaction():
+                assert template_storage.is_in_transaction()
+                template = template_storage.create_template(CreateTemplateDTO(
+                    name="Bugs", description="", is_default=False,
+                    created_by="user_1"))
+                raise FieldNameAlreadyExistsException(field_name="Title")
+
+        assert not template_storage.check_template_name_exist("Bugs")
+        assert not template_storage.check_template_exist(template.template_id)
+        assert not template_storage.is_in_transaction()
+        assert template_schema_cache._versions == versions
+
+    def test_interactors_run_against_in_memory_storages(self, database):
+        user_storage = InMemoryUserStorage(database)
+        permission_storage = InMemoryPermissionStorage(database)
+        template_storage = InMemoryTemplateStorage(database)
+        field_storage = InMemoryFieldStorage(database)
+
+        template = CreateTemplateInteractor(
+            user_storage=user_storage, field_storage=field_storage,
+            permission_storage=permission_storage,
+            template_storage=template_storage
+        ).create_template(CreateTemplateDTO(
+            name="Bugs", description="", is_default=False,
+            created_by="user_1"))
+        field = CreateFieldInteractor(
+            field_storage=field_storage, user_storage=user_storage,
+            template_storage=template_storage,
+            permission_storage=permission_storage
+        ).create_field(self._get_create_field_dto(template.template_id,
+                                                  order=None))
+
+        assert field.order == 6000
+        assert [field.field_name for field in
+                field_storage.get_templates_fields([template.template_id])] \
+            == ["Title", "Assignee", "Due Date", "Priority", "Status",
+                "Severity"]
@@ -0,0 +1,122 @@
+import re
+
+import pytest
+from django.db import connection
+
+from task_management.models import Template
+from task_management.storages.field_storage import FieldStorage
+from task_management.storages.search_storage import SearchStorage, \
+    SEARCH_TRIGGER_NAMES, create_search_triggers
+from task_management.tests.factories.model_factory import TemplateFactory, \
+    FieldFactory
+
+
+@pytest.mark.django_db
+class TestSearchStorage:
+
+    def _search(self, *terms: str) -> list[tuple]:
+        return [(result.template_id, result.field_id, result.name)
+                for result in SearchStorage().search(terms=list(terms),
+                                                     limit=10)]
+
+    def test_ranks_name_matches_above_description_matches(self):
+        template = TemplateFactory(name="Sprint planning",
+                                   description="Bug triage board")
+        field = FieldFactory(template=template, field_name="Bug severity",
+                             description="")
+
+        assert self._search("bug") == [
+            (str(template.template_id), str(field.field_id), "Bug severity"),
+            (str(template.template_id), None, "Sprint planning"),
+        ]
+        assert self._search("bu", "tri") == \
+            [(str(template.template_id), None, "Sprint planning")]
+
+    def test_index_follows_updates_and_deletes(self):
+        field = FieldFactory(field_name="Estimate", description="", order=1)
+
+        FieldStorage().patch_field(
+            field_id=str(field.field_id), template_id=str(field.template_id),
+            version=1, changes={"field_name": "Story points"})
+        FieldStorage().update_field_orders(
+            template_id=str(field.template_id),
+            field_orders={str(field.field_id): 2})
+
+        assert self._search("estimate") == []
+        assert [name for _, _, name in self._search("story")] == \
+            ["Story points"]
+
+        Template.objects.filter(template_id=field.template_id).delete()
+
+        assert self._search("story") == []
+
+    def test_terms_are_not_read_as_query_syntax(self):
+        TemplateFactory(name='Say "NEAR" or AND', description="")
+
+        assert [name for _, _, name in self._search('"near"', "AND")] == \
+            ['Say "NEAR" or AND']
+        assert self._search("NOT") == []
+
+    def _get_trigger_names(self) -> set[str]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            return {name for name, in cursor.fetchall()}
+
+    def test_index_triggers_exist(self):
+        assert set(SEARCH_TRIGGER_NAMES) <= self._get_trigger_names()
+
+    def test_dropped_triggers_are_recreated(self):
+        with connection.cursor() as cursor:
+            for name in SEARCH_TRIGGER_NAMES:
+                cursor.execute(f"DROP TRIGGER {name}")
+
+        create_search_triggers()
+
+        assert set(SEARCH_TRIGGER_NAMES) <= self._get_trigger_names()
+
+    def test_index_follows_rows_whose_rowid_changed(self):
+        # Table rebuilds renumber rowids.
+        field = FieldFactory(field_name="Estimate", description="")
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE task_management_template "
+                           "SET rowid = rowid + 1000")
+            cursor.execute("UPDATE task_management_field "
+                           "SET rowid = rowid + 1000")
+
+        Template.objects.filter(template_id=field.template_id).update(
+            name="Roadmap")
+        FieldStorage().patch_field(
+            field_id=str(field.field_id), template_id=str(field.template_id),
+            version=1, changes={"field_name": "Story points"})
+
+        assert [name for _, _, name in self._search("roadmap")] == \
+            ["Roadmap"]
+        assert self._search("estimate") == []
+        assert [name for _, _, name in self._search("story")] == \
+            ["Story points"]
+
+    def test_trigger_updates_and_deletes_look_index_rows_up_by_rowid(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND "
+                "name LIKE 'task_management_%_search_%'")
+            trigger_sqls = [sql for sql, in cursor.fetchall()]
+            statements = [
+                re.sub(r"\b(new|old)\.\w+", "'0'", statement)
+                for sql in trigger_sqls
+                for statement in sql.split(" BEGIN", 1)[1]
+                .rsplit("END", 1)[0].split(";")
+                if re.match(r"\s*(UPDATE|DELETE FROM) \w+_search\b",
+                            statement)]
+            plans = []
+            for statement in statements:
+                cursor.execute(f"EXPLAIN QUERY PLAN {statement}")
+                plans.append([row[-1] for row in cursor.fetchall()])
+
+        assert len(statements) == 4
+        for plan in plans:
+            assert any(step.endswith("VIRTUAL TABLE INDEX 0:=")
+                       for step in plan), plan
+            assert not any(step.startswith("SCAN task_management_search_rowid")
+                           for step in plan), plan
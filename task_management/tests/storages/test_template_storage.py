@@ -0,0 +1,118 @@
+import pytest
+
+from task_management.exceptions.custom_exceptions import \
+    AlreadyExistedTemplateNameException, \
+    DefaultTemplateAlreadyExistedException, DuplicateIdempotencyKeyException
+from task_management.interactors.dtos import CreateTemplateDTO, PermissionsEnum
+from task_management.storages.permission_storage import PermissionStorage
+from task_management.storages.template_storage import TemplateStorage
+from task_management.storages.user_storage import UserStorage
+from task_management.tests.factories.model_factory import TemplateFactory, \
+    UserFactory, UserPermissionFactory
+
+
+@pytest.mark.django_db
+class TestTemplateStorage:
+
+    def test_create_template(self):
+        user = UserFactory()
+
+        result = TemplateStorage().create_template(CreateTemplateDTO(
+            name="Bugs", description="", is_default=False,
+            created_by=str(user.user_id)))
+
+        assert result.name == "Bugs"
+        assert TemplateStorage().check_template_exist(
+            template_id=result.template_id)
+
+    def test_create_template_duplicate_name_is_rejected_by_database(self):
+        template = TemplateFactory(name="Bugs")
+
+        with pytest.raises(AlreadyExistedTemplateNameException):
+            TemplateStorage().create_template(CreateTemplateDTO(
+                name="Bugs", description="", is_default=False,
+                created_by=str(template.created_by_id)))
+
+    def test_create_second_default_template_is_rejected_by_database(self):
+        template = TemplateFactory(is_default=True)
+
+        with pytest.raises(DefaultTemplateAlreadyExistedException):
+            TemplateStorage().create_template(CreateTemplateDTO(
+                name="Another default", description="", is_default=True,
+                created_by=str(template.created_by_id)))
+
+    def test_user_permissions_default_to_guest(self):
+        permission = UserPermissionFactory(scope="List", permission="member")
+
+        result = PermissionStorage().get_user_access_permissions(
+            user_id=str(permission.user_id))
+
+        assert result["List"] == PermissionsEnum.MEMBER
+        assert result["Space"] == PermissionsEnum.GUEST
+
+    def test_user_permissions_accept_any_uuid_spelling(self):
+        permission = UserPermissionFactory(scope="List", permission="member")
+        user_ids = [str(permission.user_id).upper(), permission.user_id.hex,
+                    str(permission.user_id)]
+
+        result = PermissionStorage().get_users_access_permissions(
+            user_ids=user_ids)
+
+        assert {user_id: permissions["List"]
+                for user_id, permissions in result.items()} == \
+            dict.fromkeys(user_ids, PermissionsEnum.MEMBER)
+
+    def test_bulk_create_templates(self):
+        user = UserFactory()
+
+        result = TemplateStorage().bulk_create_templates([
+            CreateTemplateDTO(name=name, description="", is_default=False,
+                              created_by=str(user.user_id))
+            for name in ["Bugs", "Tasks"]])
+
+        assert TemplateStorage().get_existing_template_names(
+            ["Bugs", "Tasks", "Epics"]) == {"Bugs", "Tasks"}
+        assert {template.template_id for template in result} == {
+            template.template_id for template in TemplateStorage()
+            .get_templates([template.template_id for template in result])}
+
+    def test_iter_template_chunks_reads_templates_in_name_order(
+            self, django_assert_num_queries):
+        TemplateFactory.create_batch(3)
+
+        with django_assert_num_queries(1):
+            chunks = list(TemplateStorage().iter_template_chunks(
+                chunk_size=2))
+
+        names = [template.name for chunk in chunks for template in chunk]
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert names == sorted(names)
+
+    def test_duplicate_idempotency_key_is_rejected_by_database(self):
+        user = UserFactory()
+        TemplateStorage().create_template(CreateTemplateDTO(
+            name="Bugs", description="", is_default=False,
+            created_by=str(user.user_id), idempotency_key="key-1"))
+
+        with pytest.raises(DuplicateIdempotencyKeyException):
+            TemplateStorage().create_template(CreateTemplateDTO(
+                name="Tasks", description="", is_default=False,
+                created_by=str(user.user_id), idempotency_key="key-1"))
+
+        assert TemplateStorage().get_template_by_idempotency_key(
+            created_by=str(user.user_id), idempotency_key="key-1").name == "Bugs"
+
+    def test_ids_that_are_not_uuids_name_no_rows(self):
+        template = TemplateFactory()
+
+        assert UserStorage().check_user_exist(user_id="nope") is False
+        assert [user.user_id for user in UserStorage().get_users(
+            user_ids=["nope", str(template.created_by_id)])] == \
+            [str(template.created_by_id)]
+        assert TemplateStorage().check_template_exist(
+            template_id="nope") is False
+        assert TemplateStorage().get_templates(template_ids=["nope"]) == []
+        assert TemplateStorage().get_template_by_idempotency_key(
+            created_by="nope", idempotency_key="key-1") is None
+        assert PermissionStorage().get_user_access_permissions(
+            user_id="nope")["List"] == PermissionsEnum.GUEST
@@ -0,0 +1,43 @@
+import pytest
+from structlog.testing import capture_logs
+
+from benchmarks.backends import build_memory_storages
+from benchmarks.harness import run_operations
+from benchmarks.scenarios import SCENARIOS, Scenario
+from task_management.storages.storage_tracer import StorageTracer
+
+
+class TestBenchmarks:
+
+    @pytest.mark.parametrize("scenario_name, storage_calls_per_op", [
+        ("create_template", 6),
+        ("create_field", 5),
+        ("update_field", 4),
+    ])
+    def test_memory_scenario(self, scenario_name, storage_calls_per_op):
+        tracer = StorageTracer(log_level=None)
+        scenario = Scenario(storages=build_memory_storages(), tracer=tracer)
+
+        result = run_operations(
+            backend="memory", scenario=scenario_name,
+            operations=SCENARIOS[scenario_name](scenario=scenario,
+                                                operations=10),
+            tracer=tracer)
+
+        assert result.operations == 10
+        assert result.storage_calls_per_op == storage_calls_per_op
+        assert set(result.latency_ms) == {"p50", "p95", "p99", "mean"}
+
+    def test_benchmark_tracer_does_not_log(self):
+        tracer = StorageTracer(log_level=None)
+        scenario = Scenario(storages=build_memory_storages(), tracer=tracer)
+
+        with capture_logs() as logs:
+            result = run_operations(
+                backend="memory", scenario="create_field",
+                operations=SCENARIOS["create_field"](scenario=scenario,
+                                                     operations=2),
+                tracer=tracer)
+
+        assert logs == []
+        assert result.storage_calls["field.create_field"] == 1
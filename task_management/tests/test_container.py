@@ -0,0 +1,91 @@
+import pytest
+
+from task_management.container import Container, container
+from task_management.interactors.dtos import CreateTemplateDTO, UserDTO, \
+    PermissionsEnum
+from task_management.interactors.template_interactors.create_template_interactor import \
+    CreateTemplateInteractor
+from task_management.interactors.template_interactors.export_templates_interactor import \
+    ExportTemplatesInteractor
+from task_management.storages.in_memory_storages import InMemoryDatabase, \
+    InMemoryUserStorage, InMemoryPermissionStorage, InMemoryTemplateStorage, \
+    InMemoryFieldStorage, InMemoryChangeFeedStorage, InMemorySearchStorage
+from task_management.storages.storage_tracer import StorageTracer
+from task_management.storages.template_storage import TemplateStorage
+
+
+def get_in_memory_storage_factories(database: InMemoryDatabase,
+                                    wrap=lambda storage: storage) -> dict:
+    return {
+        "user_storage": lambda: wrap(InMemoryUserStorage(database)),
+        "permission_storage": lambda: wrap(
+            InMemoryPermissionStorage(database)),
+        "template_storage": lambda: wrap(InMemoryTemplateStorage(database)),
+        "field_storage": lambda: wrap(InMemoryFieldStorage(database)),
+        "change_feed_storage": lambda: wrap(
+            InMemoryChangeFeedStorage(database)),
+        "search_storage": lambda: wrap(InMemorySearchStorage(database)),
+    }
+
+
+class TestContainer:
+
+    @pytest.fixture
+    def database(self):
+        database = InMemoryDatabase()
+        database.add_user(UserDTO(user_id="user_1", full_name="User",
+                                  email="user@example.com"),
+                          permissions={"List": PermissionsEnum.MEMBER})
+        return database
+
+    def test_storages_and_interactors_are_built_once(self, database):
+        built = []
+
+        def build_template_storage():
+            built.append("template_storage")
+            return InMemoryTemplateStorage(database)
+
+        factories = get_in_memory_storage_factories(database)
+        factories["template_storage"] = build_template_storage
+        test_container = Container(storage_factories=factories)
+
+        interactor = test_container.get_interactor(ExportTemplatesInteractor)
+
+        assert test_container.get_interactor(ExportTemplatesInteractor) is \
+            interactor
+        assert interactor.template_storage is \
+            test_container.get_storage("template_storage")
+        assert built == ["template_storage"]
+
+    def test_default_graph_uses_django_storages(self):
+        assert isinstance(container.get_storage("template_storage"),
+                          TemplateStorage)
+
+    def test_override_swaps_the_whole_graph(self, database):
+        interactor = container.get_interactor(ExportTemplatesInteractor)
+
+        with container.override(get_in_memory_storage_factories(database)):
+            assert isinstance(
+                container.get_interactor(ExportTemplatesInteractor)
+                .template_storage, InMemoryTemplateStorage)
+
+        assert container.get_interactor(ExportTemplatesInteractor) is \
+            interactor
+
+    def test_request_scope_caches_user_lookups(self, database):
+        tracer = StorageTracer()
+        test_container = Container(
+            storage_factories=get_in_memory_storage_factories(
+                database, wrap=tracer.wrap))
+
+        with test_container.request_scope() as scope, tracer.track() as track:
+            interactor = scope.get_interactor(CreateTemplateInteractor)
+            assert scope.get_interactor(CreateTemplateInteractor) is \
+                interactor
+            for name in ("Bugs", "Tasks"):
+                interactor.create_template(CreateTemplateDTO(
+                    name=name, description="", is_default=False,
+                    created_by="user_1"))
+
+        assert [call.method for call in track.get_calls()].count(
+            "check_user_exist") == 1
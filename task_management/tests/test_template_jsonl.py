@@ -0,0 +1,150 @@
+import io
+import json
+
+import pytest
+from django.core.management import call_command, CommandError
+
+from task_management.container import container
+from task_management.interactors.template_interactors.export_templates_interactor import \
+    ExportTemplatesInteractor
+from task_management.models import Template, Field
+from task_management.tests.factories.model_factory import \
+    UserPermissionFactory
+
+
+@pytest.mark.django_db
+class TestTemplateJsonLines:
+
+    @pytest.fixture
+    def user_id(self):
+        return str(UserPermissionFactory(scope="List",
+                                         permission="member").user_id)
+
+    def _get_lines(self, user_id: str) -> str:
+        return "".join(json.dumps({
+            "name": f"Template {position}", "created_by": user_id,
+            "fields": [{"field_type": "text", "field_name": "Title"}]
+        }) + "\n" for position in range(5))
+
+    def test_commands_round_trip(self, user_id, tmp_path):
+        source = tmp_path / "templates.jsonl"
+        source.write_text(self._get_lines(user_id=user_id))
+        stdout = io.StringIO()
+
+        call_command("import_templates", str(source), "--chunk-size", "2",
+                     stdout=stdout)
+        call_command("export_templates", str(tmp_path / "export.jsonl"))
+
+        assert "Imported 5 templates with 5 fields." in stdout.getvalue()
+        assert (tmp_path / "export.jsonl").read_text().count("\n") == 5
+        assert Field.objects.filter(order=1000).count() == 5
+
+    def test_export_reads_one_field_batch_per_chunk(
+            self, user_id, tmp_path, django_assert_num_queries):
+        source = tmp_path / "templates.jsonl"
+        source.write_text(self._get_lines(user_id=user_id))
+        call_command("import_templates", str(source), stdout=io.StringIO())
+        interactor = container.get_interactor(ExportTemplatesInteractor)
+
+        # One template query and a field query for each chunk of two.
+        with django_assert_num_queries(4):
+            lines = [json.loads(line) for line in
+                     interactor.export_templates(chunk_size=2)]
+
+        assert [line["name"] for line in lines] == \
+            [f"Template {position}" for position in range(5)]
+        assert all(line["fields"][0]["field_name"] == "Title"
+                   for line in lines)
+
+    def test_import_command_reports_line(self, user_id, tmp_path):
+        source = tmp_path / "templates.jsonl"
+        source.write_text(self._get_lines(user_id=user_id) + "{oops\n")
+
+        with pytest.raises(CommandError, match="Line 6: InvalidJSON"):
+            call_command("import_templates", str(source), "--chunk-size", "5")
+
+        assert Template.objects.count() == 5
+
+    def test_api_round_trip(self, user_id, client):
+        response = client.post("/templates/import/",
+                               data=self._get_lines(user_id=user_id),
+                               content_type="application/x-ndjson")
+        export = client.get("/templates/export/")
+
+        assert response.json() == {"templates_count": 5, "fields_count": 5}
+        assert b"".join(export.streaming_content).count(b"\n") == 5
+
+    def test_api_import_error(self, client):
+        response = client.post("/templates/import/", data='{"name": "x"}\n',
+                               content_type="application/x-ndjson")
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["line_number"] == 1
+
+    def test_api_import_collects_errors(self, user_id, client):
+        response = client.post(
+            "/templates/import/?collect_errors=true",
+            data='{"name": "x"}\n' + self._get_lines(user_id=user_id) +
+                 "{oops\n",
+            content_type="application/x-ndjson")
+
+        assert response.status_code == 400
+        assert [(error["line_number"], error["code"])
+                for error in response.json()["errors"]] == \
+            [(1, "InvalidTemplateLine"), (7, "InvalidJSON")]
+        assert response.json()["last_committed_line"] == 0
+        assert Template.objects.count() == 0
+
+    def test_api_import_reports_committed_prefix(self, user_id, client):
+        # Every line fits in one chunk, so the failing chunk is all of them.
+        response = client.post(
+            "/templates/import/?collect_errors=true",
+            data=self._get_lines(user_id=user_id) + "{oops\n",
+            content_type="application/x-ndjson")
+
+        assert response.status_code == 400
+        assert {key: value for key, value in response.json().items()
+                if key != "errors"} == {"templates_count": 0,
+                                        "fields_count": 0,
+                                        "last_committed_line": 0}
+        assert response.json()["errors"][0]["message"] == \
+            "Line 6: InvalidJSON"
+        assert Template.objects.count() == 0
+
+    def test_api_changes_feed(self, user_id, client):
+        client.post("/templates/import/",
+                    data=self._get_lines(user_id=user_id),
+                    content_type="application/x-ndjson")
+
+        first_page = client.get("/changes/", {"limit": 4}).json()
+        second_page = client.get("/changes/", {
+            "since": first_page["next_since"]}).json()
+
+        assert first_page["has_more"] is True
+        assert [change["entity"] for change in first_page["changes"]] == \
+            ["template"] * 4
+        assert len(second_page["changes"]) == 1 + 5
+        assert second_page["has_more"] is False
+        assert client.get("/changes/", {"since": "x"}).status_code == 400
+
+    def test_api_search(self, user_id, client):
+        client.post("/templates/import/",
+                    data=self._get_lines(user_id=user_id),
+                    content_type="application/x-ndjson")
+
+        response = client.get("/search/", {"q": "templ 3"}).json()
+
+        assert [result["name"] for result in response["results"]] == \
+            ["Template 3"]
+        assert client.get("/search/", {"q": "title", "limit": 2}).json()[
+            "results"][0]["field_id"] is not None
+
+    def test_api_import_unknown_user_id(self, client):
+        response = client.post(
+            "/templates/import/",
+            data='{"name": "Bugs", "created_by": "nope"}\n',
+            content_type="application/x-ndjson")
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["code"] == \
+            "UserNotFoundException"
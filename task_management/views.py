@@ -1,3 +1,98 @@
-from django.shortcuts import render
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
 
-# Create your views here.
+from task_management.container import container
+from task_management.exceptions.custom_exceptions import \
+    InvalidTemplateImportLineException, TemplateImportErrorsException
+from task_management.interactors.template_interactors.export_templates_interactor import \
+    ExportTemplatesInteractor
+from task_management.interactors.template_interactors.get_changes_interactor import \
+    GetChangesInteractor, DEFAULT_CHANGES_PAGE_SIZE
+from task_management.interactors.template_interactors.import_templates_interactor import \
+    ImportTemplatesInteractor
+from task_management.interactors.template_interactors.search_templates_interactor import \
+    SearchTemplatesInteractor, DEFAULT_SEARCH_LIMIT
+
+JSON_LINES_CONTENT_TYPE = "application/x-ndjson"
+
+
+@require_GET
+def export_templates_view(request):
+    interactor = container.get_interactor(ExportTemplatesInteractor)
+
+    return StreamingHttpResponse(interactor.export_templates(),
+                                 content_type=JSON_LINES_CONTENT_TYPE)
+
+
+@csrf_exempt
+@require_POST
+def import_templates_view(request):
+    interactor = container.get_interactor(ImportTemplatesInteractor)
+
+    try:
+        result = interactor.import_templates(
+            lines=request,
+            collect_errors=request.GET.get("collect_errors") == "true")
+    except TemplateImportErrorsException as exc:
+        return JsonResponse({
+            "errors": exc.errors,
+            "templates_count": exc.templates_count,
+            "fields_count": exc.fields_count,
+            "last_committed_line": exc.last_committed_line,
+        }, status=400)
+    except InvalidTemplateImportLineException as exc:
+        return JsonResponse({"errors": [{
+            "message": exc.message,
+            "line_number": exc.line_number,
+            "code": exc.code,
+            "details": exc.details,
+        }]}, status=400)
+
+    return JsonResponse({"templates_count": result.templates_count,
+                         "fields_count": result.fields_count})
+
+
+@require_GET
+def changes_view(request):
+    try:
+        since = int(request.GET.get("since", 0))
+        limit = int(request.GET.get("limit", DEFAULT_CHANGES_PAGE_SIZE))
+    except ValueError:
+        return JsonResponse({"errors": [{
+            "message": "since and limit must be integers"}]}, status=400)
+
+    page = container.get_interactor(GetChangesInteractor).get_changes(
+        since=since, limit=limit)
+
+    return JsonResponse({
+        "changes": [{
+            "sequence": change.sequence,
+            "entity": change.entity.value,
+            "entity_id": change.entity_id,
+            "template_id": change.template_id,
+            "operation": change.operation.value,
+            "data": change.data,
+        } for change in page.changes],
+        "next_since": page.next_since,
+        "has_more": page.has_more,
+    })
+
+
+@require_GET
+def search_view(request):
+    try:
+        limit = int(request.GET.get("limit", DEFAULT_SEARCH_LIMIT))
+    except ValueError:
+        return JsonResponse({"errors": [{
+            "message": "limit must be an integer"}]}, status=400)
+
+    results = container.get_interactor(SearchTemplatesInteractor).search(
+        query=request.GET.get("q", ""), limit=limit)
+
+    return JsonResponse({"results": [{
+        "template_id": result.template_id,
+        "field_id": result.field_id,
+        "name": result.name,
+        "rank": result.rank,
+    } for result in results]})